@@ -28,79 +28,353 @@ In this module a AFW is defined as follows
         **value** [string representing a PYTHON boolean expression
                    over states; where we also allow the formulas
                    *True* and *False*]
+
+Transition strings are parsed by :mod:`PySimpleAutomata.AFW.compile_formula`
+into cached :class:`Formula` objects, never evaluated as Python code.
 """
 
 from PySimpleAutomata import NFA
+from PySimpleAutomata import adjacency
+from PySimpleAutomata import search
+import functools
 import itertools
 import re
-from copy import deepcopy
+import weakref
+
+
+class Formula:
+    """ Positive Boolean formula over states, as obtained from
+    :mod:`PySimpleAutomata.AFW.compile_formula`.
 
+    Formulas are hash-consed: structurally equal formulas are the same
+    object, so they can be compared with ``is`` and used as dict keys
+    at constant cost. Nested conjunctions (disjunctions) are
+    flattened, duplicated operands removed and the constants
+    *True*/*False* simplified away.
 
-def __recursive_acceptance(afw, state, remaining_word):
-    """ Recursive call for word acceptance.
+    Attributes:
+
+      • operator  => one of 'true', 'false', 'var', 'and', 'or';
+      • operands  => tuple() of Formula, for 'and'/'or';
+      • name      => state name, for 'var';
+      • variables => frozenset() of the states occurring in it.
+    """
 
-        :param dict afw: input AFW;
-        :param str state: current state;
-        :param list remaining_word: list containing the remaining
-        words.
-        :return: *(bool)*, True if the word is accepted, false
-        otherwise.
+    __slots__ = ('operator', 'operands', 'name', 'variables', '_dual',
+                 '_models', '__weakref__')
+
+    # hash-consing table
+    _table = weakref.WeakValueDictionary()
+
+    TRUE = None
+    FALSE = None
+
+    def __init__(self, operator: str, operands: tuple = (), name=None):
+        self.operator = operator
+        self.operands = operands
+        self.name = name
+        if operator == 'var':
+            self.variables = frozenset((name,))
+        else:
+            self.variables = frozenset().union(
+                *(operand.variables for operand in operands))
+        self._dual = None
+        self._models = None
+
+    @staticmethod
+    def _unique(operator: str, operands: tuple = (), name=None):
+        key = (operator, operands, name)
+        formula = Formula._table.get(key)
+        if formula is None:
+            formula = Formula(operator, operands, name)
+            Formula._table[key] = formula
+        return formula
+
+    @staticmethod
+    def variable(name):
+        """ Returns the formula made of the single state **name**. """
+        return Formula._unique('var', name=name)
+
+    @staticmethod
+    def conjunction(operands):
+        """ Returns the conjunction of the formulas in **operands**
+        (True if empty). """
+        return Formula._junction('and', operands, Formula.TRUE,
+                                 Formula.FALSE)
+
+    @staticmethod
+    def disjunction(operands):
+        """ Returns the disjunction of the formulas in **operands**
+        (False if empty). """
+        return Formula._junction('or', operands, Formula.FALSE,
+                                 Formula.TRUE)
+
+    @staticmethod
+    def _junction(operator: str, operands, neutral, absorbing):
+        flat = list()
+        seen = set()
+        for operand in operands:
+            if operand is absorbing:
+                return absorbing
+            if operand is neutral:
+                continue
+            if operand.operator == operator:
+                nested = operand.operands
+            else:
+                nested = (operand,)
+            for element in nested:
+                if element not in seen:
+                    seen.add(element)
+                    flat.append(element)
+        if not flat:
+            return neutral
+        if len(flat) == 1:
+            return flat[0]
+        return Formula._unique(operator, tuple(flat))
+
+    def evaluate(self, true_states) -> bool:
+        """ Evaluates the formula assigning True exactly to the
+        states in **true_states**.
+
+        :param set true_states: states assigned to True.
+        :return: *(bool)*, value of the formula.
         """
-    # the word is accepted only if all the final states are
-    # accepting states
-    if len(remaining_word) == 0:
-        if state in afw['accepting_states']:
+        operator = self.operator
+        if operator == 'var':
+            return self.name in true_states
+        if operator == 'and':
+            for operand in self.operands:
+                if not operand.evaluate(true_states):
+                    return False
             return True
-        else:
+        if operator == 'or':
+            for operand in self.operands:
+                if operand.evaluate(true_states):
+                    return True
             return False
+        return operator == 'true'
+
+    def dual(self):
+        """ Returns the dual formula, obtained switching and/or and
+        True/False. """
+        if self._dual is None:
+            operator = self.operator
+            if operator == 'var':
+                dual = self
+            elif operator == 'true':
+                dual = Formula.FALSE
+            elif operator == 'false':
+                dual = Formula.TRUE
+            elif operator == 'and':
+                dual = Formula.disjunction(
+                    operand.dual() for operand in self.operands)
+            else:
+                dual = Formula.conjunction(
+                    operand.dual() for operand in self.operands)
+            self._dual = dual
+        return self._dual
+
+    def minimal_models(self) -> frozenset:
+        """ Returns the minimal sets of states satisfying the formula.
 
-    action = remaining_word[0]
-    if (state, action) not in afw['transitions']:
-        return False
-
-    if afw['transitions'][state, action] == 'True':
-        return True
-    elif afw['transitions'][state, action] == 'False':
-        return False
-
-    transition = (state, action)
-    # extract from the boolean formula of the transition the
-    # states involved in it
-    involved_states = list(
-        set(
-            re.findall(r"[\w']+", afw['transitions'][transition])
-        ).difference({'and', 'or', 'True', 'False'})
-    )
-    possible_assignments = set(
-        itertools.product([True, False], repeat=len(involved_states)))
-    # For all possible assignment of the the transition (a
-    # boolean formula over the states)
-    for assignment in possible_assignments:
-        mapping = dict(zip(involved_states, assignment))
-        # If the assignment evaluation is positive
-        if eval(afw['transitions'][transition], mapping):
-            ok = True
-            mapping.pop('__builtins__')  # removes useless entry
-            # added by the function eval()
-
-            # Check if the word is accepted in ALL the states
-            # mapped to True by the assignment
-            for mapped_state in mapping:
-                if mapping[mapped_state] == False:
-                    continue
-                if not __recursive_acceptance(afw,
-                                              mapped_state,
-                                              remaining_word[1:]):
-                    # if one positive state of the assignment
-                    # doesn't accepts the word,the whole
-                    # assignment is discarded
-                    ok = False
-                    break
-            if ok:
-                # If at least one assignment accepts the word,
-                # the word is accepted by the afw
-                return True
-    return False
+        A set of states Q satisfies a positive formula iff Q contains
+        one of its minimal models. They are computed as a DNF
+        expansion where subsumed conjuncts are pruned at each step.
+
+        :return: *(frozenset)* of frozensets of states.
+        """
+        if self._models is None:
+            operator = self.operator
+            if operator == 'var':
+                models = {frozenset((self.name,))}
+            elif operator == 'true':
+                models = {frozenset()}
+            elif operator == 'false':
+                models = set()
+            elif operator == 'or':
+                models = set()
+                for operand in self.operands:
+                    models.update(operand.minimal_models())
+            else:
+                models = {frozenset()}
+                for operand in self.operands:
+                    models = {model.union(operand_model)
+                              for model in models
+                              for operand_model in operand.minimal_models()}
+                    models = Formula._minimize(models)
+            self._models = frozenset(Formula._minimize(models))
+        return self._models
+
+    @staticmethod
+    def _minimize(models: set) -> set:
+        minimal = list()
+        for model in sorted(models, key=len):
+            if not any(smaller <= model for smaller in minimal):
+                minimal.append(model)
+        return set(minimal)
+
+    def rename(self, mapping: dict):
+        """ Returns the formula with the states renamed according
+        to **mapping** (states not in it are left untouched).
+
+        :param dict mapping: old state name -> new state name.
+        """
+        operator = self.operator
+        if operator == 'var':
+            return Formula.variable(mapping.get(self.name, self.name))
+        if operator == 'and':
+            return Formula.conjunction(
+                operand.rename(mapping) for operand in self.operands)
+        if operator == 'or':
+            return Formula.disjunction(
+                operand.rename(mapping) for operand in self.operands)
+        return self
+
+    def __str__(self):
+        operator = self.operator
+        if operator == 'var':
+            return str(self.name)
+        if operator == 'true':
+            return 'True'
+        if operator == 'false':
+            return 'False'
+        operands = list()
+        for operand in self.operands:
+            if operand.operator in ('and', 'or'):
+                operands.append('(' + str(operand) + ')')
+            else:
+                operands.append(str(operand))
+        return (' ' + operator + ' ').join(operands)
+
+    def __repr__(self):
+        return 'Formula(' + repr(str(self)) + ')'
+
+
+Formula.TRUE = Formula('true')
+Formula.FALSE = Formula('false')
+
+__TOKEN = re.compile(r"\s*(?:(\()|(\))|([\w']+))")
+
+
+@functools.lru_cache(maxsize=65536)
+def __parse_formula(formula: str) -> Formula:
+    """ Parses a transition string into a :class:`Formula`.
+
+    Grammar, with the precedence of Python boolean operators:
+
+        disjunction := conjunction ('or' conjunction)*
+        conjunction := atom ('and' atom)*
+        atom        := '(' disjunction ')' | 'True' | 'False' | state
+
+    :param str formula: transition string.
+    :return: *(Formula)* parsed formula.
+    """
+    tokens = list()
+    position = 0
+    formula = formula.rstrip()
+    while position < len(formula):
+        match = __TOKEN.match(formula, position)
+        if match is None:
+            raise ValueError('invalid formula: ' + repr(formula))
+        tokens.append(match.group(match.lastindex))
+        position = match.end()
+    if 'not' in tokens:
+        raise ValueError('negation not allowed in formula: ' + repr(formula))
+
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def disjunction():
+        nonlocal position
+        operands = [conjunction()]
+        while peek() == 'or':
+            position += 1
+            operands.append(conjunction())
+        return Formula.disjunction(operands)
+
+    def conjunction():
+        nonlocal position
+        operands = [atom()]
+        while peek() == 'and':
+            position += 1
+            operands.append(atom())
+        return Formula.conjunction(operands)
+
+    def atom():
+        nonlocal position
+        token = peek()
+        position += 1
+        if token == '(':
+            result = disjunction()
+            if peek() != ')':
+                raise ValueError('unbalanced parenthesis in formula: ' +
+                                 repr(formula))
+            position += 1
+            return result
+        if token == 'True':
+            return Formula.TRUE
+        if token == 'False':
+            return Formula.FALSE
+        if token is None or token in (')', 'and', 'or'):
+            raise ValueError('invalid formula: ' + repr(formula))
+        return Formula.variable(token)
+
+    result = disjunction()
+    if position != len(tokens):
+        raise ValueError('invalid formula: ' + repr(formula))
+    return result
+
+
+def compile_formula(formula) -> Formula:
+    """ Returns the :class:`Formula` corresponding to a transition
+    string of an AFW.
+
+    Strings are parsed just once and then cached, so it is cheap to
+    call it every time a transition is needed; no ``eval`` is
+    involved, so also untrusted inputs are safe.
+    Already compiled formulas are returned as they are.
+
+    :param formula: string representing a positive boolean formula
+           over states (or a :class:`Formula`).
+    :return: *(Formula)* compiled formula.
+    """
+    if isinstance(formula, Formula):
+        return formula
+    return __parse_formula(formula)
+
+
+def __suffix_acceptance(afw: dict, word: list) -> set:
+    """ Returns the set of states of the AFW accepting **word**.
+
+    The word is read backwards keeping, for each position i, the
+    set :math:`S_i` of states accepting the suffix starting at i:
+    :math:`S_{|w|} = F` and :math:`s ∈ S_i` iff :math:`ρ(s, w_i)` is
+    satisfied assigning True exactly to the states in
+    :math:`S_{i+1}`.
+    Formulas are positive, so this is the same as looking for an
+    assignment whose true states all accept the rest of the word,
+    but each formula is evaluated just once per position.
+
+    :param dict afw: input AFW;
+    :param list word: list of symbols ∈ afw['alphabet'].
+    :return: *(set)* of states accepting the word.
+    """
+    # transitions indexed by action
+    by_action = dict()
+    for (state, action), formula in afw['transitions'].items():
+        by_action.setdefault(action, list()).append(
+            (state, compile_formula(formula)))
+
+    accepting = set(afw['accepting_states'])
+    for action in reversed(word):
+        next_accepting = set()
+        for state, formula in by_action.get(action, ()):
+            if formula.evaluate(accepting):
+                next_accepting.add(state)
+        accepting = next_accepting
+    return accepting
 
 
 def afw_word_acceptance(afw: dict, word: list) -> bool:
@@ -113,21 +387,36 @@ def afw_word_acceptance(afw: dict, word: list) -> bool:
     input.
     A run is accepting if all the leaf nodes are accepting states.
 
+    The check does not enumerate runs: the word is read backwards
+    computing the set of states accepting each of its suffixes, in
+    :math:`O(|w| · |ρ|)` formula evaluations and without recursion.
+
     :param dict afw: input AFW;
     :param list word: list of symbols ∈ afw['alphabet'].
     :return: *(bool)*, True if the word is accepted, False otherwise.
     """
-    return __recursive_acceptance(afw, afw['initial_state'], word)
+    return afw['initial_state'] in __suffix_acceptance(afw, word)
 
 
 # Side effect on input afw
-def afw_completion(afw):
-    """ Side effect on input! Complete the afw adding not
-    present transitions and marking them as False.
+def afw_completion(afw, inplace: bool = True):
+    """ Side effect on input (unless **inplace** is False)! Complete
+    the afw adding not present transitions and marking them as False.
 
-    :param dict afw: input AFW.
+    :param dict afw: input AFW;
+    :param bool inplace: if False the input is left untouched and a
+           new AFW is returned (default: True).
     """
-
+    if not inplace:
+        afw = {
+            'alphabet': afw['alphabet'].copy(),
+            'states': afw['states'].copy(),
+            'initial_state': afw['initial_state'],
+            'accepting_states': afw['accepting_states'].copy(),
+            'transitions': afw['transitions'].copy()
+        }
+    else:
+        adjacency.invalidate(afw)
     for state in afw['states']:
         for a in afw['alphabet']:
             if (state, a) not in afw['transitions']:
@@ -175,11 +464,9 @@ def nfa_to_afw_conversion(nfa: dict) -> dict:
     afw['states'].add(afw['initial_state'])
 
     for (state, action) in nfa['transitions']:
-        boolean_formula = str()
-        for destination in nfa['transitions'][state, action]:
-            boolean_formula += destination + ' or '
-        # strip last ' or ' from the formula string
-        boolean_formula = boolean_formula[0:-4]
+        boolean_formula = str(Formula.disjunction(
+            Formula.variable(destination)
+            for destination in nfa['transitions'][state, action]))
         afw['transitions'][state, action] = boolean_formula
         if state in nfa['initial_states']:
             afw['transitions'][afw['initial_state'], action] = boolean_formula
@@ -187,7 +474,7 @@ def nfa_to_afw_conversion(nfa: dict) -> dict:
     return afw
 
 
-def afw_to_nfa_conversion(afw: dict) -> dict:
+def afw_to_nfa_conversion(afw: dict, minimal: bool = True) -> dict:
     """ Returns a NFA reading the same language of input AFW.
 
     Let :math:`A = (Σ, S, s^0 , ρ, F )`  be an afw. Then we
@@ -204,7 +491,23 @@ def afw_to_nfa_conversion(afw: dict) -> dict:
      :math:`ρ_N` to be equivalent to true; thus, :math:`(∅, a,
      ∅) ∈ ρ_N`.
 
-    :param dict afw: input AFW.
+    Successors are not found trying all the :math:`2^{|S|}`
+    assignments: they are generated from the minimal models of
+    :math:`⋀_{s∈Q} ρ(s, a)` (see
+    :mod:`PySimpleAutomata.AFW.Formula.minimal_models`), which
+    involve only the states occurring in the formulas.
+    As the formulas are positive, any superset of a successor is a
+    successor too but it accepts a subset of its language, so by
+    default only minimal successors are generated, leading to a
+    smaller NFA reading the same language.
+    With **minimal** set to False all the successors of the
+    definition are generated, enumerating the supersets of each
+    minimal model over all the states: they are
+    :math:`2^{|S|-|model|}`, so this is practical just for small AFWs.
+
+    :param dict afw: input AFW;
+    :param bool minimal: if False all successors are added, not just
+           the minimal ones (default: True).
     :return: *(dict)* representing a NFA.
     """
 
@@ -216,12 +519,42 @@ def afw_to_nfa_conversion(afw: dict) -> dict:
         'transitions': dict()
     }
 
-    # State of the NFA are composed by the union of more states of the AFW
-
-    boundary = deepcopy(nfa['states'])
-    possible_assignments = set(
-        itertools.product([True, False], repeat=len(afw['states'])))
-
+    # State of the NFA are composed by the union of more states of the AFW,
+    # as tuples ordered consistently
+    position = dict()
+    order = list()
+    for s in afw['states']:
+        position[s] = len(order)
+        order.append(s)
+
+    def nfa_state(afw_states):
+        for s in afw_states:
+            if s not in position:
+                position[s] = len(order)
+                order.append(s)
+        return tuple(sorted(afw_states, key=position.__getitem__))
+
+    # successors of each (hash-consed) formula
+    successors = dict()
+
+    def formula_successors(formula):
+        if formula not in successors:
+            if minimal:
+                assignments = formula.minimal_models()
+            else:
+                # upward closure of the minimal models
+                assignments = set()
+                for model in formula.minimal_models():
+                    free = [s for s in order if s not in model]
+                    for assignment in itertools.product(
+                            [False, True], repeat=len(free)):
+                        assignments.add(model.union(
+                            s for s, value in zip(free, assignment)
+                            if value))
+            successors[formula] = {nfa_state(q) for q in assignments}
+        return successors[formula]
+
+    boundary = nfa['states'].copy()
     while boundary:
         state = boundary.pop()
         # The state is accepting only if composed exclusively of final states
@@ -229,32 +562,19 @@ def afw_to_nfa_conversion(afw: dict) -> dict:
             nfa['accepting_states'].add(state)
 
         for action in nfa['alphabet']:
-            boolean_formula = 'True'
             # join the boolean formulas of the single states given the action
-            for s in state:
-                if (s, action) not in afw['transitions']:
-                    boolean_formula += ' and False'
-                else:
-                    boolean_formula += \
-                        ' and (' + \
-                        afw['transitions'][s, action] + \
-                        ')'
-
-            for assignment in possible_assignments:
-                mapping = dict(zip(afw['states'], assignment))
-
-                # If the formula is satisfied
-                if eval(boolean_formula, mapping):
-                    # add the transition to the resulting NFA
-
-                    evaluation = \
-                        tuple(k for k in mapping if mapping[k] is True)
-
-                    if evaluation not in nfa['states']:
-                        nfa['states'].add(evaluation)
-                        boundary.add(evaluation)
-                    nfa['transitions'].setdefault(
-                        (state, action), set()).add(evaluation)
+            boolean_formula = Formula.conjunction(
+                compile_formula(afw['transitions'][s, action])
+                if (s, action) in afw['transitions'] else Formula.FALSE
+                for s in state)
+
+            for evaluation in formula_successors(boolean_formula):
+                # add the transition to the resulting NFA
+                if evaluation not in nfa['states']:
+                    nfa['states'].add(evaluation)
+                    boundary.add(evaluation)
+                nfa['transitions'].setdefault(
+                    (state, action), set()).add(evaluation)
 
     return nfa
 
@@ -270,16 +590,7 @@ def formula_dual(input_formula: str) -> str:
     :param str input_formula: original string.
     :return: *(str)*, dual of input formula.
     """
-    conversion_dictionary = {
-        'and': 'or',
-        'or': 'and',
-        'True': 'False',
-        'False': 'True'
-    }
-
-    return re.sub(
-        '|'.join(re.escape(key) for key in conversion_dictionary.keys()),
-        lambda k: conversion_dictionary[k.group(0)], input_formula)
+    return str(compile_formula(input_formula).dual())
 
 
 def afw_complementation(afw: dict) -> dict:
@@ -299,42 +610,30 @@ def afw_complementation(afw: dict) -> dict:
     :param dict afw: input AFW.
     :return: *(dict)* representing a AFW.
     """
-    completed_input = afw_completion(deepcopy(afw))
-
     complemented_afw = {
-        'alphabet': completed_input['alphabet'],
-        'states': completed_input['states'],
-        'initial_state': completed_input['initial_state'],
+        'alphabet': afw['alphabet'].copy(),
+        'states': afw['states'].copy(),
+        'initial_state': afw['initial_state'],
         'accepting_states':
-            completed_input['states'].difference(afw['accepting_states']),
+            afw['states'].difference(afw['accepting_states']),
         'transitions': dict()
     }
 
-    for transition in completed_input['transitions']:
-        complemented_afw['transitions'][transition] = \
-            formula_dual(completed_input['transitions'][transition])
+    # the missing transitions, as completed with False, are dualized
+    # without completing a copy of the input
+    for transition, formula in afw['transitions'].items():
+        complemented_afw['transitions'][transition] = formula_dual(formula)
+    for state in afw['states']:
+        for a in afw['alphabet']:
+            if (state, a) not in afw['transitions']:
+                complemented_afw['transitions'][state, a] = 'True'
     return complemented_afw
 
 
-def __replace_all(repls: dict, input: str) -> str:
-    """ Replaces from the string **input** all the occurrence of the
-    keys element of the dictionary **repls** with their relative
-    value.
-
-    :param dict repls: dictionary containing the mapping
-                  between the values to be changed and their
-                  appropriate substitution;
-    :param str input: original string.
-    :return: *(str)*, string with the appropriate values replaced.
-    """
-    return re.sub('|'.join(re.escape(key) for key in repls.keys()),
-                  lambda k: repls[k.group(0)], input)
-
-
 # SIDE EFFECTS
-def rename_afw_states(afw: dict, suffix: str):
-    """ Side effect on input! Renames all the states of the AFW
-    adding a **suffix**.
+def rename_afw_states(afw: dict, suffix: str, inplace: bool = True):
+    """ Side effect on input (unless **inplace** is False)! Renames
+    all the states of the AFW adding a **suffix**.
 
     It is an utility function used during testing to avoid automata to have
     states with names in common.
@@ -342,7 +641,9 @@ def rename_afw_states(afw: dict, suffix: str):
     Avoid suffix that can lead to special name like "as", "and",...
 
     :param dict afw: input AFW.
-    :param str suffix: string to be added at beginning of each state name.
+    :param str suffix: string to be added at beginning of each state name;
+    :param bool inplace: if False the input is left untouched and a
+           new AFW is returned (default: True).
     """
     conversion_dict = {}
     new_states = set()
@@ -353,16 +654,28 @@ def rename_afw_states(afw: dict, suffix: str):
         if state in afw['accepting_states']:
             new_accepting.add('' + suffix + state)
 
+    if inplace:
+        adjacency.invalidate(afw)
+    else:
+        afw = {
+            'alphabet': afw['alphabet'].copy(),
+            'states': None,
+            'initial_state': afw['initial_state'],
+            'accepting_states': None,
+            'transitions': afw['transitions']
+        }
     afw['states'] = new_states
     afw['initial_state'] = '' + suffix + afw['initial_state']
     afw['accepting_states'] = new_accepting
 
     new_transitions = {}
     for transition in afw['transitions']:
-        new_transition = __replace_all(conversion_dict, transition[0])
-        new_transitions[new_transition, transition[1]] = \
-            __replace_all(conversion_dict, afw['transitions'][transition])
+        new_transition = conversion_dict.get(transition[0], transition[0])
+        new_transitions[new_transition, transition[1]] = str(
+            compile_formula(afw['transitions'][transition]).rename(
+                conversion_dict))
     afw['transitions'] = new_transitions
+    return afw
 
 
 def afw_union(afw_1: dict, afw_2: dict) -> dict:
@@ -399,7 +712,7 @@ def afw_union(afw_1: dict, afw_2: dict) -> dict:
         'initial_state': initial_state,
         'accepting_states':
             afw_1['accepting_states'].union(afw_2['accepting_states']),
-        'transitions': deepcopy(afw_1['transitions'])
+        'transitions': afw_1['transitions'].copy()
     }
 
     # add also afw_2 transitions
@@ -410,24 +723,17 @@ def afw_union(afw_1: dict, afw_2: dict) -> dict:
             or afw_2['initial_state'] in afw_2['accepting_states']:
         union['accepting_states'].add(union['initial_state'])
 
-    # copy all transitions of initial states and eventually their conjunction
+    # copy all transitions of initial states and eventually their disjunction
     # into the new initial state
     for action in union['alphabet']:
-        if (afw_1['initial_state'], action) in afw_1['transitions']:
+        formulas = list()
+        for afw in (afw_1, afw_2):
+            if (afw['initial_state'], action) in afw['transitions']:
+                formulas.append(compile_formula(
+                    afw['transitions'][afw['initial_state'], action]))
+        if formulas:
             union['transitions'][initial_state, action] = \
-                '(' + \
-                afw_1['transitions'][afw_1['initial_state'], action] + \
-                ')'
-            if (afw_2['initial_state'], action) in afw_2['transitions']:
-                union['transitions'][initial_state, action] += \
-                    ' or (' + \
-                    afw_2['transitions'][afw_2['initial_state'], action] + \
-                    ')'
-        elif (afw_2['initial_state'], action) in afw_2['transitions']:
-            union['transitions'][initial_state, action] = \
-                '(' + \
-                afw_2['transitions'][afw_2['initial_state'], action] + \
-                ')'
+                str(Formula.disjunction(formulas))
 
     return union
 
@@ -463,7 +769,7 @@ def afw_intersection(afw_1: dict, afw_2: dict) -> dict:
         'initial_state': initial_state,
         'accepting_states':
             afw_1['accepting_states'].union(afw_2['accepting_states']),
-        'transitions': deepcopy(afw_1['transitions'])
+        'transitions': afw_1['transitions'].copy()
     }
 
     # add also afw_2 transitions
@@ -478,52 +784,73 @@ def afw_intersection(afw_1: dict, afw_2: dict) -> dict:
     # New initial state transitions will be the conjunction of
     # precedent inital states ones
     for action in intersection['alphabet']:
-        if (afw_1['initial_state'], action) in afw_1['transitions']:
-            intersection['transitions'][initial_state, action] = \
-                '(' + \
-                afw_1['transitions'][afw_1['initial_state'], action] + \
-                ')'
-            if (afw_2['initial_state'], action) in afw_2['transitions']:
-                intersection['transitions'][initial_state, action] += \
-                    ' and (' + \
-                    afw_2['transitions'][afw_2['initial_state'], action] + \
-                    ')'
+        formulas = list()
+        for afw in (afw_1, afw_2):
+            if (afw['initial_state'], action) in afw['transitions']:
+                formulas.append(compile_formula(
+                    afw['transitions'][afw['initial_state'], action]))
             else:
-                intersection['transitions'][
-                    initial_state, action] += ' and False'
-        elif (afw_2['initial_state'], action) in afw_2['transitions']:
+                formulas.append(Formula.FALSE)
+        if (afw_1['initial_state'], action) in afw_1['transitions'] \
+                or (afw_2['initial_state'], action) in afw_2['transitions']:
             intersection['transitions'][initial_state, action] = \
-                'False and (' + \
-                afw_2['transitions'][afw_2['initial_state'], action] + \
-                ')'
+                str(Formula.conjunction(formulas))
 
     return intersection
 
 
+def afw_nonemptiness_witness(afw: dict):
+    """ Returns a shortest nonempty word accepted by the input AFW,
+    or None if there is none.
+
+    See :mod:`PySimpleAutomata.AFW.afw_nonemptiness_check`.
+
+    :param dict afw: input AFW.
+    :return: *(list)* accepted word, or None.
+    """
+    transitions = afw['transitions']
+    accepting_states = afw['accepting_states']
+    alphabet = afw['alphabet']
+
+    def successors(state):
+        for action in alphabet:
+            boolean_formula = Formula.conjunction(
+                compile_formula(transitions[s, action])
+                if (s, action) in transitions else Formula.FALSE
+                for s in state)
+            for model in boolean_formula.minimal_models():
+                yield action, model
+
+    return search.shortest_accepted_word(
+        [frozenset([afw['initial_state']])], successors,
+        accepting_states.issuperset)
+
+
 def afw_nonemptiness_check(afw: dict) -> bool:
     """ Checks if the input AFW reads any language other than the
     empty one, returning True/False.
 
-    The afw is translated into a nfa and then its nonemptiness is
-    checked.
+    The afw is checked as the nfa of
+    :mod:`PySimpleAutomata.AFW.afw_to_nfa_conversion`, whose states
+    are generated on the fly during the search and just from
+    minimal models, stopping at the first accepting one.
 
     :param dict afw: input AFW.
     :return: *(bool)*, True if input afw is nonempty, False otherwise.
     """
-    nfa = afw_to_nfa_conversion(afw)
-    return NFA.nfa_nonemptiness_check(nfa)
+    return afw_nonemptiness_witness(afw) is not None
 
 
 def afw_nonuniversality_check(afw: dict) -> bool:
     """ Checks if the language read by the input AFW is different
     from Σ∗, returning True/False.
 
-    The afw is translated into a nfa and then its nonuniversality
-    is checked.
+    The afw is translated into a nfa, with just minimal successors,
+    and then its nonuniversality is checked.
 
     :param dict afw: input AFW.
     :return: *(bool)*, True if input afw is nonuniversal, False
              otherwise.
     """
-    nfa = afw_to_nfa_conversion(afw)
+    nfa = afw_to_nfa_conversion(afw, minimal=True)
     return NFA.nfa_nonuniversality_check(nfa)
@@ -27,9 +27,377 @@ In this module a DFA is defined as follows
         **key**: (*state* ∈ states, *action* ∈ alphabet)
 
         **value**: (*arriving_state* in states).
+
+A DFA may have also the key
+  • implicit_sink    => (*state* ∈ states), the *implicit sink*:
+    every transition :math:`ρ(s, a)` with a ∈ Σ which is not in
+    transitions leads to it, including the ones of the sink itself,
+    so it needs not be materialized with :math:`|S| × |Σ|`
+    transitions.
+
+The implicit sink is added on request by
+:mod:`PySimpleAutomata.DFA.dfa_completion`,
+:mod:`PySimpleAutomata.DFA.dfa_complementation` and
+:mod:`PySimpleAutomata.DFA.dfa_minimization`, and is understood by
+all the functions of this module.
+If the sink is not accepting this is the same as leaving the
+transitions undefined, while an accepting implicit sink is what
+makes a lazy complementation possible.
+Without the key, undefined transitions lead to rejection whatever
+the names of the states.
 """
 
-from copy import deepcopy
+from array import array
+from collections import deque
+
+from PySimpleAutomata import adjacency
+from PySimpleAutomata import search
+
+# Marker used in compiled transition tables for undefined transitions
+REJECT = -1
+# Name of the state added by the completion, primed if taken
+SINK = 'sink'
+
+
+def __accepting_sink(dfa: dict):
+    """ Returns the implicit sink of the DFA if it has one and it is
+    accepting, None otherwise: a rejecting sink is the same as
+    undefined transitions. """
+    sink = dfa.get('implicit_sink')
+    if sink is not None and sink in dfa['accepting_states']:
+        return sink
+    return None
+
+
+def __fresh_state(dfa: dict, name: str = SINK):
+    """ Returns **name**, with primes appended until it is not a state
+    of the DFA. """
+    while name in dfa['states']:
+        name += "'"
+    return name
+
+
+def __copy_dfa(dfa: dict) -> dict:
+    """ Returns a copy of the DFA sharing no container with the
+    input, but sharing the states and the symbols, which are
+    immutable, unlike a deepcopy. """
+    copy = {
+        'alphabet': dfa['alphabet'].copy(),
+        'states': dfa['states'].copy(),
+        'initial_state': dfa['initial_state'],
+        'accepting_states': dfa['accepting_states'].copy(),
+        'transitions': dfa['transitions'].copy()
+    }
+    if 'implicit_sink' in dfa:
+        copy['implicit_sink'] = dfa['implicit_sink']
+    return copy
+
+
+def __completion_sink(dfa: dict):
+    """ Returns the name of the state the missing transitions are
+    sent to by the completion: the implicit sink, if any, otherwise
+    'sink', unless the DFA has a state named 'sink' which is not a
+    rejecting trap, in which case primes are appended to the name
+    until it is free or names such a trap. """
+    if dfa.get('implicit_sink') is not None:
+        return dfa['implicit_sink']
+    sink = SINK
+    transitions = dfa['transitions']
+    while sink in dfa['states']:
+        if sink not in dfa['accepting_states'] and all(
+                transitions.get((sink, action), sink) == sink
+                for action in dfa['alphabet']):
+            break
+        sink += "'"
+    return sink
+
+
+class CompiledDFA:
+    """ Read-only integer-indexed representation of a DFA, built by
+    :mod:`PySimpleAutomata.DFA.compile_dfa`.
+
+    States and symbols are mapped to dense integers and the
+    transition function is stored in a flat table where
+    :math:`ρ(s, a)` is found at index :math:`s·|Σ| + a`; undefined
+    transitions hold :data:`REJECT`.
+    The dict representation of the DFA stays the source of truth:
+    a compiled DFA must be rebuilt if the original one changes.
+
+    Attributes:
+
+      • states        => tuple(), state names indexed by state id;
+      • alphabet      => tuple(), symbols indexed by symbol id;
+      • state_index   => dict(), state name -> state id;
+      • symbol_index  => dict(), symbol -> symbol id;
+      • initial_state => int, id of the initial state or REJECT;
+      • accepting     => bytearray(), 1 for accepting state ids;
+      • table         => array('i'), flat transition table.
+
+    A compiled DFA loaded by
+    :mod:`PySimpleAutomata.automata_IO.dfa_binary_loader` holds
+    read-only views of the file instead of the bytearray and the array.
+    """
+
+    __slots__ = ('states', 'alphabet', 'state_index', 'symbol_index',
+                 'initial_state', 'accepting', 'table')
+
+    def __init__(self, dfa: dict):
+        states = list()
+        state_index = dict()
+        symbols = list()
+        symbol_index = dict()
+
+        def index_state(state):
+            if state not in state_index:
+                state_index[state] = len(states)
+                states.append(state)
+
+        def index_symbol(symbol):
+            if symbol not in symbol_index:
+                symbol_index[symbol] = len(symbols)
+                symbols.append(symbol)
+
+        # the initial state (if any) always gets id 0
+        if dfa['initial_state'] is not None:
+            index_state(dfa['initial_state'])
+        for state in dfa['states']:
+            index_state(state)
+        for symbol in dfa['alphabet']:
+            index_symbol(symbol)
+        # transitions are followed even if not consistent with
+        # states and alphabet, as dfa_word_acceptance() does
+        for (state, action), destination in dfa['transitions'].items():
+            index_state(state)
+            index_state(destination)
+            index_symbol(action)
+
+        width = len(symbols)
+        table = array('i', [REJECT]) * (len(states) * width)
+        sink = dfa.get('implicit_sink')
+        if sink is not None and sink in dfa['accepting_states']:
+            # the accepting implicit sink is materialized in the table
+            sink = state_index[sink]
+            for state in range(len(states)):
+                for action in dfa['alphabet']:
+                    table[state * width + symbol_index[action]] = sink
+        for (state, action), destination in dfa['transitions'].items():
+            table[state_index[state] * width + symbol_index[action]] = \
+                state_index[destination]
+
+        accepting = bytearray(len(states))
+        for state in dfa['accepting_states']:
+            if state in state_index:
+                accepting[state_index[state]] = 1
+
+        self.states = tuple(states)
+        self.alphabet = tuple(symbols)
+        self.state_index = state_index
+        self.symbol_index = symbol_index
+        self.initial_state = state_index.get(dfa['initial_state'], REJECT)
+        self.accepting = accepting
+        self.table = table
+
+    @classmethod
+    def from_tables(cls, states, alphabet, initial_state: int, accepting,
+                    table, state_index=None):
+        """ Returns a compiled DFA made of already built tables, which
+        are used as they are, without copying them.
+
+        :param states: sequence of the state names indexed by state id;
+        :param alphabet: sequence of the symbols indexed by symbol id;
+        :param int initial_state: id of the initial state or REJECT;
+        :param accepting: sequence of the accepting flags (1 for
+                          accepting state ids, 0 otherwise);
+        :param table: sequence of ints, the flat transition table;
+        :param state_index: mapping state name -> state id (default:
+                            a dict built from **states**).
+        :return: *(CompiledDFA)* the compiled DFA.
+        """
+        if state_index is None:
+            state_index = {state: i for i, state in enumerate(states)}
+        compiled_dfa = cls.__new__(cls)
+        compiled_dfa.states = states
+        compiled_dfa.alphabet = tuple(alphabet)
+        compiled_dfa.state_index = state_index
+        compiled_dfa.symbol_index = {symbol: i for i, symbol
+                                     in enumerate(compiled_dfa.alphabet)}
+        compiled_dfa.initial_state = initial_state
+        compiled_dfa.accepting = accepting
+        compiled_dfa.table = table
+        return compiled_dfa
+
+    def encode(self, word: list) -> list:
+        """ Returns the list of symbol ids of **word**, using
+        :data:`REJECT` for symbols not in the alphabet.
+
+        :param list word: list of symbols.
+        :return: *(list)* of symbol ids.
+        """
+        symbol_index = self.symbol_index
+        return [symbol_index.get(action, REJECT) for action in word]
+
+    def run_index(self, word: list) -> int:
+        """ Returns the id of the state reached reading **word**
+        from the initial state, or :data:`REJECT` if the run gets
+        stuck on an undefined transition.
+
+        :param list word: list of symbols.
+        :return: *(int)* state id or REJECT.
+        """
+        table = self.table
+        width = len(self.alphabet)
+        symbol_index = self.symbol_index
+        state = self.initial_state
+        if state == REJECT:
+            return REJECT
+        for action in word:
+            a = symbol_index.get(action)
+            if a is None:
+                return REJECT
+            state = table[state * width + a]
+            if state == REJECT:
+                return REJECT
+        return state
+
+    def run(self, word: list):
+        """ Returns the name of the state reached reading **word**
+        from the initial state, None if the run gets stuck.
+
+        :param list word: list of symbols.
+        :return: state name or None.
+        """
+        state = self.run_index(word)
+        if state == REJECT:
+            return None
+        return self.states[state]
+
+    def accepts(self, word: list) -> bool:
+        """ Checks if **word** is accepted, returning the same result
+        of :mod:`PySimpleAutomata.DFA.dfa_word_acceptance` on the
+        original DFA.
+
+        :param list word: list of symbols.
+        :return: *(bool)*, True if the word is accepted, False
+                 otherwise.
+        """
+        state = self.run_index(word)
+        return state != REJECT and self.accepting[state] == 1
+
+    def encode_batch(self, words: list):
+        """ Encodes a list of words into a 2-D integer NumPy array,
+        padded with :data:`REJECT`, and the vector of their lengths,
+        as required by :mod:`PySimpleAutomata.DFA.dfa_batch_word_acceptance`.
+
+        Requires NumPy.
+
+        :param list words: list of words (lists of symbols).
+        :return: *(numpy.ndarray, numpy.ndarray)* encoded words and
+                 their lengths.
+        """
+        import numpy
+
+        lengths = numpy.fromiter((len(word) for word in words),
+                                 dtype=numpy.intp, count=len(words))
+        width = int(lengths.max()) if len(words) > 0 else 0
+        encoded = numpy.full((len(words), width), REJECT, dtype=numpy.intp)
+        for i, word in enumerate(words):
+            encoded[i, :len(word)] = self.encode(word)
+        return encoded, lengths
+
+
+def compile_dfa(dfa: dict) -> CompiledDFA:
+    """ Returns a :class:`CompiledDFA`, a read-only integer-indexed
+    accelerator of the input DFA.
+
+    It is meant to be used when the same DFA has to read many words:
+    each symbol costs a single lookup in a flat array instead of
+    tuple-keyed dictionary probes.
+
+    :param dict dfa: input DFA.
+    :return: *(CompiledDFA)* compiled version of the input DFA.
+    """
+    return CompiledDFA(dfa)
+
+
+def __dense_table(compiled_dfa: CompiledDFA, alphabet):
+    """ Returns the transition table of the compiled DFA as a 2-D
+    NumPy array with a column for each symbol of **alphabet** and an
+    additional dead state (the last row, id :math:`|S|`) absorbing
+    undefined transitions and symbols unknown to the DFA, together
+    with the boolean vector of accepting states and the initial
+    state id. """
+    import numpy
+
+    n = len(compiled_dfa.states)
+    m = len(compiled_dfa.alphabet)
+    dead = n
+    table = numpy.full((n + 1, max(len(alphabet), 1)), dead,
+                       dtype=numpy.intp)
+    if n > 0 and m > 0:
+        compiled_table = numpy.array(compiled_dfa.table, dtype=numpy.intp)
+        compiled_table = compiled_table.reshape(n, m)
+        compiled_table[compiled_table == REJECT] = dead
+        for column, symbol in enumerate(alphabet):
+            if symbol in compiled_dfa.symbol_index:
+                table[:n, column] = \
+                    compiled_table[:, compiled_dfa.symbol_index[symbol]]
+    accepting = numpy.zeros(n + 1, dtype=bool)
+    accepting[:n] = numpy.frombuffer(bytes(compiled_dfa.accepting),
+                                     dtype=numpy.uint8) == 1
+
+    initial_state = compiled_dfa.initial_state
+    if initial_state == REJECT:
+        initial_state = dead
+    return table, accepting, initial_state
+
+
+def dfa_batch_word_acceptance(compiled_dfa: CompiledDFA, words,
+                              lengths=None):
+    """ Checks a batch of encoded words against a compiled DFA,
+    returning a boolean NumPy vector with the acceptance of each word.
+
+    All the words advance together one symbol (column) at a time
+    through the transition table, so the Python loop is over the
+    symbols of the longest word only and not over words × symbols.
+    An additional dead state absorbs undefined transitions.
+
+    Words are encoded with :mod:`PySimpleAutomata.DFA.CompiledDFA.encode`
+    or :mod:`PySimpleAutomata.DFA.CompiledDFA.encode_batch`; symbol
+    ids out of the alphabet (e.g. REJECT) reject the word.
+    Requires NumPy.
+
+    :param CompiledDFA compiled_dfa: input DFA compiled with
+           :mod:`PySimpleAutomata.DFA.compile_dfa`;
+    :param words: 2-D integer array, one encoded word per row,
+           padded on the right to the same length;
+    :param lengths: 1-D integer array with the length of each word
+           (default: all the rows are full length words).
+    :return: *(numpy.ndarray)* of booleans, True for accepted words.
+    """
+    import numpy
+
+    words = numpy.asarray(words, dtype=numpy.intp)
+    if words.ndim != 2:
+        raise ValueError('words must be a 2-D array of symbol ids')
+    count, width = words.shape
+    if lengths is None:
+        lengths = numpy.full(count, width, dtype=numpy.intp)
+    else:
+        lengths = numpy.asarray(lengths, dtype=numpy.intp)
+
+    m = len(compiled_dfa.alphabet)
+    table, accepting, initial_state = __dense_table(
+        compiled_dfa, compiled_dfa.alphabet)
+    dead = len(compiled_dfa.states)
+    states = numpy.full(count, initial_state, dtype=numpy.intp)
+    for column in range(width):
+        symbols = words[:, column]
+        valid = (symbols >= 0) & (symbols < m)
+        next_states = table[states, numpy.where(valid, symbols, 0)]
+        next_states[~valid] = dead
+        states = numpy.where(lengths > column, next_states, states)
+
+    return accepting[states]
 
 
 def dfa_word_acceptance(dfa: dict, word: list) -> bool:
@@ -46,9 +414,12 @@ def dfa_word_acceptance(dfa: dict, word: list) -> bool:
              other case.
     """
     current_state = dfa['initial_state']
+    sink = __accepting_sink(dfa)
     for action in word:
         if (current_state, action) in dfa['transitions']:
             current_state = dfa['transitions'][current_state, action]
+        elif sink is not None and action in dfa['alphabet']:
+            current_state = sink
         else:
             return False
 
@@ -59,10 +430,11 @@ def dfa_word_acceptance(dfa: dict, word: list) -> bool:
 
 
 # Side effect on input dfa
-def dfa_completion(dfa: dict) -> dict:
-    """ Side effects on input! Completes the DFA assigning to
-    each state a transition for each letter in the alphabet (if
-    not already defined).
+def dfa_completion(dfa: dict, implicit_sink: bool = False,
+                   inplace: bool = True) -> dict:
+    """ Side effects on input (unless **inplace** is False)!
+    Completes the DFA assigning to each state a transition for each
+    letter in the alphabet (if not already defined).
 
     We say that a DFA is complete if its transition function
     :math:`ρ:S×Σ→S` is a total function, that is,
@@ -75,28 +447,65 @@ def dfa_completion(dfa: dict) -> dict:
     when :math:`ρ(s,a)` is not defined in A and :math:`ρ_T=ρ` in
     the other cases.
 
-    :param dict dfa: input DFA.
+    With **implicit_sink** the sink is just added to the states and
+    recorded as the implicit sink of the DFA, leaving the transitions
+    to it implicit, so no :math:`|S| × |Σ|` transitions are stored.
+    Otherwise an implicit sink of the DFA is materialized, and the
+    sink added is named 'sink', unless the DFA already has a state
+    named 'sink' which is not a rejecting trap, in which case it is
+    named "sink'" (with as many primes as needed to be fresh).
+
+    :param dict dfa: input DFA;
+    :param bool implicit_sink: if True the transitions to the sink
+           are not added (default: False);
+    :param bool inplace: if False the input is left untouched and a
+           new DFA is returned (default: True).
     :return: *(dict)* representing the completed DFA.
     """
-    dfa['states'].add('sink')
+    if not inplace:
+        dfa = __copy_dfa(dfa)
+    if implicit_sink:
+        if dfa.get('implicit_sink') is None:
+            sink = __fresh_state(dfa)
+            dfa['states'].add(sink)
+            dfa['implicit_sink'] = sink
+        return dfa
+    sink = __completion_sink(dfa)
+    dfa.pop('implicit_sink', None)
+    dfa['states'].add(sink)
+    adjacency.invalidate(dfa)
     for state in dfa['states']:
         for action in dfa['alphabet']:
             if (state, action) not in dfa['transitions']:
-                dfa['transitions'][state, action] = 'sink'
+                dfa['transitions'][state, action] = sink
     return dfa
 
 
-def dfa_complementation(dfa: dict) -> dict:
+def dfa_complementation(dfa: dict, implicit_sink: bool = False) -> dict:
     """ Returns a DFA that accepts any word but he ones accepted
     by the input DFA.
 
     Let A be a completed DFA, :math:`Ā = (Σ, S, s_0 , ρ, S − F )`
     is the DFA that runs A but accepts whatever word A does not.
 
-    :param dict dfa: input DFA.
+    With **implicit_sink** A is completed with an implicit sink (if
+    it has not one already), which becomes accepting in Ā, so just
+    the accepting states are flipped and the transitions are copied
+    as they are.
+
+    :param dict dfa: input DFA;
+    :param bool implicit_sink: if True the sink of the complement is
+           left implicit (default: False).
     :return: *(dict)* representing the complement of the input DFA.
     """
-    dfa_complement = dfa_completion(deepcopy(dfa))
+    if implicit_sink:
+        dfa_complement = dfa_completion(dfa, implicit_sink=True,
+                                        inplace=False)
+        if dfa_complement['initial_state'] is None:
+            # the empty DFA reads the empty language
+            dfa_complement['initial_state'] = dfa_complement['implicit_sink']
+    else:
+        dfa_complement = dfa_completion(dfa, inplace=False)
     dfa_complement['accepting_states'] = \
         dfa_complement['states'].difference(dfa_complement['accepting_states'])
     return dfa_complement
@@ -135,6 +544,10 @@ def dfa_intersection(dfa_1: dict, dfa_2: dict) -> dict:
         'transitions': dict()
     }
 
+    # missing transitions lead to the accepting implicit sink, if any
+    sink_1 = __accepting_sink(dfa_1)
+    sink_2 = __accepting_sink(dfa_2)
+
     boundary = set()
     boundary.add(intersection['initial_state'])
     while boundary:
@@ -144,10 +557,9 @@ def dfa_intersection(dfa_1: dict, dfa_2: dict) -> dict:
             intersection['accepting_states'].add((state_dfa_1, state_dfa_2))
 
         for a in intersection['alphabet']:
-            if (state_dfa_1, a) in dfa_1['transitions'] \
-                    and (state_dfa_2, a) in dfa_2['transitions']:
-                next_state_1 = dfa_1['transitions'][state_dfa_1, a]
-                next_state_2 = dfa_2['transitions'][state_dfa_2, a]
+            next_state_1 = dfa_1['transitions'].get((state_dfa_1, a), sink_1)
+            next_state_2 = dfa_2['transitions'].get((state_dfa_2, a), sink_2)
+            if next_state_1 is not None and next_state_2 is not None:
                 if (next_state_1, next_state_2) not in intersection['states']:
                     intersection['states'].add((next_state_1, next_state_2))
                     boundary.add((next_state_1, next_state_2))
@@ -157,6 +569,19 @@ def dfa_intersection(dfa_1: dict, dfa_2: dict) -> dict:
     return intersection
 
 
+def __union_step(dfa: dict, state, action, sink, dead):
+    """ Returns the state reached by the DFA from **state** reading
+    **action**, where the missing transitions lead to **sink** and
+    the ones on symbols out of the alphabet, or from **dead**, to
+    **dead**. """
+    next_state = dfa['transitions'].get((state, action))
+    if next_state is not None:
+        return next_state
+    if state == dead or action not in dfa['alphabet']:
+        return dead
+    return sink
+
+
 def dfa_union(dfa_1: dict, dfa_2: dict) -> dict:
     """ Returns a DFA accepting the union of the input DFAs.
 
@@ -183,15 +608,18 @@ def dfa_union(dfa_1: dict, dfa_2: dict) -> dict:
     :param dict dfa_2: second input DFA.
     :return: *(dict)* representing the united DFA.
     """
-    dfa_1 = deepcopy(dfa_1)
-    dfa_2 = deepcopy(dfa_2)
-    dfa_1['alphabet'] = dfa_2['alphabet'] = dfa_1['alphabet'].union(
-        dfa_2['alphabet'])  # to complete the DFAs over all possible transition
-    dfa_1 = dfa_completion(dfa_1)
-    dfa_2 = dfa_completion(dfa_2)
-
+    # The DFAs are not completed: missing transitions are read as
+    # leading to the sink, and the ones on the symbols out of the
+    # alphabet of a DFA to a rejecting dead state, which is the sink
+    # itself unless it is an accepting implicit sink.
+    sink_1 = __completion_sink(dfa_1)
+    sink_2 = __completion_sink(dfa_2)
+    dead_1 = sink_1 if __accepting_sink(dfa_1) is None \
+        else __fresh_state(dfa_1)
+    dead_2 = sink_2 if __accepting_sink(dfa_2) is None \
+        else __fresh_state(dfa_2)
     union = {
-        'alphabet': dfa_1['alphabet'].copy(),
+        'alphabet': dfa_1['alphabet'].union(dfa_2['alphabet']),
         'states': {(dfa_1['initial_state'], dfa_2['initial_state'])},
         'initial_state': (dfa_1['initial_state'], dfa_2['initial_state']),
         'accepting_states': set(),
@@ -206,9 +634,8 @@ def dfa_union(dfa_1: dict, dfa_2: dict) -> dict:
                 or state_dfa_2 in dfa_2['accepting_states']:
             union['accepting_states'].add((state_dfa_1, state_dfa_2))
         for a in union['alphabet']:
-            # as DFAs are completed they surely have the transition
-            next_state_1 = dfa_1['transitions'][state_dfa_1, a]
-            next_state_2 = dfa_2['transitions'][state_dfa_2, a]
+            next_state_1 = __union_step(dfa_1, state_dfa_1, a, sink_1, dead_1)
+            next_state_2 = __union_step(dfa_2, state_dfa_2, a, sink_2, dead_2)
             if (next_state_1, next_state_2) not in union['states']:
                 union['states'].add((next_state_1, next_state_2))
                 boundary.add((next_state_1, next_state_2))
@@ -218,37 +645,436 @@ def dfa_union(dfa_1: dict, dfa_2: dict) -> dict:
     return union
 
 
-def dfa_minimization(dfa: dict) -> dict:
-    """ Returns the minimization of the DFA in input through a
-    greatest fix-point method.
+class ProductTable:
+    """ Reachable synchronous product of two DFAs as integer NumPy
+    tables, built by :mod:`PySimpleAutomata.DFA.dfa_product_table`.
+
+    The same product serves the four Boolean operations, which
+    differ just in the accepting states, given by a boolean mask
+    for each of them.
+    A component that has no transition on a symbol (or for which
+    the symbol is unknown) moves to its dead state, so the table is
+    complete.
+
+    Attributes:
+
+      • alphabet      => tuple(), symbols indexed by column, the
+        union of the two alphabets;
+      • compiled_dfas => tuple(), the two :class:`CompiledDFA`;
+      • components    => numpy.ndarray, shape (|S|, 2), for each
+        product state the ids of the component states in the two
+        :class:`CompiledDFA` (their number of states for the dead
+        state);
+      • initial_state => int, always 0;
+      • table         => numpy.ndarray, shape (|S|, |Σ|), id of the
+        product state reached by each state with each symbol;
+      • accepting     => dict(), operation name ('intersection',
+        'union', 'difference', 'xor') -> boolean numpy.ndarray.
+    """
 
-    Given a completed DFA :math:`A = (Σ, S, s_0 , ρ, F )` there
-    exists a single minimal DFA :math:`A_m`
-    which is equivalent to A, i.e. reads the same language
-    :math:`L(A) = L(A_m)` and with a minimal number of states.
-    To construct such a DFA we exploit bisimulation as a suitable
-    equivalence relation between states.
+    __slots__ = ('alphabet', 'compiled_dfas', 'components',
+                 'initial_state', 'table', 'accepting')
+
+    OPERATIONS = ('intersection', 'union', 'difference', 'xor')
+
+    def __init__(self, alphabet, compiled_dfas, components, table,
+                 accepting):
+        self.alphabet = alphabet
+        self.compiled_dfas = compiled_dfas
+        self.components = components
+        self.initial_state = 0
+        self.table = table
+        self.accepting = accepting
+
+    def __accepting(self, operation: str):
+        if operation not in self.accepting:
+            raise ValueError('unknown operation: ' + str(operation))
+        return self.accepting[operation]
+
+    def accepts(self, word: list, operation: str) -> bool:
+        """ Checks if **word** belongs to the language obtained
+        combining the two DFAs with **operation**.
+
+        :param list word: list of symbols;
+        :param str operation: 'intersection', 'union', 'difference'
+               or 'xor'.
+        :return: *(bool)*, True if the word is accepted, False
+                 otherwise.
+        """
+        accepting = self.__accepting(operation)
+        columns = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        state = self.initial_state
+        for action in word:
+            if action not in columns:
+                # both components die
+                return False
+            state = self.table[state, columns[action]]
+        return bool(accepting[state])
+
+    def to_dfa(self, operation: str) -> dict:
+        """ Returns the product as a DFA dict accepting the language
+        obtained combining the two DFAs with **operation**.
+
+        States are pairs of state names of the input DFAs, where
+        the dead state of a component is named 'sink', primed until
+        it is not a state of its DFA.
+
+        :param str operation: 'intersection', 'union', 'difference'
+               or 'xor'.
+        :return: *(dict)* representing the product DFA.
+        """
+        states = list()
+        for compiled_dfa in self.compiled_dfas:
+            component_states = list(compiled_dfa.states)
+            dead = SINK
+            taken = set(component_states)
+            while dead in taken:
+                dead += "'"
+            # the dead state is the one after the states
+            states.append(component_states + [dead])
+        names = [(states[0][s_1], states[1][s_2])
+                 for (s_1, s_2) in self.components.tolist()]
+        table = self.table.tolist()
+        accepting = self.__accepting(operation).tolist()
+        return {
+            'alphabet': set(self.alphabet),
+            'states': set(names),
+            'initial_state': names[self.initial_state],
+            'accepting_states': {names[i] for i in range(len(names))
+                                 if accepting[i]},
+            'transitions': {(names[i], a): names[row[j]]
+                            for i, row in enumerate(table)
+                            for j, a in enumerate(self.alphabet)}
+        }
 
-    A bisimulation relation :math:`E ∈ S × S` is a relation
-    between states that satisfies the following condition:
-    if :math:`(s, t) ∈ E` then:
 
-     • s ∈ F iff t ∈ F;
-     • For all :math:`(s_X,a)` such that :math:`ρ(s, a) = s_X`,
-       there exists :math:`t_X` such that :math:`ρ(t, a) = t_X`
-       and :math:`(s_X , t_X ) ∈ E`;
-     • For all :math:`(t_X,a)` such that :math:`ρ(t, a) = t_X` ,
-       there exists :math:`s_X` such that :math:`ρ(s, a) = s_X`
-       and :math:`(s_X , t_X ) ∈ E`.
+def dfa_product_table(dfa_1, dfa_2) -> ProductTable:
+    """ Returns the reachable product of the two input DFAs as a
+    :class:`ProductTable`, computed with NumPy.
+
+    Once the DFAs are completed and compiled to integer tables
+    :math:`T_1` and :math:`T_2`, encoding the pair of states
+    :math:`(s_1, s_2)` as :math:`s_1·n_2 + s_2` the product table is
+    :math:`T[(s_1, s_2), a] = T_1[s_1, a]·n_2 + T_2[s_2, a]`.
+    The reachable pairs are found breadth-first expanding the whole
+    frontier at each step with array operations, and are numbered
+    in the order they are found.
+    Accepting masks for intersection (:math:`F_1 × F_2`), union,
+    difference (:math:`L(A_1) − L(A_2)`) and symmetric difference
+    are computed together, so one construction serves all the four
+    operations.
+    Requires NumPy.
+
+    :param dfa_1: first input DFA (dict or :class:`CompiledDFA`);
+    :param dfa_2: second input DFA (dict or :class:`CompiledDFA`).
+    :return: *(ProductTable)* product of the two DFAs.
+    """
+    import numpy
+
+    compiled_dfas = list()
+    for dfa in (dfa_1, dfa_2):
+        if not isinstance(dfa, CompiledDFA):
+            dfa = CompiledDFA(dfa)
+        compiled_dfas.append(dfa)
+    compiled_1, compiled_2 = compiled_dfas
+    alphabet = compiled_1.alphabet + tuple(
+        a for a in compiled_2.alphabet
+        if a not in compiled_1.symbol_index)
+
+    table_1, accepting_1, initial_1 = __dense_table(compiled_1, alphabet)
+    table_2, accepting_2, initial_2 = __dense_table(compiled_2, alphabet)
+    n_2 = len(table_2)
+    if not alphabet:
+        table_1 = table_1[:, :0]
+        table_2 = table_2[:, :0]
+
+    # breadth-first visit on the encoded pairs
+    frontier = numpy.array([initial_1 * n_2 + initial_2], dtype=numpy.intp)
+    levels = [frontier]
+    visited = frontier
+    while frontier.size:
+        successors = table_1[frontier // n_2] * n_2 + \
+            table_2[frontier % n_2]
+        frontier = numpy.unique(successors)
+        frontier = frontier[
+            ~numpy.isin(frontier, visited, assume_unique=True)]
+        levels.append(frontier)
+        visited = numpy.union1d(visited, frontier)
+
+    keys = numpy.concatenate(levels)
+    order = numpy.argsort(keys)
+    sorted_keys = keys[order]
+    successors = table_1[keys // n_2] * n_2 + table_2[keys % n_2]
+    table = order[numpy.searchsorted(sorted_keys, successors)]
+
+    components = numpy.stack([keys // n_2, keys % n_2], axis=1)
+    final_1 = accepting_1[components[:, 0]]
+    final_2 = accepting_2[components[:, 1]]
+    accepting = {
+        'intersection': final_1 & final_2,
+        'union': final_1 | final_2,
+        'difference': final_1 & ~final_2,
+        'xor': final_1 ^ final_2
+    }
+    return ProductTable(alphabet, tuple(compiled_dfas), components, table,
+                        accepting)
+
+
+def __renumber(dfa: dict):
+    """ Returns a copy of the DFA with states renamed to consecutive
+    integers in breadth-first order from the initial state (which
+    gets 0), and the list of the original names indexed by the new
+    ones.
 
     :param dict dfa: input DFA.
-    :return: *(dict)* representing the minimized DFA.
+    :return: *(dict, list)* renamed DFA and original state names.
     """
-    dfa = dfa_completion(deepcopy(dfa))
+    names = list()
+    ids = dict()
+    renamed = {
+        'alphabet': dfa['alphabet'].copy(),
+        'states': set(),
+        'initial_state': None,
+        'accepting_states': set(),
+        'transitions': dict()
+    }
+    if dfa['initial_state'] is None:
+        return renamed, names
+
+    # an accepting implicit sink is kept implicit, if reached
+    sink = __accepting_sink(dfa)
+    ids[dfa['initial_state']] = 0
+    names.append(dfa['initial_state'])
+    queue = deque([dfa['initial_state']])
+    while queue:
+        state = queue.popleft()
+        for a in dfa['alphabet']:
+            if (state, a) in dfa['transitions']:
+                next_state = dfa['transitions'][state, a]
+            elif sink is not None:
+                next_state = sink
+            else:
+                continue
+            if next_state not in ids:
+                ids[next_state] = len(names)
+                names.append(next_state)
+                queue.append(next_state)
+            if next_state != sink or (state, a) in dfa['transitions']:
+                renamed['transitions'][ids[state], a] = ids[next_state]
+    if sink in ids:
+        renamed['implicit_sink'] = ids[sink]
+    renamed['initial_state'] = 0
+    renamed['states'] = set(range(len(names)))
+    renamed['accepting_states'] = {ids[state] for state in
+                                   dfa['accepting_states'] if state in ids}
+    return renamed, names
+
+
+def __reduce(dfa: dict, minimize: bool, inplace: bool = True) -> dict:
+    """ Side effects on input (unless **inplace** is False)! Returns
+    the DFA trimmed and, if **minimize**, minimized, without the sink
+    state added by the minimization. """
+    dfa = dfa_trimming(dfa, inplace)
+    if minimize and dfa['initial_state'] is not None:
+        dfa = dfa_trimming(dfa_minimization(dfa))
+    return dfa
 
-    ################################################################
-    ### Greatest-fixpoint
 
+def __product_many(dfas: list, product, order: str, minimize: bool,
+                   return_provenance: bool, return_statistics: bool):
+    """ Folds **product** (dfa_intersection or dfa_union) over the
+    input DFAs reducing the automaton after each step, see
+    :mod:`PySimpleAutomata.DFA.dfa_intersection_many`. """
+    if not dfas:
+        raise ValueError('at least one DFA is required')
+    if order not in ('size', 'alphabet', 'input'):
+        raise ValueError('unknown operands order: ' + str(order))
+    intersection = product is dfa_intersection
+
+    if intersection:
+        alphabet = set.intersection(*[set(dfa['alphabet']) for dfa in dfas])
+    else:
+        alphabet = set.union(*[set(dfa['alphabet']) for dfa in dfas])
+
+    operands = list()
+    for i, dfa in enumerate(dfas):
+        operand = __reduce(dfa, minimize, inplace=False)
+        if operand['initial_state'] is None:
+            if intersection:
+                # the whole intersection is empty
+                operands = [(i, operand)]
+                break
+            # the empty language is neutral for the union
+            continue
+        operands.append((i, operand))
+
+    def combined(current, operand):
+        if intersection:
+            return len(current.intersection(operand[1]['alphabet']))
+        return len(current.union(operand[1]['alphabet']))
+
+    if order == 'size':
+        operands.sort(key=lambda operand: len(operand[1]['states']))
+    elif order == 'alphabet' and operands:
+        remaining = sorted(operands,
+                           key=lambda operand: len(operand[1]['states']))
+        operands = [remaining.pop(0)]
+        current = set(operands[0][1]['alphabet'])
+        while remaining:
+            best = min(remaining, key=lambda operand: (
+                combined(current, operand), len(operand[1]['states'])))
+            remaining.remove(best)
+            operands.append(best)
+            if intersection:
+                current.intersection_update(best[1]['alphabet'])
+            else:
+                current.update(best[1]['alphabet'])
+
+    # name of the sink of each operand in the union
+    sinks = {i: __completion_sink(operand) for i, operand in operands}
+    statistics = list()
+    result = None
+    # provenance: id -> {input index: component state}
+    provenance = list()
+    for i, operand in operands:
+        if result is None:
+            product_states = len(operand['states'])
+            result, names = __renumber(operand)
+            provenance = [{i: state} for state in names]
+        else:
+            previous = result
+            product_dfa = product(previous, operand)
+            product_states = len(product_dfa['states'])
+            result, names = __renumber(__reduce(product_dfa, minimize))
+            components = list()
+            for (p, q) in names:
+                if p not in previous['states']:
+                    # sink added by dfa_union, reached by all the
+                    # operands processed
+                    origin = {j: sinks[j] for j in provenance[0]}
+                else:
+                    origin = dict(provenance[p])
+                origin[i] = q
+                components.append(origin)
+            provenance = components
+        statistics.append({
+            'operand': i,
+            'operand_states': len(operand['states']),
+            'product_states': product_states,
+            'states': len(result['states']),
+            'transitions': len(result['transitions'])
+        })
+        if intersection and result['initial_state'] is None:
+            break
+
+    if result is None:
+        result = {
+            'alphabet': set(),
+            'states': set(),
+            'initial_state': None,
+            'accepting_states': set(),
+            'transitions': dict()
+        }
+    result['alphabet'] = alphabet
+    outputs = [result]
+    if return_provenance:
+        outputs.append({
+            state: tuple(origin.get(j) for j in range(len(dfas)))
+            for state, origin in enumerate(provenance)})
+    if return_statistics:
+        outputs.append(statistics)
+    if len(outputs) == 1:
+        return result
+    return tuple(outputs)
+
+
+def dfa_intersection_many(dfas: list, order: str = 'size',
+                          minimize: bool = True,
+                          return_provenance: bool = False,
+                          return_statistics: bool = False):
+    """ Returns a DFA accepting the intersection of all the input
+    DFAs.
+
+    Chaining :mod:`PySimpleAutomata.DFA.dfa_intersection` builds
+    states named by nested tuples and keeps in every intermediate
+    product the states that can never lead to acceptance.
+    Here each operand and each intermediate product is trimmed and,
+    with **minimize**, minimized before the next step, and its
+    states are renamed to integers (the initial state is 0).
+    If an intermediate product is empty the remaining operands are
+    not processed.
+
+    The order of the operands is chosen by **order**:
+
+     • 'size': by increasing number of states (default);
+     • 'alphabet': starting from the smallest DFA, each time the one
+       leaving the smallest alphabet, ties broken by size;
+     • 'input': as given.
+
+    The provenance maps each state of the result to the tuple of
+    the states of the input DFAs (in input order) it stands for,
+    None for the components not processed; a state merged by the
+    minimization stands for its representative.
+    The statistics are a list with a dict for each step with keys
+    'operand' (index of the DFA in input), 'operand_states' (states
+    of the reduced operand), 'product_states' (states of the product
+    before the reduction), 'states' and 'transitions' (of the
+    reduced product).
+
+    :param list dfas: input DFAs;
+    :param str order: 'size', 'alphabet' or 'input';
+    :param bool minimize: if True (default) minimizes after each
+           step, otherwise just trims;
+    :param bool return_provenance: if True returns also the
+           provenance dict;
+    :param bool return_statistics: if True returns also the list of
+           statistics of each step.
+    :return: *(dict)* representing the intersected DFA, followed by
+             provenance and statistics when requested.
+    """
+    return __product_many(dfas, dfa_intersection, order, minimize,
+                          return_provenance, return_statistics)
+
+
+def dfa_union_many(dfas: list, order: str = 'size', minimize: bool = True,
+                   return_provenance: bool = False,
+                   return_statistics: bool = False):
+    """ Returns a DFA accepting the union of all the input DFAs.
+
+    As :mod:`PySimpleAutomata.DFA.dfa_intersection_many`, but
+    combining the operands with :mod:`PySimpleAutomata.DFA.dfa_union`;
+    DFAs reading the empty language are skipped and the 'alphabet'
+    order picks each time the DFA adding fewest symbols.
+    In the provenance a component is the sink added by the
+    completion of its DFA (see
+    :mod:`PySimpleAutomata.DFA.dfa_completion`) when it reached it.
+
+    :param list dfas: input DFAs;
+    :param str order: 'size', 'alphabet' or 'input';
+    :param bool minimize: if True (default) minimizes after each
+           step, otherwise just trims;
+    :param bool return_provenance: if True returns also the
+           provenance dict;
+    :param bool return_statistics: if True returns also the list of
+           statistics of each step.
+    :return: *(dict)* representing the united DFA, followed by
+             provenance and statistics when requested.
+    """
+    return __product_many(dfas, dfa_union, order, minimize,
+                          return_provenance, return_statistics)
+
+
+def __fixpoint_partition(dfa: dict) -> list:
+    """ Returns the partition of the states of the completed **dfa**
+    in bisimulation equivalence classes, computed as a greatest
+    fix-point over the relation S × S.
+
+    It takes quadratic space and it is kept as reference
+    implementation of :mod:`PySimpleAutomata.DFA.dfa_minimization`.
+
+    :param dict dfa: input completed DFA.
+    :return: *(list)* of sets of equivalent states.
+    """
     z_current = set()
     z_next = set()
 
@@ -287,49 +1113,317 @@ def dfa_minimization(dfa: dict) -> dict:
                     z_next.remove((state_1, state_2))
                     break
 
-    ################################################################
-    ### Equivalence Sets
-
+    # Equivalence sets
     equivalence = dict()
     for (state_1, state_2) in z_current:
         equivalence.setdefault(state_1, set()).add(state_2)
 
+    partition = list()
+    partitioned = set()
+    for state, equivalence_set in equivalence.items():
+        if state not in partitioned:
+            partitioned.update(equivalence_set)
+            partition.append(equivalence_set)
+    return partition
+
+
+def __hopcroft_partition(dfa: dict, partial: bool = False) -> list:
+    """ Returns the partition of the states of the completed **dfa**
+    in language equivalence classes, computed through Hopcroft's
+    partition refinement in :math:`O(|Σ| · n log n)`.
+
+    Starting from the partition {F, S − F}, a block Y is split by a
+    splitter (B, a) in the states of Y that enter B reading a and in
+    the ones that do not. After a split, only the smaller half needs
+    to be used as new splitter.
+
+    With **partial** the DFA may be not complete, provided that no
+    state is equivalent to the missing transitions (i.e. has the
+    language of the sink): both F and S − F are then used as
+    initial splitters, as stability with respect to one of them no
+    longer implies stability with respect to the other.
+
+    :param dict dfa: input completed DFA;
+    :param bool partial: if True the DFA may be not complete.
+    :return: *(list)* of sets of equivalent states.
+    """
+    # inverse transition function, by symbol
+    inverse = dict()
+    for (state, a), destination in dfa['transitions'].items():
+        inverse.setdefault(a, dict()).setdefault(destination, list()).append(
+            state)
+
+    partition = list()
+    for block in (dfa['states'].intersection(dfa['accepting_states']),
+                  dfa['states'].difference(dfa['accepting_states'])):
+        if block:
+            partition.append(block)
+    block_of = dict()
+    for i, block in enumerate(partition):
+        for state in block:
+            block_of[state] = i
+
+    # splitters (block, symbol) still to be processed
+    waiting = set()
+    if partial:
+        for i in range(len(partition)):
+            for a in dfa['alphabet']:
+                waiting.add((i, a))
+    elif len(partition) == 2:
+        smaller = 0 if len(partition[0]) <= len(partition[1]) else 1
+        for a in dfa['alphabet']:
+            waiting.add((smaller, a))
+
+    while waiting:
+        (splitter, a) = waiting.pop()
+        if a not in inverse:
+            continue
+        # states entering the splitter block reading a, by block
+        touched = dict()
+        for state in partition[splitter]:
+            for predecessor in inverse[a].get(state, ()):
+                if predecessor in block_of:
+                    touched.setdefault(block_of[predecessor], set()).add(
+                        predecessor)
+
+        for i, entering in touched.items():
+            block = partition[i]
+            if len(entering) == len(block):
+                continue
+            # split block i in entering and remaining states
+            block.difference_update(entering)
+            j = len(partition)
+            partition.append(entering)
+            for state in entering:
+                block_of[state] = j
+            for c in dfa['alphabet']:
+                if (i, c) in waiting:
+                    waiting.add((j, c))
+                elif len(entering) <= len(block):
+                    waiting.add((j, c))
+                else:
+                    waiting.add((i, c))
+
+    return partition
+
+
+def __implicit_sink_minimization(dfa: dict, return_mapping: bool):
+    """ Returns the minimization of the DFA in input with an implicit
+    sink, without completing it, see
+    :mod:`PySimpleAutomata.DFA.dfa_minimization`. """
+    sink = dfa.get('implicit_sink')
+    if sink is None:
+        sink = __fresh_state(dfa)
+    sink_accepting = sink in dfa['accepting_states']
+    states = set(dfa['states'])
+    for (state, a), destination in dfa['transitions'].items():
+        states.add(state)
+        states.add(destination)
+    states.discard(sink)
+
+    # states not equivalent to the sink reach, without passing
+    # through it, a state with the opposite acceptance
+    if sink_accepting:
+        live = states.difference(dfa['accepting_states'])
+    else:
+        live = states.intersection(dfa['accepting_states'])
+    predecessors = adjacency.dfa_predecessors(dfa)
+    boundary = list(live)
+    while boundary:
+        state = boundary.pop()
+        for a, predecessor in predecessors.get(state, ()):
+            if predecessor not in live and predecessor != sink:
+                live.add(predecessor)
+                boundary.append(predecessor)
+
+    partial_dfa = {
+        'alphabet': dfa['alphabet'],
+        'states': live,
+        'initial_state': dfa['initial_state'],
+        'accepting_states': live.intersection(dfa['accepting_states']),
+        'transitions': {(state, a): destination for (state, a), destination
+                        in dfa['transitions'].items()
+                        if state in live and destination in live}
+    }
+    partition = __hopcroft_partition(partial_dfa, partial=True)
+
+    representative = dict()
+    for state in states.difference(live):
+        representative[state] = sink
+    representative[sink] = sink
+    for equivalence_set in partition:
+        if dfa['initial_state'] in equivalence_set:
+            e = dfa['initial_state']
+        else:
+            e = next(iter(equivalence_set))
+        for state in equivalence_set:
+            representative[state] = e
+
+    dfa_min = {
+        'alphabet': dfa['alphabet'].copy(),
+        'states': {sink},
+        'initial_state': representative.get(dfa['initial_state'], sink),
+        'accepting_states': {sink} if sink_accepting else set(),
+        'transitions': dict(),
+        'implicit_sink': sink
+    }
+    for equivalence_set in partition:
+        e = representative[next(iter(equivalence_set))]
+        dfa_min['states'].add(e)
+        if e in partial_dfa['accepting_states']:
+            dfa_min['accepting_states'].add(e)
+    for (state, a), destination in partial_dfa['transitions'].items():
+        if representative[state] == state:
+            dfa_min['transitions'][state, a] = representative[destination]
+    if dfa_min['initial_state'] != sink and len(dfa_min['transitions']) == \
+            (len(dfa_min['states']) - 1) * len(dfa_min['alphabet']):
+        # complete without the sink
+        dfa_min['states'].discard(sink)
+        dfa_min['accepting_states'].discard(sink)
+        del dfa_min['implicit_sink']
+
+    if return_mapping:
+        return dfa_min, representative
+    return dfa_min
+
+
+def dfa_minimization(dfa: dict, algorithm: str = 'hopcroft',
+                     return_mapping: bool = False,
+                     implicit_sink: bool = False):
+    """ Returns the minimization of the DFA in input, by default
+    through Hopcroft's partition refinement.
+
+    Given a completed DFA :math:`A = (Σ, S, s_0 , ρ, F )` there
+    exists a single minimal DFA :math:`A_m`
+    which is equivalent to A, i.e. reads the same language
+    :math:`L(A) = L(A_m)` and with a minimal number of states.
+    To construct such a DFA we exploit bisimulation as a suitable
+    equivalence relation between states.
+
+    A bisimulation relation :math:`E ∈ S × S` is a relation
+    between states that satisfies the following condition:
+    if :math:`(s, t) ∈ E` then:
+
+     • s ∈ F iff t ∈ F;
+     • For all :math:`(s_X,a)` such that :math:`ρ(s, a) = s_X`,
+       there exists :math:`t_X` such that :math:`ρ(t, a) = t_X`
+       and :math:`(s_X , t_X ) ∈ E`;
+     • For all :math:`(t_X,a)` such that :math:`ρ(t, a) = t_X` ,
+       there exists :math:`s_X` such that :math:`ρ(s, a) = s_X`
+       and :math:`(s_X , t_X ) ∈ E`.
+
+    Available algorithms to compute the equivalence classes:
+
+     • 'hopcroft': partition refinement, :math:`O(|Σ| · n log n)`
+       time (default);
+     • 'fixpoint': greatest fix-point over :math:`S × S`, quadratic
+       space, kept as reference implementation.
+
+    Each equivalence class is represented in the minimal DFA by one
+    of its states (the initial state for its own class).
+
+    With **implicit_sink** the DFA is not completed: the states
+    equivalent to the sink are found first, by a backward visit, and
+    replaced by an implicit sink, then Hopcroft's algorithm is run
+    on the remaining, partial, DFA.
+    The time depends just on the stored transitions and the result
+    has an implicit sink, the one of the input if any, unless it is
+    complete without it.
+
+    :param dict dfa: input DFA;
+    :param str algorithm: 'hopcroft' or 'fixpoint';
+    :param bool return_mapping: if True returns also the mapping from
+           each state of the completed input DFA to the state
+           representing its class in the minimal DFA;
+    :param bool implicit_sink: if True the minimal DFA has an
+           implicit sink (just with 'hopcroft', default: False).
+    :return: *(dict)* representing the minimized DFA, or
+             *(dict, dict)* minimized DFA and mapping when
+             **return_mapping** is True.
+    """
+    if algorithm not in ('hopcroft', 'fixpoint'):
+        raise ValueError('unknown minimization algorithm: ' + str(algorithm))
+    if implicit_sink:
+        if algorithm != 'hopcroft':
+            raise ValueError('implicit_sink requires the hopcroft algorithm')
+        return __implicit_sink_minimization(dfa, return_mapping)
+
+    dfa = dfa_completion(dfa, inplace=False)
+
+    if algorithm == 'hopcroft':
+        partition = __hopcroft_partition(dfa)
+    else:
+        partition = __fixpoint_partition(dfa)
+
     ################################################################
     ### Minimal DFA construction
 
+    # select one element for each equivalence set
+    representative = dict()
+    for equivalence_set in partition:
+        if dfa['initial_state'] in equivalence_set:
+            e = dfa['initial_state']
+        else:
+            e = next(iter(equivalence_set))
+        for state in equivalence_set:
+            representative[state] = e
+
     dfa_min = {
         'alphabet': dfa['alphabet'].copy(),
-        'states': set(),
+        'states': set(representative.values()),
         'initial_state': dfa['initial_state'],
         'accepting_states': set(),
-        'transitions': dfa['transitions'].copy()
+        'transitions': dict()
     }
 
-    # select one element for each equivalence set
-    for equivalence_set in equivalence.values():
-        if dfa_min['states'].isdisjoint(equivalence_set):
-            e = equivalence_set.pop()
-            dfa_min['states'].add(e)  # TODO highlight this instruction
-            equivalence_set.add(e)
-
     dfa_min['accepting_states'] = \
         dfa_min['states'].intersection(dfa['accepting_states'])
 
-    for t in dfa['transitions']:
-        if t[0] not in dfa_min['states']:
-            dfa_min['transitions'].pop(t)
-        elif dfa['transitions'][t] not in dfa_min['states']:
-            dfa_min['transitions'][t] = \
-                equivalence[dfa['transitions'][t]]. \
-                    intersection(dfa_min['states']).pop()
+    for (state, a), destination in dfa['transitions'].items():
+        if state in dfa_min['states']:
+            dfa_min['transitions'][state, a] = \
+                representative.get(destination, destination)
 
+    if return_mapping:
+        return dfa_min, representative
     return dfa_min
 
 
+def __restriction(dfa: dict, states: set, inplace: bool,
+                  transitions: dict = None) -> dict:
+    """ Restricts the DFA to **states**, dropping the transitions from
+    or to other states (unless the restricted **transitions** are
+    given), in place or into a new DFA. The implicit sink is kept if
+    it is among **states**. """
+    if transitions is None:
+        transitions = {key: next_state
+                       for key, next_state in dfa['transitions'].items()
+                       if key[0] in states and next_state in states}
+    if inplace:
+        adjacency.invalidate(dfa)
+        if dfa.get('implicit_sink') not in states:
+            dfa.pop('implicit_sink', None)
+    else:
+        restricted = {
+            'alphabet': dfa['alphabet'].copy(),
+            'states': dfa['states'],
+            'initial_state': dfa['initial_state'],
+            'accepting_states': dfa['accepting_states'],
+            'transitions': None
+        }
+        if dfa.get('implicit_sink') in states:
+            restricted['implicit_sink'] = dfa['implicit_sink']
+        dfa = restricted
+    dfa['states'] = states
+    dfa['accepting_states'] = dfa['accepting_states'].intersection(states)
+    dfa['transitions'] = transitions
+    return dfa
+
+
 # Side effects on input variable
-def dfa_reachable(dfa: dict) -> dict:
-    """ Side effects on input! Removes unreachable states from a
-    DFA and returns the pruned DFA.
+def dfa_reachable(dfa: dict, inplace: bool = True) -> dict:
+    """ Side effects on input (unless **inplace** is False)! Removes
+    unreachable states from a DFA and returns the pruned DFA.
 
     It is possible to remove from a DFA A all unreachable states
     from the initial state without altering the language.
@@ -342,41 +1436,77 @@ def dfa_reachable(dfa: dict) -> dict:
     • :math:`S_R` set of reachable state from the initial one
     • :math:`ρ|S_R` is the restriction on :math:`S_R × Σ` of ρ.
 
-    :param dict dfa: input DFA.
+    An accepting implicit sink is kept if it is reached by a missing
+    transition.
+    Without **inplace** just the reachable part is copied, instead
+    of copying the whole DFA first.
+
+    :param dict dfa: input DFA;
+    :param bool inplace: if False the input is left untouched and a
+           new DFA is returned (default: True).
     :return: *(dict)* representing the pruned DFA.
     """
     reachable_states = set()  # set of reachable states from root
     boundary = set()
     reachable_states.add(dfa['initial_state'])
     boundary.add(dfa['initial_state'])
+    sink = __accepting_sink(dfa)
+    alphabet = dfa['alphabet']
+    successors = adjacency.dfa_successors(dfa)
 
     while boundary:
         s = boundary.pop()
-        for a in dfa['alphabet']:
-            if (s, a) in dfa['transitions']:
-                if dfa['transitions'][s, a] not in reachable_states:
-                    reachable_states.add(dfa['transitions'][s, a])
-                    boundary.add(dfa['transitions'][s, a])
-    dfa['states'] = reachable_states
-    dfa['accepting_states'] = \
-        dfa['accepting_states'].intersection(dfa['states'])
-
-    transitions = dfa[
-        'transitions'].copy()  # TODO why copy? because for doesn't cycle
-    # mutable set....
-    for t in transitions:
-        if t[0] not in dfa['states']:
-            dfa['transitions'].pop(t)
-        elif dfa['transitions'][t] not in dfa['states']:
-            dfa['transitions'].pop(t)
+        defined = 0
+        for a, next_state in successors.get(s, ()):
+            if a not in alphabet:
+                continue
+            defined += 1
+            if next_state not in reachable_states:
+                reachable_states.add(next_state)
+                boundary.add(next_state)
+        if sink is not None and defined < len(alphabet) \
+                and sink not in reachable_states:
+            reachable_states.add(sink)
+            boundary.add(sink)
+    return __restriction(dfa, reachable_states, inplace)
+
+
+def __co_reachable_states(dfa: dict) -> set:
+    """ Returns the set of states of the DFA reaching a final state,
+    visiting backward the transitions from the accepting states.
+
+    With an accepting implicit sink, the states missing a transition
+    reach the sink and so are co-reachable as well.
 
-    return dfa
+    :param dict dfa: input DFA.
+    :return: *(set)* of co-reachable states.
+    """
+    co_reachable_states = dfa['accepting_states'].copy()
+    if __accepting_sink(dfa) is not None:
+        alphabet = dfa['alphabet']
+        successors = adjacency.dfa_successors(dfa)
+        for state in dfa['states']:
+            defined = sum(1 for a, next_state in successors.get(state, ())
+                          if a in alphabet)
+            if defined < len(alphabet):
+                co_reachable_states.add(state)
+    boundary = co_reachable_states.copy()
+
+    predecessors = adjacency.dfa_predecessors(dfa)
+    while boundary:
+        s = boundary.pop()
+        for action, state in predecessors.get(s, ()):
+            if state not in co_reachable_states:
+                boundary.add(state)
+                co_reachable_states.add(state)
+    return co_reachable_states
 
 
 # Side effects on input variable
-def dfa_co_reachable(dfa: dict) -> dict:
-    """ Side effects on input! Removes from the DFA all states that
-    do not reach a final state and returns the pruned DFA.
+def dfa_co_reachable(dfa: dict, inplace: bool = True) -> dict:
+    """ Side effects on input (unless **inplace** is False)! Removes
+    from the DFA all states that do not reach a final state and
+    returns the pruned DFA.
 
     It is possible to remove from a DFA A all states that do not
     reach a final state without altering the language.
@@ -390,30 +1520,21 @@ def dfa_co_reachable(dfa: dict) -> dict:
     • :math:`S_F` is the set of states that reach a final state
     • :math:`ρ|S_F` is the restriction on :math:`S_F × Σ` of ρ.
 
-    :param dict dfa: input DFA.
+    With an accepting implicit sink every state missing a transition
+    reaches it, and a transition to a removed state cannot be dropped,
+    as it would then lead to the sink: such transitions are redirected
+    to a single rejecting trap, one of the removed states, kept with a
+    loop for each symbol, without materializing the sink.
+
+    :param dict dfa: input DFA;
+    :param bool inplace: if False the input is left untouched and a
+           new DFA is returned (default: True).
     :return: *(dict)* representing the pruned DFA.
     """
-
-    co_reachable_states = dfa['accepting_states'].copy()
-    boundary = co_reachable_states.copy()
-
-    # inverse transition function
-    inverse_transitions = dict()
-    for key, value in dfa['transitions'].items():
-        inverse_transitions.setdefault(value, set()).add(key)
-
-    while boundary:
-        s = boundary.pop()
-        if s in inverse_transitions:
-            for (state, action) in inverse_transitions[s]:
-                if state not in co_reachable_states:
-                    boundary.add(state)
-                    co_reachable_states.add(state)
-
-    dfa['states'] = co_reachable_states
+    co_reachable_states = __co_reachable_states(dfa)
 
     # If not s_0 ∈ S_F the resulting dfa is empty
-    if dfa['initial_state'] not in dfa['states']:
+    if dfa['initial_state'] not in co_reachable_states:
         dfa = {
             'alphabet': set(),
             'states': set(),
@@ -423,20 +1544,32 @@ def dfa_co_reachable(dfa: dict) -> dict:
         }
         return dfa
 
-    transitions = dfa['transitions'].copy()
-    for t in transitions:
-        if t[0] not in dfa['states']:
-            dfa['transitions'].pop(t)
-        elif dfa['transitions'][t] not in dfa['states']:
-            dfa['transitions'].pop(t)
-
-    return dfa
+    if __accepting_sink(dfa) is None:
+        return __restriction(dfa, co_reachable_states, inplace)
+
+    trap = None
+    transitions = dict()
+    for key, next_state in dfa['transitions'].items():
+        if key[0] in co_reachable_states:
+            if next_state not in co_reachable_states:
+                if trap is None:
+                    trap = next_state
+                next_state = trap
+            transitions[key] = next_state
+    if trap is None:
+        return __restriction(dfa, co_reachable_states, inplace,
+                             transitions)
+    for action in dfa['alphabet']:
+        transitions[trap, action] = trap
+    return __restriction(dfa, co_reachable_states.union([trap]), inplace,
+                         transitions)
 
 
 # Side effects on input variable
-def dfa_trimming(dfa: dict) -> dict:
-    """ Side effects on input! Returns the DFA in input trimmed,
-    so both reachable and co-reachable.
+def dfa_trimming(dfa: dict, inplace: bool = True,
+                 return_removed: bool = False):
+    """ Side effects on input (unless **inplace** is False)! Returns
+    the DFA in input trimmed, so both reachable and co-reachable.
 
     Given a DFA A, the corresponding trimmed DFA contains only
     those states that are reachable from the initial state
@@ -452,18 +1585,184 @@ def dfa_trimming(dfa: dict) -> dict:
     • :math:`ρ|S_R∩S_F` is the restriction on :math:`(S_R ∩ S_F )
       × Σ` of ρ.
 
-    :param dict dfa: input DFA.
-    :return: *(dict)* representing the trimmed input DFA.
+    :math:`S_R` is visited forward from the initial state, through
+    the cached successors index of :mod:`PySimpleAutomata.adjacency`,
+    recording the inverse of the transitions met, and :math:`S_R ∩
+    S_F` backward from :math:`F ∩ S_R` on them; then the transitions
+    are filtered in a single sweep: in place the states and
+    transitions removed are deleted from the containers of the
+    input, otherwise just the ones kept are copied.
+    A DFA with an accepting implicit sink is made reachable and
+    co-reachable as by the two functions, so it may keep a rejecting
+    trap.
+
+    :param dict dfa: input DFA;
+    :param bool inplace: if False the input is left untouched and a
+           new DFA is returned (default: True);
+    :param bool return_removed: if True returns also a dict with the
+           number of removed 'states' and 'transitions'.
+    :return: *(dict)* representing the trimmed input DFA, or *(dict,
+             dict)* trimmed DFA and removed counts when
+             **return_removed** is True.
     """
-    # Reachable DFA
-    dfa = dfa_reachable(dfa)
-    # Co-reachable DFA
-    dfa = dfa_co_reachable(dfa)
-    # trimmed DFA
+    states = len(dfa['states'])
+    transitions = len(dfa['transitions'])
+    if __accepting_sink(dfa) is not None:
+        dfa = dfa_co_reachable(dfa_reachable(dfa, inplace))
+    else:
+        dfa = __trimming(dfa, inplace)
+    if return_removed:
+        removed = {
+            'states': states - len(dfa['states']),
+            'transitions': transitions - len(dfa['transitions'])
+        }
+        return dfa, removed
+    return dfa
+
+
+def __trimming(dfa: dict, inplace: bool) -> dict:
+    """ Trims a DFA without an accepting implicit sink in a single
+    pass, see :mod:`PySimpleAutomata.DFA.dfa_trimming`. """
+    alphabet = dfa['alphabet']
+    successors = adjacency.dfa_successors(dfa)
+
+    # the forward visit records the reachable part of the inverse
+    # transitions, so the backward one does not leave it
+    reachable_states = {dfa['initial_state']}
+    predecessors = dict()
+    boundary = [dfa['initial_state']]
+    while boundary:
+        state = boundary.pop()
+        for a, next_state in successors.get(state, ()):
+            if a not in alphabet:
+                continue
+            if next_state in predecessors:
+                predecessors[next_state].append(state)
+            else:
+                predecessors[next_state] = [state]
+            if next_state not in reachable_states:
+                reachable_states.add(next_state)
+                boundary.append(next_state)
+
+    kept = dfa['accepting_states'].intersection(reachable_states)
+    boundary = list(kept)
+    while boundary:
+        state = boundary.pop()
+        for previous_state in predecessors.get(state, ()):
+            if previous_state not in kept:
+                kept.add(previous_state)
+                boundary.append(previous_state)
+
+    # If not s_0 ∈ S_F the resulting dfa is empty
+    if dfa['initial_state'] not in kept:
+        return {
+            'alphabet': set(),
+            'states': set(),
+            'initial_state': None,
+            'accepting_states': set(),
+            'transitions': dict()
+        }
+
+    if not inplace:
+        return {
+            'alphabet': alphabet.copy(),
+            'states': kept,
+            'initial_state': dfa['initial_state'],
+            'accepting_states': dfa['accepting_states'].intersection(kept),
+            'transitions': {key: next_state for key, next_state
+                            in dfa['transitions'].items()
+                            if key[0] in kept and next_state in kept}
+        }
+
+    adjacency.invalidate(dfa)
+    # a rejecting implicit sink is never kept
+    dfa.pop('implicit_sink', None)
+    removed = [key for key, next_state in dfa['transitions'].items()
+               if key[0] not in kept or next_state not in kept]
+    for key in removed:
+        del dfa['transitions'][key]
+    dfa['states'].intersection_update(kept)
+    # states named just by the transitions are kept as well
+    dfa['states'].update(kept)
+    dfa['accepting_states'].intersection_update(kept)
     return dfa
 
 
-def dfa_projection(dfa: dict, symbols_to_remove: set) -> dict:
+def __epsilon_closures(successors: dict, symbols: set) -> dict:
+    """ Returns for each state touched by a transition on **symbols**
+    the frozenset of the states reached from it reading just symbols
+    in **symbols**, itself included; the other states reach just
+    themselves.
+
+    The strongly connected components of the graph of such
+    transitions are found by an iterative Tarjan's visit, which
+    completes them in reverse topological order, so the closure of a
+    component is its states plus the closures of the components it
+    leads to, already known, and is shared by all its states.
+
+    :param dict successors: index of the transitions leaving each
+           state of the input DFA;
+    :param set symbols: symbols read as ε.
+    :return: *(dict)* state -> frozenset of states.
+    """
+    epsilon = dict()
+    for state, outgoing in successors.items():
+        next_states = [next_state for a, next_state in outgoing
+                       if a in symbols]
+        if next_states:
+            epsilon[state] = next_states
+
+    closures = dict()
+    index = dict()
+    low = dict()
+    stack = list()
+    on_stack = set()
+    for root in epsilon:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(epsilon[root]))]
+        while work:
+            state, successors = work[-1]
+            for next_state in successors:
+                if next_state not in index:
+                    index[next_state] = low[next_state] = len(index)
+                    stack.append(next_state)
+                    on_stack.add(next_state)
+                    work.append(
+                        (next_state, iter(epsilon.get(next_state, ()))))
+                    break
+                if next_state in on_stack:
+                    low[state] = min(low[state], index[next_state])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[state])
+                if low[state] != index[state]:
+                    continue
+                component = list()
+                member = None
+                while member != state:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                closure = set(component)
+                for member in component:
+                    for next_state in epsilon.get(member, ()):
+                        # other components are already closed
+                        if next_state not in closure:
+                            closure.update(closures[next_state])
+                closure = frozenset(closure)
+                for member in component:
+                    closures[member] = closure
+    return closures
+
+
+def dfa_projection(dfa: dict, symbols_to_remove: set,
+                   determinize: bool = False, state_names: str = 'string'):
     """ Returns a NFA that reads the language recognized by the
     input DFA where all the symbols in **symbols_to_project**
     are projected out of the alphabet.
@@ -483,65 +1782,198 @@ def dfa_projection(dfa: dict, symbols_to_remove: set) -> dict:
       :math:`(s,t) ∈ ε_X , t_y = ρ(t,a)` and :math:`(t_y , s_y )
       ∈ ε_X`
 
+    The closures :math:`ε_X(s)` are computed once, collapsing the
+    strongly connected components of the transitions on X, and the
+    transitions of the NFA are then built in a single pass.
+
+    With **determinize** the NFA is not built: the subset
+    construction is run directly over the closures, each subset
+    being closed, and the DFA reading :math:`πX(L(A))` is returned,
+    as :mod:`PySimpleAutomata.NFA.nfa_determinization` would do on
+    the NFA; its states are named as there by **state_names**
+    ('string', 'integer' or 'frozenset').
+
+    An accepting implicit sink is not materialized: the closures
+    reaching a state missing a symbol of X contain it, the NFA gets
+    the transitions to it that are missing, and the subsets
+    containing it are the implicit sink of the determinized
+    projection.
+
     :param dict dfa: input DFA;
     :param set symbols_to_remove: set containing symbols ∈ dfa[
-           'alphabet'] to be projected out from DFA.
-    :return: *(dict)* representing a NFA.
+           'alphabet'] to be projected out from DFA;
+    :param bool determinize: if True returns the determinized
+           projection (default: False);
+    :param str state_names: names of the states of the determinized
+           projection (default: 'string').
+    :return: *(dict)* representing a NFA, or a DFA with
+             **determinize**.
     """
+    if determinize:
+        if state_names == 'string':
+            def state_name(s, i):
+                return str(set(sorted(s)))
+        elif state_names == 'integer':
+            def state_name(s, i):
+                return i
+        elif state_names == 'frozenset':
+            def state_name(s, i):
+                return s
+        else:
+            raise ValueError('unknown state names: ' + str(state_names))
+
+    alphabet = dfa['alphabet'].difference(symbols_to_remove)
+    sink = __accepting_sink(dfa)
+
+    successors = adjacency.dfa_successors(dfa)
+    closures = __epsilon_closures(successors, symbols_to_remove)
+    if sink is not None:
+        # the states missing a transition on a symbol removed reach the
+        # accepting sink reading ε, and so do the closures containing
+        # them, extended once per shared closure
+        projected = dfa['alphabet'].intersection(symbols_to_remove)
+        to_sink = {sink}
+        for state in dfa['states']:
+            read = sum(1 for a, next_state in successors.get(state, ())
+                       if a in projected)
+            if read < len(projected):
+                to_sink.add(state)
+        extended = dict()
+        for state, states in closures.items():
+            if id(states) not in extended:
+                # the shared closure is kept to keep its id unique
+                if sink not in states and not to_sink.isdisjoint(states):
+                    extended[id(states)] = (states, states.union([sink]))
+                else:
+                    extended[id(states)] = (states, states)
+            closures[state] = extended[id(states)][1]
+        for state in to_sink:
+            if state not in closures:
+                closures[state] = frozenset([state, sink])
+        closures[sink] = frozenset([sink])
+
+    def closure(state):
+        return closures.get(state, (state,))
+
+    # transitions on the symbols left, to the closure of the arriving
+    # state: state -> [(action, states)]
+    outgoing = dict()
+    for state, transitions in successors.items():
+        for a, next_state in transitions:
+            if a not in symbols_to_remove:
+                outgoing.setdefault(state, list()).append(
+                    (a, closure(next_state)))
+
+    if determinize:
+        projection = {
+            'alphabet': alphabet,
+            'states': set(),
+            'initial_state': None,
+            'accepting_states': set(),
+            'transitions': dict()
+        }
+        if dfa['initial_state'] is None:
+            return projection
+        names = dict()
+
+        def add_state(subset):
+            name = state_name(subset, len(names))
+            names[subset] = name
+            projection['states'].add(name)
+            if not subset.isdisjoint(dfa['accepting_states']):
+                projection['accepting_states'].add(name)
+
+        # the subsets containing the accepting sink accept any word:
+        # they are all the implicit sink of the projection, reached by
+        # its missing transitions
+        universal = frozenset([sink])
+        initial_set = frozenset(closure(dfa['initial_state']))
+        if sink in initial_set:
+            initial_set = universal
+        add_state(initial_set)
+        projection['initial_state'] = names[initial_set]
+        queue = deque([initial_set])
+        while queue:
+            current_set = queue.popleft()
+            if sink in current_set:
+                continue
+            next_sets = dict()
+            readers = dict()
+            for state in current_set:
+                for a, next_states in outgoing.get(state, ()):
+                    next_sets.setdefault(a, set()).update(next_states)
+                    readers[a] = readers.get(a, 0) + 1
+            if sink is not None and len(next_sets) < len(alphabet) \
+                    and universal not in names:
+                add_state(universal)
+            for a, next_set in next_sets.items():
+                if sink is not None and (readers[a] < len(current_set)
+                                         or sink in next_set):
+                    if universal not in names:
+                        add_state(universal)
+                    continue
+                next_set = frozenset(next_set)
+                if next_set not in names:
+                    add_state(next_set)
+                    queue.append(next_set)
+                projection['transitions'][names[current_set], a] = \
+                    names[next_set]
+        if sink is not None and universal in names:
+            projection['implicit_sink'] = names[universal]
+        return projection
+
     nfa = {
-        'alphabet': dfa['alphabet'].difference(symbols_to_remove),
+        'alphabet': alphabet,
         'states': dfa['states'].copy(),
-        'initial_states': {dfa['initial_state']},
+        'initial_states': set(closure(dfa['initial_state'])),
         'accepting_states': dfa['accepting_states'].copy(),
         'transitions': dict()
     }
+    # NFAs have no implicit sink: the missing transitions on the
+    # symbols left are added to the accepting one
+    missing = dict()
+    for state in nfa['states']:
+        for equivalent in closure(state):
+            for a, next_states in outgoing.get(equivalent, ()):
+                nfa['transitions'].setdefault((state, a), set()).update(
+                    next_states)
+            if sink is None:
+                continue
+            if equivalent not in missing:
+                missing[equivalent] = alphabet.difference(
+                    a for a, next_states in outgoing.get(equivalent, ()))
+            for a in missing[equivalent]:
+                nfa['transitions'].setdefault((state, a), set()).add(sink)
+    return nfa
 
-    current_nfa_transitions = None
-    current_e_x = None
-    e_x = dict()  # equivalence relation dictionary
-
-    # while no more changes are possible
-    while current_nfa_transitions != nfa['transitions'] or current_e_x != e_x:
-        current_nfa_transitions = nfa['transitions'].copy()
-        current_e_x = deepcopy(e_x)
-        for (state, a) in dfa['transitions']:
-            next_state = dfa['transitions'][state, a]
-            if a in symbols_to_remove:
-                # mark next_state as equivalent to state
-                e_x.setdefault(state, set()).add(next_state)
-
-                app_set = set()
-                for equivalent in e_x[state]:
-                    # mark states equivalent to next_states also to state
-                    if equivalent in e_x:
-                        app_set.update(e_x[equivalent])
-                    # add all transitions of equivalent states to state
-                    for act in nfa['alphabet']:
-                        if (equivalent, act) in dfa['transitions']:
-                            equivalent_next = dfa['transitions'][
-                                equivalent, act]
-                            nfa['transitions'].setdefault(
-                                (state, act), set()).add(equivalent_next)
-                            # if equivalent_next has equivalent states
-                            if equivalent_next in e_x:
-                                # the transition leads also to these states
-                                nfa['transitions'][state, act].update(
-                                    e_x[equivalent_next])
-                e_x[state].update(app_set)
-            else:
-                # add the transition to the NFA
-                nfa['transitions'].setdefault((state, a), set()).add(
-                    next_state)
-                # if next_state has equivalent states
-                if next_state in e_x:
-                    # the same transition arrive also to all these other states
-                    nfa['transitions'][state, a].update(e_x[next_state])
-
-    # Add all state equivalent to the initial one to NFA initial states set
-    if dfa['initial_state'] in e_x:
-        nfa['initial_states'].update(e_x[dfa['initial_state']])
 
-    return nfa
+def dfa_nonemptiness_witness(dfa: dict):
+    """ Returns a shortest nonempty word accepted by the input DFA,
+    or None if there is none.
+
+    See :mod:`PySimpleAutomata.DFA.dfa_nonemptiness_check`.
+
+    :param dict dfa: input DFA.
+    :return: *(list)* accepted word, or None.
+    """
+    transitions = dfa['transitions']
+    alphabet = dfa['alphabet']
+    sink = __accepting_sink(dfa)
+    index = adjacency.dfa_successors(dfa)
+
+    def successors(state):
+        if sink is None:
+            for a, next_state in index.get(state, ()):
+                if a in alphabet:
+                    yield a, next_state
+            return
+        # the missing transitions lead to the sink
+        for a in alphabet:
+            yield a, transitions.get((state, a), sink)
+
+    return search.shortest_accepted_word(
+        [dfa['initial_state']], successors,
+        dfa['accepting_states'].__contains__)
 
 
 def dfa_nonemptiness_check(dfa: dict) -> bool:
@@ -557,30 +1989,272 @@ def dfa_nonemptiness_check(dfa: dict) -> bool:
     :math:`s_0`.
     A is nonempty iff this set intersects F nontrivially.
 
+    Just nonempty words are considered: the search stops at the
+    first accepting state reached reading at least one symbol.
+
     :param dict dfa: input DFA.
     :return: *(bool)*, True if the DFA is nonempty, False otherwise
     """
-    # BFS
-    queue = [dfa['initial_state']]
+    return dfa_nonemptiness_witness(dfa) is not None
+
+
+def dfa_intersection_nonemptiness_witness(dfas: list, prune: bool = True):
+    """ Returns a nonempty word accepted by all the input DFAs, or
+    None if the intersection of their languages has no such word.
+
+    See :mod:`PySimpleAutomata.DFA.dfa_intersection_nonemptiness_check`.
+
+    :param list dfas: input DFAs;
+    :param bool prune: if True (default) tuples with a component
+           state not reaching a final state are not explored.
+    :return: *(list)* accepted word, or None.
+    """
+    if not dfas:
+        raise ValueError('at least one DFA is required')
+    alphabet = set.intersection(*[set(dfa['alphabet']) for dfa in dfas])
+
+    # missing transitions lead to the accepting implicit sink, if any
+    sinks = [__accepting_sink(dfa) for dfa in dfas]
+
+    # outgoing transitions of each state, restricted to alive states
+    outgoing = list()
+    for dfa, sink in zip(dfas, sinks):
+        alive = __co_reachable_states(dfa) if prune else None
+        state_outgoing = dict()
+        for (state, a), next_state in dfa['transitions'].items():
+            if a not in alphabet:
+                continue
+            if alive is not None and next_state not in alive:
+                if sink is not None:
+                    # pruned, not missing
+                    state_outgoing.setdefault(state, dict())[a] = None
+                continue
+            state_outgoing.setdefault(state, dict())[a] = next_state
+        outgoing.append(state_outgoing)
+    accepting = [dfa['accepting_states'] for dfa in dfas]
+    no_transitions = dict()
+    # components whose missing transitions reject
+    partial = [i for i, sink in enumerate(sinks) if sink is None]
+
+    def successors(states):
+        rows = [outgoing[i].get(state, no_transitions)
+                for i, state in enumerate(states)]
+        # iterate over the component with fewest transitions
+        if partial:
+            symbols = min((rows[i] for i in partial), key=len)
+        else:
+            symbols = alphabet
+        for a in symbols:
+            next_states = list()
+            for row, sink in zip(rows, sinks):
+                next_state = row.get(a, sink)
+                if next_state is None:
+                    break
+                next_states.append(next_state)
+            else:
+                yield a, tuple(next_states)
+
+    def jointly_accepting(states):
+        for i, state in enumerate(states):
+            if state not in accepting[i]:
+                return False
+        return True
+
+    return search.accepted_word(
+        [tuple(dfa['initial_state'] for dfa in dfas)], successors,
+        jointly_accepting)
+
+
+def dfa_intersection_nonemptiness_check(dfas: list,
+                                        prune: bool = True) -> bool:
+    """ Checks if the intersection of the languages read by the input
+    DFAs is nonempty, returning True/False.
+
+    Equivalent to checking the nonemptiness of the DFA obtained
+    chaining :mod:`PySimpleAutomata.DFA.dfa_intersection`, but the
+    product is never built: tuples of component states are explored
+    depth-first from the tuple of initial states, generating their
+    transitions when needed, until a tuple where all the components
+    accept is reached.
+    With **prune** the states reaching a final state are computed
+    first for each DFA, as in
+    :mod:`PySimpleAutomata.DFA.dfa_co_reachable`, and a tuple with a
+    component outside them is never generated as it cannot lead to
+    acceptance.
+    Just nonempty words are considered.
+
+    :param list dfas: input DFAs;
+    :param bool prune: if True (default) tuples with a component
+           state not reaching a final state are not explored.
+    :return: *(bool)*, True if the intersection is nonempty, False
+             otherwise.
+    """
+    return dfa_intersection_nonemptiness_witness(dfas, prune) is not None
+
+
+def __product_search(dfa_1: dict, dfa_2: dict, equivalence: bool):
+    """ Searches breadth-first the product of the two DFAs for a
+    shortest word telling them apart, returning it or None.
+
+    Missing transitions lead to a rejecting sink, represented by None,
+    or to the accepting implicit sink of the DFA, if any.
+    With **equivalence** a pair is a counterexample if exactly one of
+    its states is accepting, otherwise (inclusion) if the first is
+    accepting and the second not.
+    For equivalence, pairs assumed equivalent are merged in a
+    union-find structure and a pair whose states are already in the
+    same class is skipped (Hopcroft–Karp), so at most
+    :math:`|S_1| + |S_2|` pairs are expanded.
+
+    :param dict dfa_1: first input DFA;
+    :param dict dfa_2: second input DFA;
+    :param bool equivalence: True for equivalence, False for
+           inclusion of **dfa_1** in **dfa_2**.
+    :return: *(list)* counterexample word, or None.
+    """
+    alphabet = dfa_1['alphabet'].union(dfa_2['alphabet'])
+    transitions_1 = dfa_1['transitions']
+    transitions_2 = dfa_2['transitions']
+    sink_1 = __accepting_sink(dfa_1)
+    sink_2 = __accepting_sink(dfa_2)
+    accepting_1 = dfa_1['accepting_states']
+    accepting_2 = dfa_2['accepting_states']
+
+    # union-find on the disjoint union of the states, (1, s) and (2, t)
+    leader = dict()
+
+    def find(x):
+        root = x
+        while leader.get(root, root) != root:
+            root = leader[root]
+        while x != root:
+            leader[x], x = root, leader[x]
+        return root
+
     visited = set()
-    visited.add(dfa['initial_state'])
+    # search tree: (state of dfa_1, state of dfa_2, parent, action)
+    nodes = list()
+    queue = deque()
+
+    def visit(p, q, parent_node, action):
+        """ Adds (p, q) to the search, returning True if it is a
+        counterexample. """
+        if equivalence:
+            root_1 = find((1, p))
+            root_2 = find((2, q))
+            if root_1 == root_2:
+                return False
+            leader[root_1] = root_2
+        elif (p, q) in visited:
+            return False
+        else:
+            visited.add((p, q))
+        nodes.append((p, q, parent_node, action))
+        queue.append(len(nodes) - 1)
+        if equivalence:
+            return (p in accepting_1) != (q in accepting_2)
+        return p in accepting_1 and q not in accepting_2
+
+    def word_of(node):
+        word = list()
+        while nodes[node][2] is not None:
+            word.append(nodes[node][3])
+            node = nodes[node][2]
+        word.reverse()
+        return word
+
+    if visit(dfa_1['initial_state'], dfa_2['initial_state'], None, None):
+        return []
     while queue:
-        state = queue.pop(0)  # TODO note that this pop is applied to a list
-        # not like in sets
-        visited.add(state)
-        for a in dfa['alphabet']:
-            if (state, a) in dfa['transitions']:
-                if dfa['transitions'][state, a] in dfa['accepting_states']:
-                    return True
-                if dfa['transitions'][state, a] not in visited:
-                    queue.append(dfa['transitions'][state, a])
-    return False
+        node = queue.popleft()
+        p, q = nodes[node][0], nodes[node][1]
+        for a in alphabet:
+            next_1 = None
+            if p is not None:
+                next_1 = transitions_1.get(
+                    (p, a), sink_1 if a in dfa_1['alphabet'] else None)
+            next_2 = None
+            if q is not None:
+                next_2 = transitions_2.get(
+                    (q, a), sink_2 if a in dfa_2['alphabet'] else None)
+            if visit(next_1, next_2, node, a):
+                return word_of(len(nodes) - 1)
+    return None
+
+
+def dfa_equivalence_witness(dfa_1: dict, dfa_2: dict):
+    """ Returns a shortest word accepted by just one of the two
+    input DFAs, or None if they read the same language.
+
+    See :mod:`PySimpleAutomata.DFA.dfa_equivalence_check`.
+
+    :param dict dfa_1: first input DFA;
+    :param dict dfa_2: second input DFA.
+    :return: *(list)* distinguishing word, or None.
+    """
+    return __product_search(dfa_1, dfa_2, True)
+
+
+def dfa_equivalence_check(dfa_1: dict, dfa_2: dict) -> bool:
+    """ Checks if the two input DFAs read the same language,
+    returning True/False.
+
+    Two DFAs are equivalent iff their initial states are, where
+    states s and t are equivalent if s ∈ :math:`F_1` iff t ∈
+    :math:`F_2` and, for all a ∈ Σ, :math:`ρ_1(s, a)` and
+    :math:`ρ_2(t, a)` are equivalent.
+    Following Hopcroft and Karp, pairs of states are assumed
+    equivalent while they are met breadth-first from the initial
+    pair and merged with union-find, so the check takes almost
+    linear time in :math:`|S_1| + |S_2|` without building nor
+    minimizing the product.
+    Missing transitions are considered as leading to a rejecting
+    sink and the alphabet is the union of the two ones.
+
+    :param dict dfa_1: first input DFA;
+    :param dict dfa_2: second input DFA.
+    :return: *(bool)*, True if :math:`L(A_1) = L(A_2)`, False
+             otherwise.
+    """
+    return dfa_equivalence_witness(dfa_1, dfa_2) is None
+
+
+def dfa_inclusion_witness(dfa_1: dict, dfa_2: dict):
+    """ Returns a shortest word accepted by **dfa_1** but not by
+    **dfa_2**, or None if :math:`L(A_1) ⊆ L(A_2)`.
+
+    See :mod:`PySimpleAutomata.DFA.dfa_inclusion_check`.
+
+    :param dict dfa_1: first input DFA;
+    :param dict dfa_2: second input DFA.
+    :return: *(list)* counterexample word, or None.
+    """
+    return __product_search(dfa_1, dfa_2, False)
+
+
+def dfa_inclusion_check(dfa_1: dict, dfa_2: dict) -> bool:
+    """ Checks if the language read by **dfa_1** is included in the
+    one read by **dfa_2**, returning True/False.
+
+    :math:`L(A_1) ⊆ L(A_2)` iff no pair (s, t) with s ∈ :math:`F_1`
+    and t ∉ :math:`F_2` is reachable in the product of the two DFAs,
+    which is explored breadth-first on the fly, stopping at the first
+    counterexample.
+    Missing transitions are considered as leading to a rejecting
+    sink.
+
+    :param dict dfa_1: first input DFA;
+    :param dict dfa_2: second input DFA.
+    :return: *(bool)*, True if :math:`L(A_1) ⊆ L(A_2)`, False
+             otherwise.
+    """
+    return dfa_inclusion_witness(dfa_1, dfa_2) is None
 
 
 # SIDE EFFECTS
-def rename_dfa_states(dfa: dict, suffix: str):
-    """ Side effect on input! Renames all the states of the DFA
-    adding a **suffix**.
+def rename_dfa_states(dfa: dict, suffix: str, inplace: bool = True):
+    """ Side effect on input (unless **inplace** is False)! Renames
+    all the states of the DFA adding a **suffix**.
 
     It is an utility function to be used to avoid automata to have
     states with names in common.
@@ -588,7 +2262,9 @@ def rename_dfa_states(dfa: dict, suffix: str):
     Avoid suffix that can lead to special name like "as", "and",...
 
     :param dict dfa: input DFA.
-    :param str suffix: string to be added at beginning of each state name.
+    :param str suffix: string to be added at beginning of each state name;
+    :param bool inplace: if False the input is left untouched and a
+           new DFA is returned (default: True).
     """
     conversion_dict = dict()
     new_states = set()
@@ -599,8 +2275,23 @@ def rename_dfa_states(dfa: dict, suffix: str):
         if state in dfa['accepting_states']:
             new_accepting.add('' + suffix + state)
 
+    if inplace:
+        adjacency.invalidate(dfa)
+    else:
+        dfa = {
+            'alphabet': dfa['alphabet'].copy(),
+            'states': None,
+            'initial_state': dfa['initial_state'],
+            'accepting_states': None,
+            'transitions': dfa['transitions'],
+            'implicit_sink': dfa.get('implicit_sink')
+        }
     dfa['states'] = new_states
     dfa['initial_state'] = '' + suffix + dfa['initial_state']
+    if dfa.get('implicit_sink') is not None:
+        dfa['implicit_sink'] = conversion_dict[dfa['implicit_sink']]
+    else:
+        dfa.pop('implicit_sink', None)
     dfa['accepting_states'] = new_accepting
 
     new_transitions = dict()
@@ -29,7 +29,178 @@ In this module a NFA is defined as follows
 
 """
 
+import itertools
+from collections import deque
+
 from PySimpleAutomata import DFA
+from PySimpleAutomata import adjacency
+from PySimpleAutomata import search
+
+
+class CompiledNFA:
+    """ Bitset representation of a NFA, built by
+    :mod:`PySimpleAutomata.NFA.compile_nfa`.
+
+    States are numbered and a set of states is a Python int whose
+    bit i is set iff state i belongs to the set. For each symbol a
+    the successors of every single state are precomputed as masks,
+    so the successors of a set of states are the OR of the masks of
+    its bits and the acceptance test is :math:`mask\\ \\&\\ F ≠ 0`.
+
+    :mod:`PySimpleAutomata.NFA.nfa_word_acceptance`,
+    :mod:`PySimpleAutomata.NFA.nfa_nonemptiness_check` and
+    :mod:`PySimpleAutomata.NFA.nfa_determinization` automatically use
+    the bitset algorithms when they receive a compiled NFA.
+    Transitions over symbols not in the alphabet are ignored.
+
+    Attributes:
+
+      • states           => tuple(), state names indexed by state id;
+      • alphabet         => tuple(), symbols indexed by symbol id;
+      • state_index      => dict(), state name -> state id;
+      • symbol_index     => dict(), symbol -> symbol id;
+      • initial_states   => int, mask of the initial states;
+      • accepting_states => int, mask of the accepting states;
+      • table            => list(), table[a][s] is the mask of the
+        states reached from state s reading symbol a;
+      • post             => list(), post[s] is the mask of the states
+        reached from state s reading any symbol.
+    """
+
+    __slots__ = ('states', 'alphabet', 'state_index', 'symbol_index',
+                 'initial_states', 'accepting_states', 'table', 'post')
+
+    def __init__(self, nfa: dict):
+        states = list()
+        state_index = dict()
+
+        def index_state(state):
+            if state not in state_index:
+                state_index[state] = len(states)
+                states.append(state)
+
+        for state in nfa['states']:
+            index_state(state)
+        for state in nfa['initial_states']:
+            index_state(state)
+        for (state, action), destinations in nfa['transitions'].items():
+            index_state(state)
+            for destination in destinations:
+                index_state(destination)
+
+        self.alphabet = tuple(nfa['alphabet'])
+        self.symbol_index = {a: i for i, a in enumerate(self.alphabet)}
+        self.states = tuple(states)
+        self.state_index = state_index
+
+        self.table = [[0] * len(states) for _ in self.alphabet]
+        self.post = [0] * len(states)
+        for (state, action), destinations in nfa['transitions'].items():
+            if action not in self.symbol_index:
+                continue
+            mask = self.mask(destinations)
+            self.table[self.symbol_index[action]][state_index[state]] |= mask
+            self.post[state_index[state]] |= mask
+
+        self.initial_states = self.mask(nfa['initial_states'])
+        self.accepting_states = self.mask(
+            s for s in nfa['accepting_states'] if s in state_index)
+
+    @classmethod
+    def from_tables(cls, states, alphabet, initial_states: int,
+                    accepting_states: int, table: list, state_index=None):
+        """ Returns a compiled NFA made of already built masks; the
+        masks of the successors of each state reading any symbol are
+        computed from **table**.
+
+        :param states: sequence of the state names indexed by state id;
+        :param alphabet: sequence of the symbols indexed by symbol id;
+        :param int initial_states: mask of the initial states;
+        :param int accepting_states: mask of the accepting states;
+        :param list table: table[a][s] is the mask of the states
+                           reached from state s reading symbol a;
+        :param state_index: mapping state name -> state id (default:
+                            a dict built from **states**).
+        :return: *(CompiledNFA)* the compiled NFA.
+        """
+        if state_index is None:
+            state_index = {state: i for i, state in enumerate(states)}
+        compiled_nfa = cls.__new__(cls)
+        compiled_nfa.states = states
+        compiled_nfa.alphabet = tuple(alphabet)
+        compiled_nfa.state_index = state_index
+        compiled_nfa.symbol_index = {a: i for i, a
+                                     in enumerate(compiled_nfa.alphabet)}
+        compiled_nfa.initial_states = initial_states
+        compiled_nfa.accepting_states = accepting_states
+        compiled_nfa.table = table
+        post = [0] * len(states)
+        for row in table:
+            for s, mask in enumerate(row):
+                if mask:
+                    post[s] |= mask
+        compiled_nfa.post = post
+        return compiled_nfa
+
+    def mask(self, states) -> int:
+        """ Returns the mask of a collection of state names. """
+        mask = 0
+        state_index = self.state_index
+        for state in states:
+            mask |= 1 << state_index[state]
+        return mask
+
+    def states_of(self, mask: int) -> set:
+        """ Returns the set of state names of a mask. """
+        states = set()
+        while mask:
+            low = mask & -mask
+            states.add(self.states[low.bit_length() - 1])
+            mask ^= low
+        return states
+
+    @staticmethod
+    def _union(row: list, mask: int) -> int:
+        # OR of row[s] for each bit s set in mask
+        result = 0
+        while mask:
+            low = mask & -mask
+            result |= row[low.bit_length() - 1]
+            mask ^= low
+        return result
+
+    def step(self, mask: int, action) -> int:
+        """ Returns the mask of the states reached from the states in
+        **mask** reading **action** (0 if action is not a symbol). """
+        a = self.symbol_index.get(action)
+        if a is None:
+            return 0
+        return CompiledNFA._union(self.table[a], mask)
+
+    def accepts(self, word: list) -> bool:
+        """ Checks if **word** is accepted. """
+        table = self.table
+        symbol_index = self.symbol_index
+        union = CompiledNFA._union
+        mask = self.initial_states
+        for action in word:
+            a = symbol_index.get(action)
+            if a is None:
+                return False
+            mask = union(table[a], mask)
+            if mask == 0:
+                return False
+        return mask & self.accepting_states != 0
+
+
+def compile_nfa(nfa: dict) -> CompiledNFA:
+    """ Returns a :class:`CompiledNFA`, representing sets of states of
+    the input NFA as int bitmasks.
+
+    :param dict nfa: input NFA.
+    :return: *(CompiledNFA)* compiled version of the input NFA.
+    """
+    return CompiledNFA(nfa)
 
 
 def nfa_intersection(nfa_1: dict, nfa_2: dict) -> dict:
@@ -142,8 +313,155 @@ def nfa_union(nfa_1: dict, nfa_2: dict) -> dict:
     return union
 
 
+class LazyDFA:
+    """ DFA determinizing a NFA on demand, built by
+    :mod:`PySimpleAutomata.NFA.nfa_lazy_determinization`.
+
+    DFA states are the bitmasks of a :class:`CompiledNFA`; a DFA
+    transition is computed from the NFA only the first time a word
+    needs it and then cached. When the cache holds
+    **max_transitions** transitions it is flushed and filled again,
+    so memory stays bounded whatever the size of the full DFA.
+    After a warm-up reading words from the same corpus, almost all
+    the symbols cost a single dictionary lookup, as in a DFA.
+
+    Attributes:
+
+      • nfa             => CompiledNFA, the NFA being determinized;
+      • max_transitions => int, maximum number of cached transitions;
+      • transitions     => dict(), cache (mask, symbol) -> mask;
+      • hits            => int, transitions found in cache;
+      • misses          => int, transitions computed from the NFA;
+      • resets          => int, times the cache has been flushed.
+    """
+
+    __slots__ = ('nfa', 'max_transitions', 'transitions', 'hits',
+                 'misses', 'resets')
+
+    def __init__(self, nfa, max_transitions: int = 100000):
+        if not isinstance(nfa, CompiledNFA):
+            nfa = CompiledNFA(nfa)
+        if max_transitions < 1:
+            raise ValueError('max_transitions must be positive')
+        self.nfa = nfa
+        self.max_transitions = max_transitions
+        self.transitions = dict()
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """ Fraction of the transitions found in cache (0 if none
+        was requested yet). """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def step(self, mask: int, action) -> int:
+        """ Returns the DFA state reached from **mask** reading
+        **action**, computing and caching it if needed. """
+        key = (mask, action)
+        next_mask = self.transitions.get(key)
+        if next_mask is not None:
+            self.hits += 1
+            return next_mask
+        self.misses += 1
+        next_mask = self.nfa.step(mask, action)
+        if len(self.transitions) >= self.max_transitions:
+            self.transitions.clear()
+            self.resets += 1
+        self.transitions[key] = next_mask
+        return next_mask
+
+    def accepts(self, word: list) -> bool:
+        """ Checks if **word** is accepted. """
+        step = self.step
+        mask = self.nfa.initial_states
+        for action in word:
+            mask = step(mask, action)
+            if mask == 0:
+                return False
+        return mask & self.nfa.accepting_states != 0
+
+
+def nfa_lazy_determinization(nfa: dict,
+                             max_transitions: int = 100000) -> LazyDFA:
+    """ Returns a :class:`LazyDFA`, a DFA equivalent to the input NFA
+    whose states and transitions are built only when a word reaches
+    them.
+
+    Unlike :mod:`PySimpleAutomata.NFA.nfa_determinization` it never
+    pays for the exponential construction of the whole DFA, while
+    reading many words it converges to the speed of a DFA instead of
+    simulating the NFA on sets of states for each word.
+    The LazyDFA can be given to
+    :mod:`PySimpleAutomata.NFA.nfa_word_acceptance` in place of the NFA.
+
+    :param dict nfa: input NFA (or :class:`CompiledNFA`);
+    :param int max_transitions: maximum number of cached transitions
+           before the cache is flushed (default: 100000).
+    :return: *(LazyDFA)* lazily determinized NFA.
+    """
+    return LazyDFA(nfa, max_transitions)
+
+
+def __bitset_determinization(nfa: CompiledNFA, state_name,
+                             return_mapping: bool):
+    """ Subset construction over a compiled NFA, where subsets are
+    bitmasks.
+
+    :param CompiledNFA nfa: input compiled NFA;
+    :param state_name: function naming a DFA state given the
+           frozenset of NFA states and its progressive number;
+    :param bool return_mapping: if True returns also the mapping from
+           DFA states to frozensets of NFA states.
+    :return: *(dict)* representing a DFA, or *(dict, dict)*.
+    """
+    dfa = {
+        'alphabet': set(nfa.alphabet),
+        'initial_state': None,
+        'states': set(),
+        'accepting_states': set(),
+        'transitions': dict()
+    }
+    mapping = dict()
+    names = dict()
+
+    def add_state(mask):
+        subset = frozenset(nfa.states_of(mask))
+        name = state_name(subset, len(names))
+        names[mask] = name
+        mapping[name] = subset
+        dfa['states'].add(name)
+        if mask & nfa.accepting_states:
+            dfa['accepting_states'].add(name)
+
+    if nfa.initial_states:
+        add_state(nfa.initial_states)
+        dfa['initial_state'] = names[nfa.initial_states]
+
+    queue = deque()
+    queue.append(nfa.initial_states)
+    while queue:
+        current_mask = queue.popleft()
+        for a, action in enumerate(nfa.alphabet):
+            next_mask = CompiledNFA._union(nfa.table[a], current_mask)
+            if next_mask == 0:
+                continue
+            if next_mask not in names:
+                add_state(next_mask)
+                queue.append(next_mask)
+            dfa['transitions'][names[current_mask], action] = \
+                names[next_mask]
+
+    if return_mapping:
+        return dfa, mapping
+    return dfa
+
+
 # NFA to DFA
-def nfa_determinization(nfa: dict) -> dict:
+def nfa_determinization(nfa: dict, state_names: str = 'string',
+                        return_mapping: bool = False):
     """ Returns a DFA that reads the same language of the input NFA.
 
     Let A be an NFA, then there exists a DFA :math:`A_d` such
@@ -164,11 +482,40 @@ def nfa_determinization(nfa: dict) -> dict:
       sets of states that intersect F nontrivially;
     • :math:`ρ_d(Q, a) = \{s' | (s,a, s' ) ∈ ρ\ for\ some\ s ∈ Q\}`.
 
-    :param dict nfa: input NFA.
-    :return: *(dict)* representing a DFA
+    Subsets are discovered in breadth-first order through a worklist
+    and indexed by a hash table, so each DFA state and transition is
+    built in constant time with respect to the number of DFA states.
+
+    DFA states can be named:
+
+     • 'string': by the string of the NFA states set (default);
+     • 'integer': by consecutive integers, 0 being the initial state;
+     • 'frozenset': by the frozenset of NFA states itself.
+
+    When the input is a :class:`CompiledNFA` the sets of states are
+    handled as bitmasks.
+
+    :param dict nfa: input NFA (or :class:`CompiledNFA`);
+    :param str state_names: 'string', 'integer' or 'frozenset';
+    :param bool return_mapping: if True returns also the mapping from
+           each DFA state to the frozenset of NFA states it represents.
+    :return: *(dict)* representing a DFA, or *(dict, dict)* DFA and
+             mapping when **return_mapping** is True.
     """
-    def state_name(s):
-        return str(set(sorted(s)))
+    if state_names == 'string':
+        def state_name(s, i):
+            return str(set(sorted(s)))
+    elif state_names == 'integer':
+        def state_name(s, i):
+            return i
+    elif state_names == 'frozenset':
+        def state_name(s, i):
+            return s
+    else:
+        raise ValueError('unknown state names: ' + str(state_names))
+
+    if isinstance(nfa, CompiledNFA):
+        return __bitset_determinization(nfa, state_name, return_mapping)
 
     dfa = {
         'alphabet': nfa['alphabet'].copy(),
@@ -177,37 +524,51 @@ def nfa_determinization(nfa: dict) -> dict:
         'accepting_states': set(),
         'transitions': dict()
     }
-
-    if len(nfa['initial_states']) > 0:
-        dfa['initial_state'] = state_name(nfa['initial_states'])
-        dfa['states'].add(state_name(nfa['initial_states']))
-
-    sets_states = list()
-    sets_queue = list()
-    sets_queue.append(nfa['initial_states'])
-    sets_states.append(nfa['initial_states'])
-    if len(sets_states[0].intersection(nfa['accepting_states'])) > 0:
-        dfa['accepting_states'].add(state_name(sets_states[0]))
-
-    while sets_queue:
-        current_set = sets_queue.pop(0)
-        for a in dfa['alphabet']:
-            next_set = set()
-            for state in current_set:
-                if (state, a) in nfa['transitions']:
-                    for next_state in nfa['transitions'][state, a]:
-                        next_set.add(next_state)
+    mapping = dict()
+
+    # successors index: state -> [(action, set of arriving states)]
+    successors = dict()
+    for (state, action), destinations in nfa['transitions'].items():
+        if action in dfa['alphabet']:
+            successors.setdefault(state, list()).append(
+                (action, destinations))
+
+    # subset of NFA states -> DFA state name
+    names = dict()
+
+    def add_state(subset):
+        name = state_name(subset, len(names))
+        names[subset] = name
+        mapping[name] = subset
+        dfa['states'].add(name)
+        if not subset.isdisjoint(nfa['accepting_states']):
+            dfa['accepting_states'].add(name)
+        return name
+
+    initial_set = frozenset(nfa['initial_states'])
+    if len(initial_set) > 0:
+        dfa['initial_state'] = add_state(initial_set)
+
+    queue = deque()
+    queue.append(initial_set)
+    while queue:
+        current_set = queue.popleft()
+        next_sets = dict()
+        for state in current_set:
+            for action, destinations in successors.get(state, ()):
+                next_sets.setdefault(action, set()).update(destinations)
+        for action, next_set in next_sets.items():
             if len(next_set) == 0:
                 continue
-            if next_set not in sets_states:
-                sets_states.append(next_set)
-                sets_queue.append(next_set)
-                dfa['states'].add(state_name(next_set))
-                if next_set.intersection(nfa['accepting_states']):
-                    dfa['accepting_states'].add(state_name(next_set))
-
-            dfa['transitions'][state_name(current_set), a] = state_name(next_set)
-
+            next_set = frozenset(next_set)
+            if next_set not in names:
+                add_state(next_set)
+                queue.append(next_set)
+            dfa['transitions'][names[current_set], action] = \
+                names[next_set]
+
+    if return_mapping:
+        return dfa, mapping
     return dfa
 
 
@@ -229,6 +590,47 @@ def nfa_complementation(nfa: dict) -> dict:
     return DFA.dfa_complementation(determinized_nfa)
 
 
+def nfa_nonemptiness_witness(nfa: dict):
+    """ Returns a shortest nonempty word accepted by the input NFA,
+    or None if there is none.
+
+    See :mod:`PySimpleAutomata.NFA.nfa_nonemptiness_check`.
+
+    :param dict nfa: input NFA (or :class:`CompiledNFA`).
+    :return: *(list)* accepted word, or None.
+    """
+    if isinstance(nfa, CompiledNFA):
+        table = nfa.table
+        alphabet = nfa.alphabet
+        accepting_states = nfa.accepting_states
+
+        def successors(state):
+            for a, action in enumerate(alphabet):
+                next_states = table[a][state]
+                while next_states:
+                    low = next_states & -next_states
+                    next_states ^= low
+                    yield action, low.bit_length() - 1
+
+        return search.shortest_accepted_word(
+            [i for i in range(len(nfa.states))
+             if (nfa.initial_states >> i) & 1],
+            successors,
+            lambda state: (1 << state) & accepting_states != 0)
+
+    alphabet = nfa['alphabet']
+    index = adjacency.nfa_successors(nfa)
+
+    def successors(state):
+        for a, next_state in index.get(state, ()):
+            if a in alphabet:
+                yield a, next_state
+
+    return search.shortest_accepted_word(
+        nfa['initial_states'], successors,
+        nfa['accepting_states'].__contains__)
+
+
 def nfa_nonemptiness_check(nfa: dict) -> bool:
     """ Checks if the input NFA reads any language other than the
     empty one, returning True/False.
@@ -241,28 +643,263 @@ def nfa_nonemptiness_check(nfa: dict) -> bool:
     A breadth-first-search algorithm can construct in linear time
     the set of all states connected to a state in :math:`S_0`. A
     is nonempty iff this set intersects F nontrivially.
+    Just nonempty words are considered.
 
-    :param dict nfa: input NFA.
+    When the input is a :class:`CompiledNFA` the set of visited
+    states is a bitmask.
+
+    :param dict nfa: input NFA (or :class:`CompiledNFA`).
     :return: *(bool)*, True if the input nfa is nonempty, False
              otherwise.
     """
-    # BFS
-    queue = list()
-    visited = set()
-    for state in nfa['initial_states']:
-        visited.add(state)
-        queue.append(state)
+    if isinstance(nfa, CompiledNFA):
+        # states reachable reading at least one symbol
+        post = nfa.post
+        visited = 0
+        frontier = CompiledNFA._union(post, nfa.initial_states)
+        while frontier:
+            visited |= frontier
+            frontier = CompiledNFA._union(post, frontier) & ~visited
+        return visited & nfa.accepting_states != 0
+
+    return nfa_nonemptiness_witness(nfa) is not None
+
+
+def __co_reachable_states(nfa: dict) -> set:
+    """ Returns the set of states of the NFA reaching a final state,
+    visiting backward the transitions from the accepting states.
+
+    :param dict nfa: input NFA.
+    :return: *(set)* of co-reachable states.
+    """
+    co_reachable_states = set(nfa['accepting_states'])
+    boundary = list(co_reachable_states)
+
+    predecessors = adjacency.nfa_predecessors(nfa)
+    while boundary:
+        s = boundary.pop()
+        for action, state in predecessors.get(s, ()):
+            if state not in co_reachable_states:
+                boundary.append(state)
+                co_reachable_states.add(state)
+    return co_reachable_states
+
+
+def nfa_intersection_nonemptiness_witness(nfas: list, prune: bool = True):
+    """ Returns a nonempty word accepted by all the input NFAs, or
+    None if the intersection of their languages has no such word.
+
+    See :mod:`PySimpleAutomata.NFA.nfa_intersection_nonemptiness_check`.
+
+    :param list nfas: input NFAs;
+    :param bool prune: if True (default) tuples with a component
+           state not reaching a final state are not explored.
+    :return: *(list)* accepted word, or None.
+    """
+    if not nfas:
+        raise ValueError('at least one NFA is required')
+    alphabet = set.intersection(*[set(nfa['alphabet']) for nfa in nfas])
+
+    # outgoing transitions of each state, restricted to alive states
+    outgoing = list()
+    for nfa in nfas:
+        alive = __co_reachable_states(nfa) if prune else None
+        state_outgoing = dict()
+        for (state, a), next_states in nfa['transitions'].items():
+            if a not in alphabet:
+                continue
+            if alive is not None:
+                next_states = next_states.intersection(alive)
+            if next_states:
+                state_outgoing.setdefault(state, dict())[a] = next_states
+        outgoing.append(state_outgoing)
+    accepting = [nfa['accepting_states'] for nfa in nfas]
+    no_transitions = dict()
+
+    def successors(states):
+        rows = [outgoing[i].get(state, no_transitions)
+                for i, state in enumerate(states)]
+        smallest = min(rows, key=len)
+        for a in smallest:
+            next_states = list()
+            for row in rows:
+                if a not in row:
+                    break
+                next_states.append(row[a])
+            else:
+                for next_state in itertools.product(*next_states):
+                    yield a, next_state
+
+    def jointly_accepting(states):
+        for i, state in enumerate(states):
+            if state not in accepting[i]:
+                return False
+        return True
+
+    return search.accepted_word(
+        itertools.product(*[nfa['initial_states'] for nfa in nfas]),
+        successors, jointly_accepting)
+
+
+def nfa_intersection_nonemptiness_check(nfas: list,
+                                        prune: bool = True) -> bool:
+    """ Checks if the intersection of the languages read by the input
+    NFAs is nonempty, returning True/False.
+
+    Equivalent to checking the nonemptiness of the NFA obtained
+    chaining :mod:`PySimpleAutomata.NFA.nfa_intersection`, but the
+    product is never built: tuples of component states are explored
+    depth-first, generating their transitions when needed, until a
+    tuple where all the components accept is reached.
+    With **prune** states not reaching a final state are removed
+    from the successors of each NFA before the search, so no tuple
+    with a dead component is ever generated.
+    Just nonempty words are considered.
+
+    :param list nfas: input NFAs;
+    :param bool prune: if True (default) tuples with a component
+           state not reaching a final state are not explored.
+    :return: *(bool)*, True if the intersection is nonempty, False
+             otherwise.
+    """
+    return nfa_intersection_nonemptiness_witness(nfas, prune) is not None
+
+
+def __antichain_inclusion(nfa_1: CompiledNFA, nfa_2: CompiledNFA,
+                          include_empty_word: bool = True):
+    """ Searches a shortest word accepted by **nfa_1** and not by
+    **nfa_2**, returning it or None if :math:`L(A_1) ⊆ L(A_2)`.
+
+    The product of :math:`A_1` with the subset construction of
+    :math:`A_2` is explored breadth-first on the fly: its states are
+    pairs (p, Q), p state of :math:`A_1` and Q set of states of
+    :math:`A_2`, and (p, Q) is a counterexample if p ∈ :math:`F_1`
+    and :math:`Q ∩ F_2 = ∅`.
+    A pair (p, Q) is pruned if a pair (p, Q') with Q' ⊆ Q has
+    already been found: every word leading (p, Q) to a
+    counterexample leads there also (p, Q'). So just an antichain of
+    ⊆-minimal sets is kept for each p.
+
+    :param CompiledNFA nfa_1: first compiled NFA;
+    :param CompiledNFA nfa_2: second compiled NFA;
+    :param bool include_empty_word: if False the empty word is not
+           considered as counterexample.
+    :return: *(list)* counterexample word, or None.
+    """
+    accepting_1 = nfa_1.accepting_states
+    accepting_2 = nfa_2.accepting_states
+    # antichain: state of nfa_1 -> list of minimal masks of nfa_2
+    antichain = dict()
+    # search tree: (state of nfa_1, mask of nfa_2, parent, action)
+    nodes = list()
+    queue = deque()
+
+    def word_of(node):
+        word = list()
+        while nodes[node][2] is not None:
+            word.append(nodes[node][3])
+            node = nodes[node][2]
+        word.reverse()
+        return word
+
+    def visit(p, mask, parent, action, check):
+        """ Adds (p, mask) to the search unless subsumed, returning
+        True if it is a counterexample. """
+        minimal = antichain.setdefault(p, list())
+        for other in minimal:
+            if other & ~mask == 0:
+                return False
+        if check:
+            minimal[:] = [other for other in minimal if mask & ~other != 0]
+            minimal.append(mask)
+        nodes.append((p, mask, parent, action))
+        queue.append(len(nodes) - 1)
+        return check and (1 << p) & accepting_1 != 0 \
+            and mask & accepting_2 == 0
+
+    initial_states = nfa_1.initial_states
+    while initial_states:
+        low = initial_states & -initial_states
+        initial_states ^= low
+        if visit(low.bit_length() - 1, nfa_2.initial_states, None, None,
+                 include_empty_word):
+            return []
+
     while queue:
-        state = queue.pop(0)
-        visited.add(state)
-        for a in nfa['alphabet']:
-            if (state, a) in nfa['transitions']:
-                for next_state in nfa['transitions'][state, a]:
-                    if next_state in nfa['accepting_states']:
-                        return True
-                    if next_state not in visited:
-                        queue.append(next_state)
-    return False
+        node = queue.popleft()
+        (p, mask, parent, action) = nodes[node]
+        for a, symbol in enumerate(nfa_1.alphabet):
+            successors = nfa_1.table[a][p]
+            if successors == 0:
+                continue
+            next_mask = nfa_2.step(mask, symbol)
+            while successors:
+                low = successors & -successors
+                successors ^= low
+                if visit(low.bit_length() - 1, next_mask, node, symbol,
+                         True):
+                    return word_of(len(nodes) - 1)
+    return None
+
+
+def nfa_inclusion_witness(nfa_1: dict, nfa_2: dict):
+    """ Returns a shortest word accepted by **nfa_1** but not by
+    **nfa_2**, or None if :math:`L(A_1) ⊆ L(A_2)`.
+
+    The inclusion is checked on the fly with antichains, without
+    determinizing nor complementing :math:`A_2`, stopping at the first
+    counterexample (see :mod:`PySimpleAutomata.NFA.nfa_inclusion_check`).
+
+    :param dict nfa_1: first input NFA (or :class:`CompiledNFA`);
+    :param dict nfa_2: second input NFA (or :class:`CompiledNFA`).
+    :return: *(list)* counterexample word, or None.
+    """
+    if not isinstance(nfa_1, CompiledNFA):
+        nfa_1 = CompiledNFA(nfa_1)
+    if not isinstance(nfa_2, CompiledNFA):
+        nfa_2 = CompiledNFA(nfa_2)
+    return __antichain_inclusion(nfa_1, nfa_2)
+
+
+def nfa_inclusion_check(nfa_1: dict, nfa_2: dict) -> bool:
+    """ Checks if the language read by **nfa_1** is included in the
+    one read by **nfa_2**, returning True/False.
+
+    :math:`L(A_1) ⊆ L(A_2)` iff :math:`L(A_1) ∩ \overline{L(A_2)} = ∅`.
+    Instead of building the complement of :math:`A_2`, the sets of
+    states :math:`A_2` can be in while :math:`A_1` reads a word are
+    generated on the fly, keeping only the ⊆-minimal ones (an
+    antichain): if a word is a counterexample starting from a set Q
+    it is so also from any subset of Q.
+
+    :param dict nfa_1: first input NFA (or :class:`CompiledNFA`);
+    :param dict nfa_2: second input NFA (or :class:`CompiledNFA`).
+    :return: *(bool)*, True if :math:`L(A_1) ⊆ L(A_2)`, False
+             otherwise.
+    """
+    return nfa_inclusion_witness(nfa_1, nfa_2) is None
+
+
+def nfa_nonuniversality_witness(nfa: dict):
+    """ Returns a shortest word over the alphabet of the input NFA
+    which is not accepted by it, or None if it is universal.
+
+    As :mod:`PySimpleAutomata.NFA.nfa_nonuniversality_check`, just
+    nonempty words are considered.
+
+    :param dict nfa: input NFA (or :class:`CompiledNFA`).
+    :return: *(list)* word not accepted, or None.
+    """
+    if not isinstance(nfa, CompiledNFA):
+        nfa = CompiledNFA(nfa)
+    universal = CompiledNFA({
+        'alphabet': set(nfa.alphabet),
+        'states': {0},
+        'initial_states': {0},
+        'accepting_states': {0},
+        'transitions': {(0, action): {0} for action in nfa.alphabet}
+    })
+    return __antichain_inclusion(universal, nfa, include_empty_word=False)
 
 
 def nfa_nonuniversality_check(nfa: dict) -> bool:
@@ -271,23 +908,17 @@ def nfa_nonuniversality_check(nfa: dict) -> bool:
     True/False.
 
     To test nfa A for nonuniversality, it suffices to test Ā (
-    complementary automaton of A) for nonemptiness
+    complementary automaton of A) for nonemptiness.
+    Ā is not built: the sets of states reachable by the subset
+    construction are explored “on-the-fly”, discarding the ones
+    including an already found set (antichain), until a set
+    without accepting states is found.
 
     :param dict nfa: input NFA.
     :return: *(bool)*, True if input nfa is nonuniversal,
              False otherwise.
     """
-    # NAIVE Very inefficient (exponential space) : simply
-    # construct Ā and then test its nonemptiness
-    complemented_nfa = nfa_complementation(nfa)
-    return DFA.dfa_nonemptiness_check(complemented_nfa)
-
-    # EFFICIENT:
-    # construct Ā “on-the-fly”: whenever the nonemptiness
-    # algorithm wants to move from a state t_1 of Ā to a state t_2,
-    # the algorithm guesses t_2 and checks that it is directly
-    # connected to t_1 . Once this has been verified,
-    # the algorithm can discard t_1 .
+    return nfa_nonuniversality_witness(nfa) is not None
 
 
 def nfa_interestingness_check(nfa: dict) -> bool:
@@ -311,10 +942,16 @@ def nfa_word_acceptance(nfa: dict, word: list) -> bool:
     The word w is accepted by a NFA if exists at least an
     accepting run on w.
 
-    :param dict nfa: input NFA;
+    When the input is a :class:`CompiledNFA` the current set of states
+    is a bitmask; a :class:`LazyDFA` reads the word with its cached
+    transitions.
+
+    :param dict nfa: input NFA (or :class:`CompiledNFA`, :class:`LazyDFA`);
     :param list word: list of symbols ∈ nfa['alphabet'];
     :return: *(bool)*, True if the word is accepted, False otherwise.
     """
+    if isinstance(nfa, (CompiledNFA, LazyDFA)):
+        return nfa.accepts(word)
     current_level = set()
     current_level = current_level.union(nfa['initial_states'])
     next_level = set()
@@ -334,9 +971,9 @@ def nfa_word_acceptance(nfa: dict, word: list) -> bool:
 
 
 # SIDE EFFECTS
-def rename_nfa_states(nfa: dict, suffix: str):
-    """ Side effect on input! Renames all the states of the NFA
-    adding a **suffix**.
+def rename_nfa_states(nfa: dict, suffix: str, inplace: bool = True):
+    """ Side effect on input (unless **inplace** is False)! Renames
+    all the states of the NFA adding a **suffix**.
 
     It is an utility function to be used to avoid automata to have
     states with names in common.
@@ -344,7 +981,9 @@ def rename_nfa_states(nfa: dict, suffix: str):
     Avoid suffix that can lead to special name like "as", "and",...
 
     :param dict nfa: input NFA.
-    :param str suffix: string to be added at beginning of each state name.
+    :param str suffix: string to be added at beginning of each state name;
+    :param bool inplace: if False the input is left untouched and a
+           new NFA is returned (default: True).
     """
     conversion_dict = {}
     new_states = set()
@@ -358,6 +997,16 @@ def rename_nfa_states(nfa: dict, suffix: str):
         if state in nfa['accepting_states']:
             new_accepting.add('' + suffix + state)
 
+    if inplace:
+        adjacency.invalidate(nfa)
+    else:
+        nfa = {
+            'alphabet': nfa['alphabet'].copy(),
+            'states': None,
+            'initial_states': None,
+            'accepting_states': None,
+            'transitions': nfa['transitions']
+        }
     nfa['states'] = new_states
     nfa['initial_states'] = new_initials
     nfa['accepting_states'] = new_accepting
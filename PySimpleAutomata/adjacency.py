@@ -0,0 +1,188 @@
+"""
+Module with the adjacency indexes shared by the automata modules.
+
+The graph algorithms on DFAs and NFAs (reachability, emptiness,
+minimization, ...) need the transitions leaving or entering a state,
+while automata store them as a dict keyed by (*state*, *action*):
+probing every symbol of the alphabet for each state costs
+:math:`O(|S| · |Σ|)` and inverting the transitions on every call
+repeats the same work.
+
+The successors and predecessors of the states are instead indexed
+once, in :math:`O(|δ|)`, as a dict
+
+    **key**: *state*
+
+    **value**: list of (*action*, *state*) pairs
+
+built the first time it is needed and then kept with the automaton.
+Automata are plain dicts, which hold no attribute nor weak
+reference, so the indexes are attached to the set of states of the
+automaton instead: they are dropped as soon as that set is, and do
+not keep the automaton alive.
+An index is used while the automaton has the same transitions dict,
+with the same size.
+The library functions changing an automaton in place drop its
+indexes calling :mod:`PySimpleAutomata.adjacency.invalidate`, and so
+must do the code changing its transitions in place by other means.
+
+The kind of automaton is given by the caller, as it cannot be told
+from the transitions (the states of a DFA may be sets themselves):
+the dfa_* functions read a state for each transition, the nfa_* ones
+a set of states.
+"""
+
+import weakref
+
+
+class _Indexes:
+    """ Indexes of an automaton, built when first needed. """
+    __slots__ = ('states', 'transitions', 'size', 'built')
+
+    def __init__(self, states: weakref.ref, transitions: dict):
+        self.states = states
+        self.transitions = transitions
+        self.size = len(transitions)
+        # builder -> index
+        self.built = dict()
+
+
+# id of the set of states -> _Indexes, dropped with the set
+_cache = dict()
+
+
+def __drop(key: int, states: weakref.ref):
+    """ Drops the indexes attached to the set of states of id **key**,
+    if they are still the ones referred to by **states**. """
+    indexes = _cache.get(key)
+    if indexes is not None and indexes.states is states:
+        del _cache[key]
+
+
+def __index(automaton: dict, build) -> dict:
+    """ Returns the index built by **build** of the automaton, from
+    the cache or building and caching it. """
+    states = automaton['states']
+    transitions = automaton['transitions']
+    key = id(states)
+    indexes = _cache.get(key)
+    if indexes is None or indexes.states() is not states \
+            or indexes.transitions is not transitions \
+            or indexes.size != len(transitions):
+        try:
+            reference = weakref.ref(
+                states, lambda reference: __drop(key, reference))
+        except TypeError:
+            # states that cannot be referred to weakly are not cached
+            return build(transitions)
+        indexes = _Indexes(reference, transitions)
+        _cache[key] = indexes
+    index = indexes.built.get(build)
+    if index is None:
+        index = indexes.built[build] = build(transitions)
+    return index
+
+
+def __dfa_successors(transitions: dict) -> dict:
+    """ Builds the successors of DFA transitions. """
+    index = dict()
+    for (state, action), arriving_state in transitions.items():
+        if state in index:
+            index[state].append((action, arriving_state))
+        else:
+            index[state] = [(action, arriving_state)]
+    return index
+
+
+def __dfa_predecessors(transitions: dict) -> dict:
+    """ Builds the predecessors of DFA transitions. """
+    index = dict()
+    for (state, action), arriving_state in transitions.items():
+        if arriving_state in index:
+            index[arriving_state].append((action, state))
+        else:
+            index[arriving_state] = [(action, state)]
+    return index
+
+
+def __nfa_successors(transitions: dict) -> dict:
+    """ Builds the successors of NFA transitions. """
+    index = dict()
+    for (state, action), arrival in transitions.items():
+        entries = [(action, arriving_state) for arriving_state in arrival]
+        if state in index:
+            index[state].extend(entries)
+        else:
+            index[state] = entries
+    return index
+
+
+def __nfa_predecessors(transitions: dict) -> dict:
+    """ Builds the predecessors of NFA transitions. """
+    index = dict()
+    for (state, action), arrival in transitions.items():
+        for arriving_state in arrival:
+            if arriving_state in index:
+                index[arriving_state].append((action, state))
+            else:
+                index[arriving_state] = [(action, state)]
+    return index
+
+
+def dfa_successors(dfa: dict) -> dict:
+    """ Returns the index of the transitions leaving each state of a
+    DFA, or of any automaton whose transitions lead to a single
+    value, built at the first call and then cached.
+
+    The index is shared: it must not be modified.
+
+    :param dict dfa: input DFA.
+    :return: *(dict)* state -> list of (*action*, *arriving_state*).
+    """
+    return __index(dfa, __dfa_successors)
+
+
+def dfa_predecessors(dfa: dict) -> dict:
+    """ Returns the index of the transitions entering each state of a
+    DFA, built at the first call and then cached.
+
+    The index is shared: it must not be modified.
+
+    :param dict dfa: input DFA.
+    :return: *(dict)* state -> list of (*action*, *leaving_state*).
+    """
+    return __index(dfa, __dfa_predecessors)
+
+
+def nfa_successors(nfa: dict) -> dict:
+    """ Returns the index of the transitions leaving each state of a
+    NFA, with an entry for each arriving state, built at the first
+    call and then cached.
+
+    The index is shared: it must not be modified.
+
+    :param dict nfa: input NFA.
+    :return: *(dict)* state -> list of (*action*, *arriving_state*).
+    """
+    return __index(nfa, __nfa_successors)
+
+
+def nfa_predecessors(nfa: dict) -> dict:
+    """ Returns the index of the transitions entering each state of a
+    NFA, built at the first call and then cached.
+
+    The index is shared: it must not be modified.
+
+    :param dict nfa: input NFA.
+    :return: *(dict)* state -> list of (*action*, *leaving_state*).
+    """
+    return __index(nfa, __nfa_predecessors)
+
+
+def invalidate(automaton: dict):
+    """ Drops the cached indexes of the automaton, to be called after
+    changing its transitions in place.
+
+    :param dict automaton: input DFA or NFA.
+    """
+    _cache.pop(id(automaton['states']), None)
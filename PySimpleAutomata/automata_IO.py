@@ -2,25 +2,841 @@
 Module to mange IO
 """
 
+import gzip
+import itertools
 import json
-import graphviz
+import lzma
+import mmap
+import struct
+import sys
 import pydot
 import re
 import os
+from array import array
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from PySimpleAutomata import DFA
+from PySimpleAutomata import NFA
+from PySimpleAutomata import adjacency
+
+# Characters read at a time by the streaming JSON reader
+JSON_CHUNK_SIZE = 1 << 20
+# Transitions dumped at a time by the JSON writers
+JSON_BATCH_SIZE = 4096
+# File name extensions of the compressions handled for JSON files
+JSON_COMPRESSIONS = {None: '', 'gzip': '.gz', 'lzma': '.xz'}
+# Versions of the schema of JSON files
+JSON_VERSIONS = (1, 2)
+# Magic number, version and file name extension of the binary files
+BINARY_MAGIC = b'PSAB'
+BINARY_VERSION = 1
+BINARY_EXTENSION = '.bin'
+# Kinds of automata of the binary files
+BINARY_DFA = 0
+BINARY_NFA = 1
+# Header of the binary files: magic number, version, kind, number of
+# states, number of symbols and initial state id, followed by the
+# (offset, size) pair of each section
+__BINARY_HEADER = struct.Struct('<4sHHqqq')
+__BINARY_SECTION = struct.Struct('<QQ')
+
+
+# Regular expressions of the native DOT parser, for the subset of DOT
+# written by the exporters: whitespace and comments, IDs (unquoted or
+# quoted), and a whole node, edge, default attributes or graph
+# attribute statement
+__DOT_COMMENT = (r'(?://[^\n]*(?![^\n])|/\*(?:[^*]|\*(?!/))*\*/|'
+                 r'^#[^\n]*(?![^\n]))')
+__DOT_SPACE = r'(?:\s|' + __DOT_COMMENT + ')*'
+__DOT_ID = r'(?:"(?:[^"\\]|\\.)*"|[A-Za-z0-9_.]+(?![A-Za-z0-9_.]))'
+__DOT_HEADER = re.compile(
+    __DOT_SPACE + r'(?i:digraph)(?![A-Za-z0-9_.])' + __DOT_SPACE +
+    '(?:' + __DOT_ID + __DOT_SPACE + r')?\{', re.MULTILINE | re.DOTALL)
+__DOT_STATEMENT = re.compile(
+    __DOT_SPACE + '(?:(?P<assignment>' + __DOT_ID + __DOT_SPACE + '=' +
+    __DOT_SPACE + __DOT_ID + ')|(?P<head>' + __DOT_ID + ')' +
+    __DOT_SPACE + '(?P<tail>(?:->' + __DOT_SPACE + __DOT_ID +
+    __DOT_SPACE + ')*)(?P<attributes>(?:\\[' + __DOT_SPACE + '(?:' +
+    __DOT_ID + __DOT_SPACE + '(?:=' + __DOT_SPACE + __DOT_ID +
+    __DOT_SPACE + ')?(?:,' + __DOT_SPACE + ')?)*\\]' + __DOT_SPACE +
+    ')*));?', re.MULTILINE | re.DOTALL)
+__DOT_FOOTER = re.compile(__DOT_SPACE + r'\}' + __DOT_SPACE + r'\Z',
+                          re.MULTILINE | re.DOTALL)
+# IDs and '=' in the tail of an edge statement or in attribute lists,
+# skipping the comments
+__DOT_TOKEN = re.compile(__DOT_COMMENT + '|(' + __DOT_ID + ')|(=)',
+                         re.MULTILINE | re.DOTALL)
+# Characters removed from DOT names and labels
+__DOT_REMOVED = str.maketrans('', '', '"\'() ')
+# IDs written unquoted by the DOT writers, names and numerals as
+# graphviz does (negative numerals are quoted, for the native parser)
+__DOT_PLAIN_ID = re.compile(
+    r'(?:[A-Za-z_][A-Za-z0-9_]*|\.[0-9]+|[0-9]+(?:\.[0-9]*)?)\Z')
+__DOT_KEYWORDS = {'node', 'edge', 'graph', 'digraph', 'subgraph', 'strict'}
+# Quotes to escape in quoted IDs, leaving the escaped ones as they are
+__DOT_QUOTE = re.compile(r'((?:\\\\)*)\\?"')
+
+
+def __dot_id(token: str) -> str:
+    """ Returns a DOT ID as read by pydot: quotes are kept and the
+    escaped newlines of quoted IDs are removed. """
+    if token.startswith('"'):
+        return token.replace('\\\r\n', '').replace('\\\n', '')
+    return token
+
+
+def __dot_statements(text: str):
+    """ Yields the node and edge statements of the DOT digraph in
+    **text**, tokenizing it one statement at a time.
+
+    Nodes are yielded as (*name*, *attributes*) and edges as
+    (*source*, *destination*, *attributes*), with names and
+    attributes as returned by pydot; a chain of edges yields an edge
+    for each pair of consecutive nodes and the default attribute
+    statements are nodes named 'graph', 'node' or 'edge'.
+
+    :param str text: DOT source.
+    :raises ValueError: if the text is not in the subset of DOT
+                        handled: a single digraph without subgraphs,
+                        ports, HTML IDs or 'strict'.
+    """
+    match = __DOT_HEADER.match(text)
+    if match is None:
+        raise ValueError('unsupported DOT graph')
+    position = match.end()
+    statement = __DOT_STATEMENT.match
+    tokens = __DOT_TOKEN.findall
+    while True:
+        match = statement(text, position)
+        if match is None:
+            if __DOT_FOOTER.match(text, position) is None:
+                raise ValueError('unsupported DOT statement at ' +
+                                 str(position))
+            return
+        position = match.end()
+        if match.group('assignment') is not None:
+            continue
+
+        attributes = dict()
+        if match.group('attributes'):
+            key = None
+            assigned = False
+            for token, equal in tokens(match.group('attributes')):
+                if equal:
+                    assigned = True
+                elif token:
+                    if assigned:
+                        attributes[key] = __dot_id(token)
+                        assigned = False
+                        key = None
+                    else:
+                        key = __dot_id(token)
+                        attributes[key] = None
+
+        head = match.group('head')
+        keyword = head.lower()
+        if keyword in ('node', 'edge', 'graph'):
+            if match.group('tail'):
+                raise ValueError('unsupported DOT statement at ' +
+                                 str(match.start('head')))
+            yield keyword, attributes
+        elif keyword in ('digraph', 'subgraph', 'strict'):
+            raise ValueError('unsupported DOT statement at ' +
+                             str(match.start('head')))
+        elif not match.group('tail'):
+            yield __dot_id(head), attributes
+        else:
+            source = __dot_id(head)
+            for token, _ in tokens(match.group('tail')):
+                if token:
+                    destination = __dot_id(token)
+                    yield source, destination, attributes.copy()
+                    source = destination
 
 
-def __replace_all(repls: dict, input: str) -> str:
-    """ Replaces from a string **input** all the occurrences of some
-    symbols according to mapping **repls**.
+def __dot_graph(input_file: str):
+    """ Returns the nodes and the edges of a DOT file, in the same
+    order as pydot: nodes grouped by name and edges grouped by pair
+    of nodes, both in order of first appearance.
 
-    :param dict repls: where #key is the old character and
-    #value is the one to substitute with;
-    :param str input: original string where to apply the
-    replacements;
-    :return: *(str)* the string with the desired characters replaced
+    The file is read by the native parser, and by pydot if it is not
+    in the subset of DOT handled.
+
+    :param str input_file: path to the DOT file;
+    :return: *(list, list)* of (*name*, *attributes*) and of
+             (*source*, *destination*, *attributes*).
     """
-    return re.sub('|'.join(re.escape(key) for key in repls.keys()),
-                  lambda k: repls[k.group(0)], input)
+    nodes = dict()
+    edges = dict()
+    try:
+        with open(input_file, encoding='utf-8') as file:
+            text = file.read()
+        for statement in __dot_statements(text):
+            if len(statement) == 2:
+                nodes.setdefault(statement[0], []).append(statement[1])
+            else:
+                edges.setdefault(statement[:2], []).append(statement[2])
+    except ValueError:
+        graph = pydot.graph_from_dot_file(input_file)[0]
+        return [(node.get_name(), node.get_attributes())
+                for node in graph.get_nodes()], \
+            [(edge.get_source(), edge.get_destination(),
+              edge.get_attributes()) for edge in graph.get_edges()]
+    return [(name, attributes)
+            for name, statements in nodes.items()
+            for attributes in statements], \
+        [(source, destination, attributes)
+         for (source, destination), statements in edges.items()
+         for attributes in statements]
+
+
+def __dot_name(name: str):
+    """ Returns the state of a DOT node name, removing quotes,
+    parentheses and spaces; names with commas are tuples. """
+    reference = name.translate(__DOT_REMOVED).split(',')
+    if len(reference) > 1:
+        return tuple(reference)
+    return reference[0]
+
+
+def __dot_quote(identifier) -> str:
+    """ Returns the DOT ID of **identifier** as string, quoted unless
+    it is a plain name or numeral, as graphviz does. """
+    identifier = str(identifier)
+    if __DOT_PLAIN_ID.match(identifier) and \
+            identifier.lower() not in __DOT_KEYWORDS:
+        return identifier
+    return '"' + __DOT_QUOTE.sub(r'\1\\"', identifier) + '"'
+
+
+def __dot_node(node: str, initial: bool, accepting: bool) -> str:
+    """ Returns the statement line of the node with DOT ID **node**,
+    marking it as root if initial and double circled if accepting. """
+    if initial:
+        if accepting:
+            return '\t' + node + ' [root=true shape=doublecircle]\n'
+        return '\t' + node + ' [root=true]\n'
+    if accepting:
+        return '\t' + node + ' [shape=doublecircle]\n'
+    return '\t' + node + '\n'
+
+
+def __dot_edge(ids: dict, source, destination, action) -> str:
+    """ Returns the statement line of the edge labeled **action**,
+    using the DOT IDs in **ids** of the known states. """
+    return '\t' + (ids.get(source) or __dot_quote(source)) + ' -> ' + \
+           (ids.get(destination) or __dot_quote(destination)) + \
+           ' [label=' + __dot_quote(action) + ']\n'
+
+
+def __to_dot(statements, name: str, path: str, direction: str,
+             render: bool, format: str, engine: str) -> str:
+    """ Writes the DOT file of a digraph streaming its **statements**,
+    rendering it on request.
+
+    :param statements: iterable of the statement lines of the digraph;
+    :param str name: name of the output file;
+    :param str path: path where to save the DOT file, created if
+                     missing;
+    :param str direction: direction of graph;
+    :param bool render: if True the file is rendered with Graphviz;
+    :param str format: format of the rendered file;
+    :param str engine: Graphviz layout engine to be used.
+    :return: *(str)* path + filename of the DOT file.
+    """
+    if not os.path.exists(path):
+        os.makedirs(path)
+    output_file = os.path.join(path, name + '.dot')
+    with open(output_file, 'w', encoding='utf-8') as out:
+        out.write('digraph {\n\tgraph [rankdir=' +
+                  __dot_quote(direction) + ']\n')
+        out.writelines(statements)
+        out.write('}\n')
+    if render:
+        __render_dot(output_file, format, engine)
+    return output_file
+
+
+def __render_dot(input_file: str, format: str, engine: str) -> str:
+    """ Renders a DOT file with Graphviz, in a file with the extension
+    of **format** appended to its name.
+
+    :param str input_file: path + filename of the DOT file;
+    :param str format: format of the rendered file;
+    :param str engine: Graphviz layout engine to be used.
+    :return: *(str)* path + filename of the rendered file.
+    """
+    import graphviz
+    return graphviz.render(engine, format, input_file)
+
+
+def __open_json(input_file: str):
+    """ Opens a JSON file for reading as text, decompressing it if it
+    starts with the magic number of gzip or of xz/lzma.
+
+    :param str input_file: path + filename to json file;
+    :return: text file object.
+    """
+    with open(input_file, 'rb') as file:
+        magic = file.read(6)
+    if magic.startswith(b'\x1f\x8b'):
+        return gzip.open(input_file, 'rt', encoding='utf-8')
+    if magic.startswith(b'\xfd7zXZ\x00') or magic.startswith(b'\x5d\x00'):
+        return lzma.open(input_file, 'rt', encoding='utf-8')
+    return open(input_file, encoding='utf-8')
+
+
+def __json_stream(file, streamed_key: str, consume,
+                  members: dict = None) -> dict:
+    """ Reads incrementally the JSON object in **file**, calling
+    **consume** on each entry of the array of **streamed_key** as
+    soon as it is read, and returns the other members.
+
+    The file is read :data:`JSON_CHUNK_SIZE` characters at a time and
+    each value is decoded as soon as it is complete, so besides the
+    result just a chunk and the entry being read are in memory.
+    A value longer than the rest of the chunk, as a long list of
+    states, is scanned for its end one chunk at a time, each
+    character once, and then decoded in one piece.
+
+    :param file: text file object;
+    :param str streamed_key: key of the array to stream;
+    :param consume: function called on each entry of the array;
+    :param dict members: dict where to store the other members, as
+                         soon as they are read (default: a new one).
+    :return: *(dict)* the members of the object but **streamed_key**.
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    skip = re.compile(r'[ \t\n\r]*').match
+    structural = re.compile(r'[][{}"]').search
+    string_end = re.compile(r'["\\]').search
+    buffer = ''
+    position = 0
+    eof = False
+
+    def read_more() -> bool:
+        """ Appends a chunk to the buffer, dropping the part already
+        read; returns False at the end of file. """
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = file.read(JSON_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def peek() -> str:
+        """ Skips the whitespace and returns the next character, or
+        the empty string at the end of file. """
+        nonlocal position
+        while True:
+            position = skip(buffer, position).end()
+            if position < len(buffer) or not read_more():
+                return buffer[position:position + 1]
+
+    def expect(characters: str) -> str:
+        """ Consumes and returns the next non-whitespace character,
+        which must be one of **characters**. """
+        nonlocal position
+        character = peek()
+        if not character:
+            raise ValueError('unexpected end of JSON file')
+        if character not in characters:
+            raise ValueError('unexpected ' + repr(character) +
+                             ' in JSON file, expected one of ' +
+                             repr(characters))
+        position += 1
+        return character
+
+    def complete_value():
+        """ Decodes the next value, an array, an object or a string,
+        which goes on past the buffer: the chunks are kept until the
+        one where it ends, carrying the state of the scan from one to
+        the next. """
+        nonlocal position
+        pieces = list()
+        start = index = position
+        depth = 0
+        in_string = False
+        while True:
+            if in_string:
+                match = string_end(buffer, index)
+            else:
+                match = structural(buffer, index)
+            if match is None:
+                pieces.append(buffer[start:])
+                # past the end when an escape is split by the chunks
+                index -= len(buffer)
+                # nothing left for read_more to keep
+                position = len(buffer)
+                if not read_more():
+                    raise ValueError('unexpected end of JSON file')
+                start = 0
+                index = max(index, 0)
+                continue
+            index = match.end()
+            character = match.group()
+            if in_string:
+                if character == '\\':
+                    # skip the escaped character
+                    index += 1
+                    continue
+                in_string = False
+            elif character == '"':
+                in_string = True
+                continue
+            elif character in '[{':
+                depth += 1
+                continue
+            else:
+                depth -= 1
+            if depth == 0:
+                break
+        pieces.append(buffer[start:index])
+        position = index
+        text = ''.join(pieces)
+        result, end = raw_decode(text)
+        if end != len(text):
+            raise ValueError('unexpected ' + repr(text[end]) +
+                             ' in JSON file')
+        return result
+
+    def value():
+        """ Decodes the next value, reading until it is complete. """
+        nonlocal position
+        character = peek()
+        if character and character in '[{"':
+            try:
+                result, end = raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                return complete_value()
+            position = end
+            return result
+        # numbers and literals are short: they are decoded again
+        # until a chunk does not continue them
+        while True:
+            try:
+                result, end = raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if read_more():
+                    continue
+                raise
+            # a number may go on in the next chunk
+            if end == len(buffer) and read_more():
+                continue
+            position = end
+            return result
+
+    if members is None:
+        members = dict()
+    expect('{')
+    if peek() == '}':
+        position += 1
+        return members
+    while True:
+        key = value()
+        expect(':')
+        if key != streamed_key:
+            members[key] = value()
+        else:
+            expect('[')
+            if peek() == ']':
+                position += 1
+            else:
+                while True:
+                    consume(value())
+                    if expect(',]') == ']':
+                        break
+        if expect(',}') == '}':
+            return members
+
+
+def __json_transitions(file, add, indexed: bool) -> dict:
+    """ Reads incrementally the JSON object of an automaton in
+    **file**, calling **add** (*origin*, *action*, *value*) on each
+    of its transitions, and returns the other members.
+
+    Both versions of the schema are read, told apart by the entries
+    of 'transitions': in version 1 each entry is an
+    [*origin*, *action*, *value*] triple, while in version 2 the
+    states and the alphabet are stored once, in 'states' and
+    'alphabet', and entry *i* is the row of the transitions leaving
+    the state of index *i*, as the flattened list of
+    [*action index*, *value*] pairs.
+    The states in the members of version 2 are decoded to names, a
+    null initial state to None.
+
+    :param file: text file object;
+    :param add: function called on each transition;
+    :param bool indexed: if True the values of version 2 are state
+                         indexes, otherwise they are kept as they are.
+    :return: *(dict)* the members of the object but 'transitions'.
+    """
+    members = dict()
+    # version 2 rows read before the tables of states and symbols
+    pending = list()
+    rows = 0
+    triples = 0
+
+    def add_row(index, row):
+        states = members['states']
+        alphabet = members['alphabet']
+        origin = states[index]
+        for i in range(0, len(row), 2):
+            value = row[i + 1]
+            add(origin, alphabet[row[i]], states[value] if indexed else value)
+
+    def consume(entry):
+        nonlocal rows, triples
+        if len(entry) == 3:
+            add(entry[0], entry[1], entry[2])
+            triples += 1
+            return
+        if 'states' in members and 'alphabet' in members:
+            add_row(rows, entry)
+        else:
+            pending.append(entry)
+        rows += 1
+
+    __json_stream(file, 'transitions', consume, members)
+    for index, row in enumerate(pending):
+        add_row(index, row)
+
+    version = members.pop('version', 1)
+    if version not in JSON_VERSIONS:
+        raise ValueError('unknown JSON schema version: ' + str(version))
+    if (version == 1 and rows) or (version == 2 and triples):
+        raise ValueError('transitions not in the JSON schema version ' +
+                         str(version))
+    if version == 2:
+        states = members['states']
+        for key in ('initial_state', 'implicit_sink'):
+            if members.get(key) is not None:
+                members[key] = states[members[key]]
+        for key in ('initial_states', 'accepting_states'):
+            if key in members:
+                members[key] = [states[i] for i in members[key]]
+    return members
+
+
+def __json_indexed(successors: dict, out: dict, indexed: bool):
+    """ Converts the members **out** of the JSON object of an
+    automaton to version 2 of the schema, referring to the states
+    by their index in 'states', and returns the generator of the rows
+    of its transitions.
+
+    A missing initial state stays None, written as null.
+    The transitions are checked before anything is written: their
+    states and symbols must be in 'states' and 'alphabet'.
+
+    :param dict successors: index of the transitions leaving each
+           state of the automaton to export;
+    :param dict out: members of the object but 'transitions';
+    :param bool indexed: if True the values of the transitions are
+                         states, to be referred to by index.
+    :return: generator of the rows of 'transitions'.
+    :raises ValueError: if a transition leaves or reaches a state not
+                        in 'states', or reads a symbol not in
+                        'alphabet'.
+    """
+    states = out['states']
+    state_index = {state: i for i, state in enumerate(states)}
+    symbol_index = {action: i for i, action in enumerate(out['alphabet'])}
+    for key in ('initial_state', 'implicit_sink'):
+        if out.get(key) is not None:
+            out[key] = state_index[out[key]]
+    for key in ('initial_states', 'accepting_states'):
+        if key in out:
+            out[key] = [state_index[state] for state in out[key]]
+    for state, outgoing in successors.items():
+        if state not in state_index:
+            raise ValueError('transition from a state not in states: ' +
+                             str(state))
+        for action, value in outgoing:
+            if action not in symbol_index:
+                raise ValueError('transition on a symbol not in '
+                                 'alphabet: ' + str(action))
+            if indexed and value not in state_index:
+                raise ValueError('transition to a state not in states: ' +
+                                 str(value))
+
+    def rows():
+        for state in states:
+            row = list()
+            for action, value in successors.get(state, ()):
+                row.append(symbol_index[action])
+                row.append(state_index[value] if indexed else value)
+            yield row
+
+    return rows()
+
+
+def __to_json(out: dict, transitions, name: str, path: str,
+              compact: bool, compression, version: int = 1):
+    """ Writes incrementally the JSON object **out** with the entries
+    yielded by **transitions** as array 'transitions', keys sorted.
+
+    The indented layout is the one of json.dump with indent=4, but
+    for the rows of version 2 which are written one per line.
+
+    :param dict out: members of the object but 'transitions';
+    :param transitions: iterable of the entries of 'transitions';
+    :param str name: name of the output file;
+    :param str path: path where to save the JSON file;
+    :param bool compact: if True no whitespace is written;
+    :param str compression: None, 'gzip' or 'lzma';
+    :param int version: version of the schema, written as member
+                        'version' if greater than 1.
+    """
+    if compression not in JSON_COMPRESSIONS:
+        raise ValueError('unknown compression: ' + str(compression))
+    if version not in JSON_VERSIONS:
+        raise ValueError('unknown JSON schema version: ' + str(version))
+    if version > 1:
+        out = dict(out, version=version)
+    if not os.path.exists(path):
+        os.makedirs(path)
+    file_name = os.path.join(
+        path, name + '.json' + JSON_COMPRESSIONS[compression])
+    if compression == 'gzip':
+        file = gzip.open(file_name, 'wt', encoding='utf-8')
+    elif compression == 'lzma':
+        file = lzma.open(file_name, 'wt', encoding='utf-8')
+    else:
+        file = open(file_name, 'w', encoding='utf-8')
+
+    if compact:
+        def dump(data, level):
+            return json.dumps(data, sort_keys=True, separators=(',', ':'))
+        opening, separator, closing = '{', ',', '}'
+        key_separator, array_closing = ':', ']'
+    else:
+        def dump(data, level):
+            return json.dumps(data, sort_keys=True, indent=4).replace(
+                '\n', '\n' + '    ' * level)
+        opening, separator, closing = '{\n    ', ',\n    ', '\n}'
+        key_separator, array_closing = ': ', '\n    ]'
+    if compact or version == 1:
+        def dump_entries(batch):
+            return dump(batch, 1)[1:-len(array_closing)]
+    else:
+        def dump_entries(batch):
+            return ''.join('\n        ' + json.dumps(row) + ','
+                           for row in batch)[:-1]
+
+    with file:
+        file.write(opening)
+        keys = sorted(list(out) + ['transitions'])
+        for i, key in enumerate(keys):
+            if i > 0:
+                file.write(separator)
+            file.write(json.dumps(key) + key_separator)
+            if key != 'transitions':
+                file.write(dump(out[key], 1))
+                continue
+            # the entries are dumped JSON_BATCH_SIZE at a time as an
+            # array, whose brackets are stripped
+            transitions = iter(transitions)
+            empty = True
+            while True:
+                batch = list(itertools.islice(transitions, JSON_BATCH_SIZE))
+                if not batch:
+                    break
+                file.write('[' if empty else ',')
+                file.write(dump_entries(batch))
+                empty = False
+            file.write('[]' if empty else array_closing)
+        file.write(closing)
+
+
+class _StringTable(Sequence):
+    """ Read-only sequence of the strings of a string table of a
+    binary file, decoded when accessed. """
+
+    __slots__ = ('offsets', 'blob')
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('string table index out of range')
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+
+class _StringIndex(Mapping):
+    """ Mapping string -> index of a :class:`_StringTable`, built at
+    the first lookup. """
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: _StringTable):
+        self.table = table
+        self.index = None
+
+    def __mapping(self) -> dict:
+        if self.index is None:
+            self.index = {string: i for i, string in enumerate(self.table)}
+        return self.index
+
+    def __getitem__(self, string):
+        return self.__mapping()[string]
+
+    def __iter__(self):
+        return iter(self.__mapping())
+
+    def __len__(self):
+        return len(self.table)
+
+
+def __string_table(strings, what: str) -> list:
+    """ Returns the sections of the string table of **strings**: the
+    offsets of the strings and their UTF-8 encoding.
+
+    :param strings: iterable of strings;
+    :param str what: name of the strings, for the error message.
+    :return: *(list)* the two sections.
+    """
+    offsets = array('q', [0])
+    blob = bytearray()
+    for string in strings:
+        if not isinstance(string, str):
+            raise ValueError('the binary format stores string ' + what +
+                             ' only, not ' + repr(string))
+        blob += string.encode('utf-8')
+        offsets.append(len(blob))
+    return [offsets, blob]
+
+
+def __to_binary(kind: int, n_states: int, n_symbols: int,
+                initial_state: int, sections: list, name: str, path: str):
+    """ Writes a binary file with the header and the sections of an
+    automaton, each section aligned to 8 bytes.
+
+    :param int kind: BINARY_DFA or BINARY_NFA;
+    :param int n_states: number of states;
+    :param int n_symbols: number of symbols;
+    :param int initial_state: id of the initial state of a DFA;
+    :param list sections: arrays and bytes-like objects;
+    :param str name: name of the output file;
+    :param str path: path where to save the file.
+    """
+    if not os.path.exists(path):
+        os.makedirs(path)
+    if sys.byteorder == 'big':
+        # the files are little-endian
+        for i, section in enumerate(sections):
+            if isinstance(section, array) and section.itemsize > 1:
+                sections[i] = array(section.typecode, section)
+                sections[i].byteswap()
+    offset = __BINARY_HEADER.size + __BINARY_SECTION.size * len(sections)
+    directory = list()
+    for section in sections:
+        offset += -offset % 8
+        size = memoryview(section).nbytes
+        directory.append(__BINARY_SECTION.pack(offset, size))
+        offset += size
+    with open(os.path.join(path, name + BINARY_EXTENSION), 'wb') as file:
+        file.write(__BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, kind,
+                                        n_states, n_symbols, initial_state))
+        file.write(b''.join(directory))
+        for section in sections:
+            file.write(b'\0' * (-file.tell() % 8))
+            file.write(section)
+
+
+def __binary_load(input_file: str, kind: int, typecodes: str):
+    """ Maps a binary file of an automaton in memory and returns its
+    header and the views of its sections, without copying them.
+
+    The views keep the file mapped: pages are read when accessed and
+    shared by the processes mapping the same file.
+    On big-endian machines the sections are copied and converted
+    instead.
+
+    :param str input_file: path + filename of the binary file;
+    :param int kind: BINARY_DFA or BINARY_NFA;
+    :param str typecodes: array typecode of each section.
+    :return: *(tuple, list)* the number of states, the number of
+             symbols and the initial state id, and the sections.
+    """
+    with open(input_file, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(input_file + ' is not a binary automaton')
+    view = memoryview(mapped)
+    if len(view) < __BINARY_HEADER.size or \
+            bytes(view[:len(BINARY_MAGIC)]) != BINARY_MAGIC:
+        raise ValueError(input_file + ' is not a binary automaton')
+    magic, version, file_kind, n_states, n_symbols, initial_state = \
+        __BINARY_HEADER.unpack_from(view)
+    if version != BINARY_VERSION:
+        raise ValueError('unknown binary format version: ' + str(version))
+    if file_kind != kind:
+        raise ValueError(input_file + ' is not a binary ' +
+                         ('DFA' if kind == BINARY_DFA else 'NFA'))
+    if len(view) < __BINARY_HEADER.size + \
+            __BINARY_SECTION.size * len(typecodes):
+        raise ValueError(input_file + ' is truncated')
+    sections = list()
+    for i, typecode in enumerate(typecodes):
+        offset, size = __BINARY_SECTION.unpack_from(
+            view, __BINARY_HEADER.size + i * __BINARY_SECTION.size)
+        if offset + size > len(view):
+            raise ValueError(input_file + ' is truncated')
+        section = view[offset:offset + size]
+        if sys.byteorder == 'big' and typecode != 'B':
+            converted = array(typecode)
+            converted.frombytes(section)
+            converted.byteswap()
+            sections.append(converted)
+        else:
+            sections.append(section.cast(typecode))
+    return (n_states, n_symbols, initial_state), sections
+
+
+def render_dot_files(input_files, format: str = 'svg', engine: str = 'dot',
+                     processes: int = None) -> list:
+    """ Renders DOT files with Graphviz, concurrently in a pool of
+    processes, each in a file with the extension of **format**
+    appended to its name (e.g. *name.dot.svg*).
+
+    :param input_files: iterable of path + filename of the DOT files,
+                        as returned by
+                        :mod:`~PySimpleAutomata.automata_IO.dfa_to_dot`
+                        and :mod:`~PySimpleAutomata.automata_IO.nfa_to_dot`;
+    :param str format: format of the rendered files (default: svg);
+    :param str engine: Graphviz layout engine to be used (default: dot);
+    :param int processes: number of processes rendering the files
+                          (default: the number of processors); with 1
+                          the files are rendered one after the other
+                          in the calling process.
+    :return: *(list)* path + filename of the rendered files, in the
+             order of **input_files**.
+    """
+    input_files = list(input_files)
+    if processes is not None and processes < 1:
+        raise ValueError('processes must be at least 1')
+    if processes == 1 or len(input_files) < 2:
+        return [__render_dot(input_file, format, engine)
+                for input_file in input_files]
+    with ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(__render_dot, input_files,
+                             itertools.repeat(format),
+                             itertools.repeat(engine)))
 
 
 ####################################################################
@@ -29,17 +845,22 @@ def __replace_all(repls: dict, input: str) -> str:
 def dfa_json_importer(input_file: str) -> dict:
     """ Imports a DFA from a JSON file.
 
+    The file is read incrementally, adding each transition as soon as
+    it is read, and may be compressed with gzip or lzma; both
+    versions of the schema are read.
+
     :param str input_file: path + filename to json file;
     :return: *(dict)* representing a DFA.
     """
-    file = open(input_file)
-    json_file = json.load(file)
-
     transitions = {}  # key [state ∈ states, action ∈ alphabet]
     #                   value [arriving state ∈ states]
-    for (origin, action, destination) in json_file['transitions']:
+
+    def add_transition(origin, action, destination):
         transitions[origin, action] = destination
 
+    with __open_json(input_file) as file:
+        json_file = __json_transitions(file, add_transition, True)
+
     dfa = {
         'alphabet': set(json_file['alphabet']),
         'states': set(json_file['states']),
@@ -47,41 +868,109 @@ def dfa_json_importer(input_file: str) -> dict:
         'accepting_states': set(json_file['accepting_states']),
         'transitions': transitions
     }
+    if 'implicit_sink' in json_file:
+        dfa['implicit_sink'] = json_file['implicit_sink']
     return dfa
 
 
-def dfa_to_json(dfa: dict, name: str, path: str = './'):
+def dfa_to_json(dfa: dict, name: str, path: str = './',
+                compact: bool = False, compression: str = None,
+                version: int = 1):
     """ Exports a DFA to a JSON file.
 
     If *path* do not exists, it will be created.
+    The transitions are written one at a time, without building the
+    whole JSON document in memory.
+    The implicit sink of the DFA, if any, is written as member
+    'implicit_sink'.
 
     :param dict dfa: DFA to export;
     :param str name: name of the output file;
     :param str path: path where to save the JSON file (default:
-                     working directory)
+                     working directory);
+    :param bool compact: if True the file is written without
+                         indentation nor whitespace (default: False);
+    :param str compression: None (default), 'gzip' or 'lzma', which
+                            add respectively .gz and .xz to the file
+                            name;
+    :param int version: version of the schema, 1 (default) or 2,
+                        which stores the states and the alphabet once
+                        and refers to them by index.
     """
     out = {
         'alphabet': list(dfa['alphabet']),
         'states': list(dfa['states']),
         'initial_state': dfa['initial_state'],
-        'accepting_states': list(dfa['accepting_states']),
-        'transitions': list()
+        'accepting_states': list(dfa['accepting_states'])
     }
+    if dfa.get('implicit_sink') is not None:
+        out['implicit_sink'] = dfa['implicit_sink']
+    if version == 2:
+        transitions = __json_indexed(
+            adjacency.dfa_successors(dfa), out, True)
+    else:
+        transitions = ([t[0], t[1], dfa['transitions'][t]]
+                       for t in dfa['transitions'])
+    __to_json(out, transitions, name, path, compact, compression, version)
+
+
+def dfa_to_binary(dfa, name: str, path: str = './'):
+    """ Exports a DFA to a binary file, to be loaded with
+    :mod:`PySimpleAutomata.automata_IO.dfa_binary_loader`.
+
+    The file holds the tables of the state and symbol names and the
+    dense transition table of :class:`PySimpleAutomata.DFA.CompiledDFA`.
+    States and symbols must be strings.
+    If *path* do not exists, it will be created.
 
-    for t in dfa['transitions']:
-        out['transitions'].append(
-            [t[0], t[1], dfa['transitions'][t]])
-
-    if not os.path.exists(path):
-        os.makedirs(path)
-    file = open(os.path.join(path, name + '.json'), 'w')
-    json.dump(out, file, sort_keys=True, indent=4)
-    file.close()
+    :param dfa: DFA to export, as dict or
+                :class:`PySimpleAutomata.DFA.CompiledDFA`;
+    :param str name: name of the output file, to which .bin is added;
+    :param str path: path where to save the binary file (default:
+                     working directory).
+    """
+    if not isinstance(dfa, DFA.CompiledDFA):
+        dfa = DFA.compile_dfa(dfa)
+    sections = __string_table(dfa.states, 'states') + \
+        __string_table(dfa.alphabet, 'symbols') + \
+        [bytes(dfa.accepting), array('i', dfa.table)]
+    __to_binary(BINARY_DFA, len(dfa.states), len(dfa.alphabet),
+                dfa.initial_state, sections, name, path)
+
+
+def dfa_binary_loader(input_file: str) -> DFA.CompiledDFA:
+    """ Loads a DFA from a binary file written by
+    :mod:`PySimpleAutomata.automata_IO.dfa_to_binary`.
+
+    The file is mapped in memory and the returned compiled DFA reads
+    its tables in place, without copying nor parsing them: loading
+    takes the same short time whatever the size of the DFA, and the
+    processes loading the same file share its pages.
+    The state names are decoded when accessed.
+
+    :param str input_file: path + filename of the binary file.
+    :return: *(CompiledDFA)* the loaded DFA.
+    """
+    (n_states, n_symbols, initial_state), sections = __binary_load(
+        input_file, BINARY_DFA, 'qBqBBi')
+    states = _StringTable(sections[0], sections[1])
+    alphabet = _StringTable(sections[2], sections[3])
+    if len(states) != n_states or len(alphabet) != n_symbols \
+            or len(sections[4]) != n_states \
+            or len(sections[5]) != n_states * n_symbols:
+        raise ValueError(input_file + ' is corrupted')
+    return DFA.CompiledDFA.from_tables(states, alphabet, initial_state,
+                                       sections[4], sections[5],
+                                       _StringIndex(states))
 
 
 def dfa_dot_importer(input_file: str) -> dict:
     """ Imports a DFA from a DOT file.
 
+    The DOT files written by the library are read by a native parser;
+    the ones out of its subset of DOT (subgraphs, ports, HTML IDs,
+    ...) are read by pydot.
+
     Of DOT files are recognized the following attributes:
 
       • nodeX   shape=doublecircle -> accepting node;
@@ -110,57 +999,42 @@ def dfa_dot_importer(input_file: str) -> dict:
     :return: *(dict)* representing a DFA.
     """
 
-    # pyDot Object
-    g = pydot.graph_from_dot_file(input_file)[0]
+    nodes, edges = __dot_graph(input_file)
 
     states = set()
     initial_state = None
     accepting_states = set()
 
-    replacements = {'"': '', "'": '', '(': '', ')': '', ' ': ''}
-    for node in g.get_nodes():
-        if node.get_name() == 'fake' \
-                or node.get_name() == 'None' \
-                or node.get_name() == 'graph' \
-                or node.get_name() == 'node':
+    # names are repeated in many edges
+    references = dict()
+    for name, attributes in nodes:
+        if name == 'fake' \
+                or name == 'None' \
+                or name == 'graph' \
+                or name == 'node':
             continue
-        if 'style' in node.get_attributes() \
-                and node.get_attributes()['style'] == 'invisible':
+        if attributes.get('style') == 'invisible':
             continue
-        node_reference = __replace_all(replacements,
-                                       node.get_name()).split(',')
-        if len(node_reference) > 1:
-            node_reference = tuple(node_reference)
-        else:
-            node_reference = node_reference[0]
+        node_reference = __dot_name(name)
+        references[name] = node_reference
         states.add(node_reference)
-        for attribute in node.get_attributes():
-            if attribute == 'root':
-                initial_state = node_reference
-            if attribute == 'shape' and node.get_attributes()[
-                'shape'] == 'doublecircle':
-                accepting_states.add(node_reference)
+        if 'root' in attributes:
+            initial_state = node_reference
+        if attributes.get('shape') == 'doublecircle':
+            accepting_states.add(node_reference)
 
     alphabet = set()
     transitions = {}
-    for edge in g.get_edges():
-        if edge.get_source() == 'fake':
+    for source, destination, attributes in edges:
+        if source == 'fake':
             continue
-        label = __replace_all(replacements, edge.get_label())
+        label = str.translate(attributes.get('label'), __DOT_REMOVED)
         alphabet.add(label)
-        source = __replace_all(replacements,
-                               edge.get_source()).split(',')
-        if len(source) > 1:
-            source = tuple(source)
-        else:
-            source = source[0]
-        destination = __replace_all(replacements,
-                                    edge.get_destination()).split(',')
-        if len(destination) > 1:
-            destination = tuple(destination)
-        else:
-            destination = destination[0]
-        transitions[source, label] = destination
+        if source not in references:
+            references[source] = __dot_name(source)
+        if destination not in references:
+            references[destination] = __dot_name(destination)
+        transitions[references[source], label] = references[destination]
 
     dfa = {
         'alphabet': alphabet,
@@ -171,9 +1045,40 @@ def dfa_dot_importer(input_file: str) -> dict:
     return dfa
 
 
-def dfa_to_dot(dfa: dict, name: str, path: str = './', direction='TB', engine='dot'):
-    """ Generates a DOT file and a relative SVG image in **path**
-    folder of the input DFA using graphviz library.
+def __dfa_dot_statements(dfa: dict):
+    """ Yields the statement lines of the DOT digraph of the DFA. """
+    initial_state = dfa['initial_state']
+    accepting_states = dfa['accepting_states']
+    ids = dict()
+    yield '\tfake [style=invisible]\n'
+    for state in dfa['states']:
+        node = ids[state] = __dot_quote(state)
+        yield __dot_node(node, state == initial_state,
+                         state in accepting_states)
+    yield '\tfake -> ' + (ids.get(initial_state) or
+                          __dot_quote(initial_state)) + ' [style=bold]\n'
+    for (state, action), arriving_state in dfa['transitions'].items():
+        yield __dot_edge(ids, state, arriving_state, action)
+    # DOT has no implicit sink: the missing edges to an accepting one
+    # are drawn, the ones to a rejecting one are as good as missing
+    sink = dfa.get('implicit_sink')
+    if sink is not None and sink in accepting_states:
+        for state in dfa['states']:
+            for action in dfa['alphabet']:
+                if (state, action) not in dfa['transitions']:
+                    yield __dot_edge(ids, state, sink, action)
+
+
+def dfa_to_dot(dfa: dict, name: str, path: str = './', direction='TB',
+               engine='dot', render: bool = False,
+               format: str = 'svg') -> str:
+    """ Generates a DOT file in **path** folder of the input DFA,
+    writing its statements as they are generated, and on request a
+    relative image rendered by Graphviz.
+
+    Graphviz and graphviz library are needed just to render the file;
+    to render many files concurrently see
+    :mod:`~PySimpleAutomata.automata_IO.render_dot_files`.
 
     :param dict dfa: DFA to export;
     :param str name: name of the output file;
@@ -182,32 +1087,13 @@ def dfa_to_dot(dfa: dict, name: str, path: str = './', direction='TB', engine='d
     :param str direction: direction of graph (default: 
                           TB for vertical).
     :param str engine: Graphviz layout engine to be used (default: dot)
+    :param bool render: if True the DOT file is rendered in
+                        *name.dot.format* (default: False);
+    :param str format: format of the rendered file (default: svg).
+    :return: *(str)* path + filename of the DOT file.
     """
-    g = graphviz.Digraph(format='svg', engine=engine)
-    g.graph_attr['rankdir'] = direction
-    g.node('fake', style='invisible')
-    for state in dfa['states']:
-        if state == dfa['initial_state']:
-            if state in dfa['accepting_states']:
-                g.node(str(state), root='true',
-                       shape='doublecircle')
-            else:
-                g.node(str(state), root='true')
-        elif state in dfa['accepting_states']:
-            g.node(str(state), shape='doublecircle')
-        else:
-            g.node(str(state))
-
-    g.edge('fake', str(dfa['initial_state']), style='bold')
-    for transition in dfa['transitions']:
-        g.edge(str(transition[0]),
-               str(dfa['transitions'][transition]),
-               label=transition[1])
-
-    if not os.path.exists(path):
-        os.makedirs(path)
-
-    g.render(filename=os.path.join(path, name + '.dot'))
+    return __to_dot(__dfa_dot_statements(dfa), name, path, direction,
+                    render, format, engine)
 
 
 @NotImplementedError
@@ -231,16 +1117,21 @@ def dfa_conformance_check(dfa):
 def nfa_json_importer(input_file: str) -> dict:
     """ Imports a NFA from a JSON file.
 
+    The file is read incrementally, adding each transition as soon as
+    it is read, and may be compressed with gzip or lzma; both
+    versions of the schema are read.
+
     :param str input_file: path+filename to JSON file;
     :return: *(dict)* representing a NFA.
     """
-    file = open(input_file)
-    json_file = json.load(file)
-
     transitions = {}  # key [state in states, action in alphabet]
     #                   value [Set of arriving states in states]
-    for p in json_file['transitions']:
-        transitions.setdefault((p[0], p[1]), set()).add(p[2])
+
+    def add_transition(origin, action, destination):
+        transitions.setdefault((origin, action), set()).add(destination)
+
+    with __open_json(input_file) as file:
+        json_file = __json_transitions(file, add_transition, True)
 
     nfa = {
         'alphabet': set(json_file['alphabet']),
@@ -253,38 +1144,164 @@ def nfa_json_importer(input_file: str) -> dict:
     return nfa
 
 
-def nfa_to_json(nfa: dict, name: str, path: str = './'):
+def nfa_to_json(nfa: dict, name: str, path: str = './',
+                compact: bool = False, compression: str = None,
+                version: int = 1):
     """ Exports a NFA to a JSON file.
 
+    The transitions are written one at a time, without building the
+    whole JSON document in memory.
+
     :param dict nfa: NFA to export;
     :param str name: name of the output file;
     :param str path: path where to save the JSON file (default:
-                     working directory).
+                     working directory);
+    :param bool compact: if True the file is written without
+                         indentation nor whitespace (default: False);
+    :param str compression: None (default), 'gzip' or 'lzma', which
+                            add respectively .gz and .xz to the file
+                            name;
+    :param int version: version of the schema, 1 (default) or 2,
+                        which stores the states and the alphabet once
+                        and refers to them by index.
     """
-    transitions = list()  # key[state in states, action in alphabet]
-    #                       value [Set of arriving states in states]
-    for p in nfa['transitions']:
-        for dest in nfa['transitions'][p]:
-            transitions.append([p[0], p[1], dest])
-
     out = {
         'alphabet': list(nfa['alphabet']),
         'states': list(nfa['states']),
         'initial_states': list(nfa['initial_states']),
-        'accepting_states': list(nfa['accepting_states']),
-        'transitions': transitions
+        'accepting_states': list(nfa['accepting_states'])
     }
+    if version == 2:
+        transitions = __json_indexed(
+            adjacency.nfa_successors(nfa), out, True)
+    else:
+        # key[state in states, action in alphabet]
+        # value [Set of arriving states in states]
+        transitions = ([p[0], p[1], dest]
+                       for p in nfa['transitions']
+                       for dest in nfa['transitions'][p])
+    __to_json(out, transitions, name, path, compact, compression, version)
+
+
+def nfa_to_binary(nfa, name: str, path: str = './'):
+    """ Exports a NFA to a binary file, to be loaded with
+    :mod:`PySimpleAutomata.automata_IO.nfa_binary_loader`.
+
+    The file holds the tables of the state and symbol names, the
+    initial and accepting states and the transitions in CSR
+    (compressed sparse row) layout: the arriving states of state s
+    reading symbol a are in a single array, between the offsets of
+    row :math:`s·|Σ| + a` and of the next one.
+    States and symbols must be strings; as in
+    :class:`PySimpleAutomata.NFA.CompiledNFA` transitions over
+    symbols not in the alphabet are dropped.
+    If *path* do not exists, it will be created.
 
-    if not os.path.exists(path):
-        os.makedirs(path)
-    file = open(os.path.join(path, name + '.json'), 'w')
-    json.dump(out, file, sort_keys=True, indent=4)
-    file.close()
+    :param nfa: NFA to export, as dict or
+                :class:`PySimpleAutomata.NFA.CompiledNFA`;
+    :param str name: name of the output file, to which .bin is added;
+    :param str path: path where to save the binary file (default:
+                     working directory).
+    """
+    if isinstance(nfa, NFA.CompiledNFA):
+        states = nfa.states
+        alphabet = nfa.alphabet
+        initial_states = array('i', (i for i in range(len(states))
+                                     if (nfa.initial_states >> i) & 1))
+        accepting = bytes((nfa.accepting_states >> i) & 1
+                          for i in range(len(states)))
+
+        def arriving(s, a):
+            mask = nfa.table[a][s]
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                yield low.bit_length() - 1
+    else:
+        compiled_nfa = NFA.compile_nfa(nfa)
+        states = compiled_nfa.states
+        alphabet = compiled_nfa.alphabet
+        state_index = compiled_nfa.state_index
+        symbol_index = compiled_nfa.symbol_index
+        initial_states = array('i', (state_index[state]
+                                     for state in nfa['initial_states']))
+        accepting = bytes(state in nfa['accepting_states']
+                          for state in states)
+        rows = dict()
+        for (state, action), destinations in nfa['transitions'].items():
+            if action in symbol_index:
+                rows[state_index[state], symbol_index[action]] = \
+                    sorted(state_index[d] for d in destinations)
+
+        def arriving(s, a):
+            return rows.get((s, a), ())
+
+    offsets = array('q', [0])
+    arriving_states = array('i')
+    for s in range(len(states)):
+        for a in range(len(alphabet)):
+            arriving_states.extend(arriving(s, a))
+            offsets.append(len(arriving_states))
+    sections = __string_table(states, 'states') + \
+        __string_table(alphabet, 'symbols') + \
+        [accepting, initial_states, offsets, arriving_states]
+    __to_binary(BINARY_NFA, len(states), len(alphabet), DFA.REJECT,
+                sections, name, path)
+
+
+def nfa_binary_loader(input_file: str) -> NFA.CompiledNFA:
+    """ Loads a NFA from a binary file written by
+    :mod:`PySimpleAutomata.automata_IO.nfa_to_binary`.
+
+    The file is mapped in memory and read without parsing it; as the
+    sets of states of :class:`PySimpleAutomata.NFA.CompiledNFA` are
+    int bitmasks, these are built from the mapped transitions, while
+    the state names are decoded when accessed.
+
+    :param str input_file: path + filename of the binary file.
+    :return: *(CompiledNFA)* the loaded NFA.
+    """
+    (n_states, n_symbols, _), sections = __binary_load(
+        input_file, BINARY_NFA, 'qBqBBiqi')
+    states = _StringTable(sections[0], sections[1])
+    alphabet = _StringTable(sections[2], sections[3])
+    accepting, initial, offsets, arriving_states = sections[4:]
+    if len(states) != n_states or len(alphabet) != n_symbols \
+            or len(accepting) != n_states \
+            or len(offsets) != n_states * n_symbols + 1:
+        raise ValueError(input_file + ' is corrupted')
+
+    table = [[0] * n_states for _ in range(n_symbols)]
+    row = 0
+    for s in range(n_states):
+        for a in range(n_symbols):
+            start, end = offsets[row], offsets[row + 1]
+            row += 1
+            if start == end:
+                continue
+            mask = 0
+            for destination in arriving_states[start:end]:
+                mask |= 1 << destination
+            table[a][s] = mask
+    initial_states = 0
+    for s in initial:
+        initial_states |= 1 << s
+    accepting_states = 0
+    for s in range(n_states):
+        if accepting[s]:
+            accepting_states |= 1 << s
+    return NFA.CompiledNFA.from_tables(states, alphabet, initial_states,
+                                       accepting_states, table,
+                                       _StringIndex(states))
 
 
 def nfa_dot_importer(input_file: str) -> dict:
     """ Imports a NFA from a DOT file.
 
+    The DOT files written by the library are read by a native parser;
+    the ones out of its subset of DOT (subgraphs, ports, HTML IDs,
+    ...) are read by pydot.
+
     Of .dot files are recognized the following attributes
       • nodeX   shape=doublecircle -> accepting node;
       • nodeX   root=true -> initial node;
@@ -312,60 +1329,45 @@ def nfa_dot_importer(input_file: str) -> dict:
     :return: *(dict)* representing a NFA.
     """
 
-    # pyDot Object
-    g = pydot.graph_from_dot_file(input_file)[0]
+    nodes, edges = __dot_graph(input_file)
 
     states = set()
     initial_states = set()
     accepting_states = set()
 
-    replacements = {'"': '', "'": '', '(': '', ')': '', ' ': ''}
-
-    for node in g.get_nodes():
-        attributes = node.get_attributes()
-        if node.get_name() == 'fake' \
-                or node.get_name() == 'None' \
-                or node.get_name() == 'graph' \
-                or node.get_name() == 'node':
+    # names are repeated in many edges
+    references = dict()
+    for name, attributes in nodes:
+        if name == 'fake' \
+                or name == 'None' \
+                or name == 'graph' \
+                or name == 'node':
             continue
-        if 'style' in attributes \
-                and attributes['style'] == 'invisible':
+        if attributes.get('style') == 'invisible':
             continue
 
-        node_reference = __replace_all(replacements,
-                                       node.get_name()).split(',')
-        if len(node_reference) > 1:
-            node_reference = tuple(node_reference)
-        else:
-            node_reference = node_reference[0]
+        node_reference = __dot_name(name)
+        references[name] = node_reference
         states.add(node_reference)
-        for attribute in attributes:
-            if attribute == 'root':
-                initial_states.add(node_reference)
-            if attribute == 'shape' \
-                    and attributes['shape'] == 'doublecircle':
-                accepting_states.add(node_reference)
+        if 'root' in attributes:
+            initial_states.add(node_reference)
+        if attributes.get('shape') == 'doublecircle':
+            accepting_states.add(node_reference)
 
     alphabet = set()
     transitions = {}
-    for edge in g.get_edges():
-        source = __replace_all(replacements,
-                               edge.get_source()).split(',')
-        if len(source) > 1:
-            source = tuple(source)
-        else:
-            source = source[0]
-        destination = __replace_all(replacements,
-                                    edge.get_destination()).split(',')
-        if len(destination) > 1:
-            destination = tuple(destination)
-        else:
-            destination = destination[0]
+    for source, destination, attributes in edges:
+        if source not in references:
+            references[source] = __dot_name(source)
+        source = references[source]
+        if destination not in references:
+            references[destination] = __dot_name(destination)
+        destination = references[destination]
 
         if source not in states or destination not in states:
             continue
 
-        label = __replace_all(replacements, edge.get_label())
+        label = str.translate(attributes.get('label'), __DOT_REMOVED)
         alphabet.add(label)
 
         transitions.setdefault((source, label), set()).add(
@@ -382,9 +1384,38 @@ def nfa_dot_importer(input_file: str) -> dict:
     return nfa
 
 
-def nfa_to_dot(nfa: dict, name: str, path: str = './', direction='TB', engine='dot'):
-    """ Generates a DOT file and a relative SVG image in **path**
-    folder of the input NFA using graphviz library.
+def __nfa_dot_statements(nfa: dict):
+    """ Yields the statement lines of the DOT digraph of the NFA,
+    with an invisible fake node pointing each initial state. """
+    initial_states = nfa['initial_states']
+    accepting_states = nfa['accepting_states']
+    fakes = ['fake' + str(i) for i in range(len(initial_states))]
+    ids = dict()
+    for fake in fakes:
+        yield '\t' + fake + ' [style=invisible]\n'
+    for state in nfa['states']:
+        node = ids[state] = __dot_quote(state)
+        yield __dot_node(node, state in initial_states,
+                         state in accepting_states)
+    for initial_state in initial_states:
+        yield '\t' + fakes.pop() + ' -> ' + \
+              (ids.get(initial_state) or __dot_quote(initial_state)) + \
+              ' [style=bold]\n'
+    for (state, action), arrival in nfa['transitions'].items():
+        for destination in arrival:
+            yield __dot_edge(ids, state, destination, action)
+
+
+def nfa_to_dot(nfa: dict, name: str, path: str = './', direction='TB',
+               engine='dot', render: bool = False,
+               format: str = 'svg') -> str:
+    """ Generates a DOT file in **path** folder of the input NFA,
+    writing its statements as they are generated, and on request a
+    relative image rendered by Graphviz.
+
+    Graphviz and graphviz library are needed just to render the file;
+    to render many files concurrently see
+    :mod:`~PySimpleAutomata.automata_IO.render_dot_files`.
 
     :param dict nfa: input NFA;
     :param str name: string with the name of the output file;
@@ -393,35 +1424,13 @@ def nfa_to_dot(nfa: dict, name: str, path: str = './', direction='TB', engine='d
     :param str direction: direction of graph (default: 
                           TB for vertical).
     :param str engine: Graphviz layout engine to be used (default: dot)
+    :param bool render: if True the DOT file is rendered in
+                        *name.dot.format* (default: False);
+    :param str format: format of the rendered file (default: svg).
+    :return: *(str)* path + filename of the DOT file.
     """
-    g = graphviz.Digraph(format='svg', engine=engine)
-    g.graph_attr['rankdir'] = direction
-
-    fakes = []
-    for i in range(len(nfa['initial_states'])):
-        fakes.append('fake' + str(i))
-        g.node('fake' + str(i), style='invisible')
-
-    for state in nfa['states']:
-        if state in nfa['initial_states']:
-            if state in nfa['accepting_states']:
-                g.node(str(state), root='true',
-                       shape='doublecircle')
-            else:
-                g.node(str(state), root='true')
-        elif state in nfa['accepting_states']:
-            g.node(str(state), shape='doublecircle')
-        else:
-            g.node(str(state))
-
-    for initial_state in nfa['initial_states']:
-        g.edge(fakes.pop(), str(initial_state), style='bold')
-    for transition in nfa['transitions']:
-        for destination in nfa['transitions'][transition]:
-            g.edge(str(transition[0]), str(destination),
-                   label=transition[1])
-
-    g.render(filename=os.path.join(path, name + '.dot'))
+    return __to_dot(__nfa_dot_statements(nfa), name, path, direction,
+                    render, format, engine)
 
 
 ####################################################################
@@ -430,16 +1439,21 @@ def nfa_to_dot(nfa: dict, name: str, path: str = './', direction='TB', engine='d
 def afw_json_importer(input_file: str) -> dict:
     """ Imports a AFW from a JSON file.
 
+    The file is read incrementally, adding each transition as soon as
+    it is read, and may be compressed with gzip or lzma; both
+    versions of the schema are read.
+
     :param str input_file: path+filename to input JSON file;
     :return: *(dict)* representing a AFW.
     """
-    file = open(input_file)
-    json_file = json.load(file)
-
     transitions = {}  # key [state in states, action in alphabet]
     #  value [string representing boolean expression]
-    for p in json_file['transitions']:
-        transitions[p[0], p[1]] = p[2]
+
+    def add_transition(origin, action, formula):
+        transitions[origin, action] = formula
+
+    with __open_json(input_file) as file:
+        json_file = __json_transitions(file, add_transition, False)
 
     # return map
     afw = {
@@ -452,29 +1466,37 @@ def afw_json_importer(input_file: str) -> dict:
     return afw
 
 
-def afw_to_json(afw: dict, name: str, path: str = './'):
+def afw_to_json(afw: dict, name: str, path: str = './',
+                compact: bool = False, compression: str = None,
+                version: int = 1):
     """ Exports a AFW to a JSON file.
 
+    The transitions are written one at a time, without building the
+    whole JSON document in memory.
+
     :param dict afw: input AFW;
     :param str name: output file name;
     :param str path: path where to save the JSON file (default:
-                     working directory).
+                     working directory);
+    :param bool compact: if True the file is written without
+                         indentation nor whitespace (default: False);
+    :param str compression: None (default), 'gzip' or 'lzma', which
+                            add respectively .gz and .xz to the file
+                            name;
+    :param int version: version of the schema, 1 (default) or 2,
+                        which stores the states and the alphabet once
+                        and refers to them by index.
     """
-
     out = {
         'alphabet': list(afw['alphabet']),
         'states': list(afw['states']),
         'initial_state': afw['initial_state'],
-        'accepting_states': list(afw['accepting_states']),
-        'transitions': list()
+        'accepting_states': list(afw['accepting_states'])
     }
-
-    for t in afw['transitions']:
-        out['transitions'].append(
-            [t[0], t[1], afw['transitions'][t]])
-
-    if not os.path.exists(path):
-        os.makedirs(path)
-    file = open(os.path.join(path, name + '.json'), 'w')
-    json.dump(out, file, sort_keys=True, indent=4)
-    file.close()
+    if version == 2:
+        transitions = __json_indexed(
+            adjacency.dfa_successors(afw), out, False)
+    else:
+        transitions = ([t[0], t[1], afw['transitions'][t]]
+                       for t in afw['transitions'])
+    __to_json(out, transitions, name, path, compact, compression, version)
@@ -0,0 +1,108 @@
+"""
+Module with the graph searches shared by the automata modules.
+
+The searches do not depend on how an automaton is represented: states
+are any hashable objects and the automaton is given through functions,
+so the same code explores a DFA, a NFA or a NFA generated on the fly
+from an AFW.
+"""
+
+from collections import deque
+
+
+def shortest_accepted_word(initial_states, successors, accepting,
+                           include_empty_word: bool = False):
+    """ Returns a shortest word leading from one of the
+    **initial_states** to an accepting state, or None if no such
+    word exists.
+
+    States are explored breadth-first from the initial ones, each
+    state is enqueued at most once and the search stops as soon as
+    an accepting state is generated.
+    Every visited state keeps a pointer to the state and action it
+    was first reached from, so the word is rebuilt backward from
+    the last state.
+
+    :param initial_states: iterable of initial states;
+    :param successors: function returning, for a state, an iterable
+           of (*action*, *next_state*) pairs;
+    :param accepting: function returning True if a state is
+           accepting;
+    :param bool include_empty_word: if False (default) just nonempty
+           words are considered, so an accepting initial state
+           counts only if it can be reached again.
+    :return: *(list)* word, or None.
+    """
+    # state -> (previous state, action), None for initial states
+    parent = dict()
+    queue = deque()
+    for state in initial_states:
+        if state in parent:
+            continue
+        if include_empty_word and accepting(state):
+            return []
+        parent[state] = None
+        queue.append(state)
+
+    while queue:
+        state = queue.popleft()
+        for action, next_state in successors(state):
+            if accepting(next_state):
+                word = [action]
+                while parent[state] is not None:
+                    state, action = parent[state]
+                    word.append(action)
+                word.reverse()
+                return word
+            if next_state not in parent:
+                parent[next_state] = (state, action)
+                queue.append(next_state)
+    return None
+
+
+def accepted_word(initial_states, successors, accepting,
+                  include_empty_word: bool = False):
+    """ Returns a word leading from one of the **initial_states** to an
+    accepting state, or None if no such word exists.
+
+    Unlike :mod:`PySimpleAutomata.search.shortest_accepted_word` the
+    states are explored depth-first, so the word is not necessarily
+    a shortest one, but just the current path is kept in memory
+    besides the visited states and the successors are generated one
+    at a time, while they are consumed.
+
+    :param initial_states: iterable of initial states;
+    :param successors: function returning, for a state, an iterable
+           of (*action*, *next_state*) pairs;
+    :param accepting: function returning True if a state is
+           accepting;
+    :param bool include_empty_word: if False (default) just nonempty
+           words are considered.
+    :return: *(list)* word, or None.
+    """
+    visited = set()
+    for initial_state in initial_states:
+        if initial_state in visited:
+            continue
+        if include_empty_word and accepting(initial_state):
+            return []
+        visited.add(initial_state)
+        # word[i] is the action leading from the state of stack[i] to
+        # the state of stack[i + 1]
+        word = list()
+        stack = [iter(successors(initial_state))]
+        while stack:
+            for action, next_state in stack[-1]:
+                if accepting(next_state):
+                    word.append(action)
+                    return word
+                if next_state not in visited:
+                    visited.add(next_state)
+                    word.append(action)
+                    stack.append(iter(successors(next_state)))
+                    break
+            else:
+                stack.pop()
+                if word:
+                    word.pop()
+    return None
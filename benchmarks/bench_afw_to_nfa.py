@@ -0,0 +1,58 @@
+""" Benchmark of afw_to_nfa_conversion scaling with the number of AFW
+states.
+
+The AFW used has n states on a ring: reading 'a' each state moves to
+the next one, reading 'b' it has to move both to the next one and to
+the one after, so the reachable NFA states stay few while the number
+of AFW states grows.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_afw_to_nfa
+"""
+
+import time
+
+from PySimpleAutomata import AFW
+
+FULL_SIZES = [4, 8, 10, 12]
+MINIMAL_SIZES = [4, 8, 10, 12, 25, 50, 100]
+
+
+def ring_afw(states: int) -> dict:
+    """ Returns the ring AFW with **states** states. """
+    names = ['s' + str(i) for i in range(states)]
+    transitions = dict()
+    for i, state in enumerate(names):
+        following = names[(i + 1) % states]
+        after = names[(i + 2) % states]
+        transitions[state, 'a'] = following
+        transitions[state, 'b'] = following + ' and ' + after
+    return {
+        'alphabet': {'a', 'b'},
+        'states': set(names),
+        'initial_state': names[0],
+        'accepting_states': {names[0]},
+        'transitions': transitions
+    }
+
+
+def timed(minimal: bool, states: int):
+    afw = ring_afw(states)
+    start = time.perf_counter()
+    nfa = AFW.afw_to_nfa_conversion(afw, minimal=minimal)
+    elapsed = time.perf_counter() - start
+    print('{:<8} |S|={:<5} NFA states={:<7} {:8.3f} s'.format(
+        'minimal' if minimal else 'full', states, len(nfa['states']),
+        elapsed))
+
+
+def main():
+    for states in FULL_SIZES:
+        timed(False, states)
+    for states in MINIMAL_SIZES:
+        timed(True, states)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+""" Benchmark of DFA word acceptance over a batch of words.
+
+Compares the word by word dict-based dfa_word_acceptance, the compiled
+DFA and the NumPy batch acceptance on a random DFA.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_dfa_batch_acceptance
+"""
+
+import random
+import time
+
+from PySimpleAutomata import DFA
+
+STATES = 1000
+SYMBOLS = 20
+WORDS = 20000
+MAX_LENGTH = 50
+
+
+def random_dfa(states: int, symbols: int, seed: int = 0) -> dict:
+    """ Returns a random complete DFA with **states** states and
+    **symbols** symbols. """
+    rng = random.Random(seed)
+    state_names = ['s' + str(i) for i in range(states)]
+    alphabet = ['a' + str(i) for i in range(symbols)]
+    return {
+        'alphabet': set(alphabet),
+        'states': set(state_names),
+        'initial_state': state_names[0],
+        'accepting_states': set(rng.sample(state_names, states // 2)),
+        'transitions': {(s, a): rng.choice(state_names)
+                        for s in state_names for a in alphabet}
+    }
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print('{:<28} {:8.3f} s'.format(label, time.perf_counter() - start))
+    return result
+
+
+def main():
+    dfa = random_dfa(STATES, SYMBOLS)
+    rng = random.Random(1)
+    alphabet = sorted(dfa['alphabet'])
+    words = [[rng.choice(alphabet) for _ in range(rng.randint(0, MAX_LENGTH))]
+             for _ in range(WORDS)]
+
+    expected = timed('dfa_word_acceptance', lambda: [
+        DFA.dfa_word_acceptance(dfa, word) for word in words])
+    compiled = timed('compile_dfa', lambda: DFA.compile_dfa(dfa))
+    compiled_result = timed('CompiledDFA.accepts', lambda: [
+        compiled.accepts(word) for word in words])
+    encoded, lengths = timed('CompiledDFA.encode_batch',
+                             lambda: compiled.encode_batch(words))
+    batch_result = timed('dfa_batch_word_acceptance',
+                         lambda: DFA.dfa_batch_word_acceptance(
+                             compiled, encoded, lengths))
+
+    assert compiled_result == expected
+    assert list(batch_result) == expected
+
+
+if __name__ == '__main__':
+    main()
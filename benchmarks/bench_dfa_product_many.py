@@ -0,0 +1,63 @@
+""" Benchmark of the product of many DFAs.
+
+Compares chaining dfa_intersection with dfa_intersection_many on
+DFAs counting the symbols of a word modulo small numbers, printing
+the statistics of each step.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_dfa_product_many
+"""
+
+import functools
+import time
+
+from PySimpleAutomata import DFA
+
+MODULI = [3, 5, 7, 3, 5, 7, 9]
+
+
+def counter(modulo: int, symbol: str) -> dict:
+    """ Returns a DFA over {'a', 'b', 'c'} accepting the words whose
+    number of **symbol** is a multiple of **modulo**, with a
+    redundant copy of each state. """
+    states = {(i, copy) for i in range(modulo) for copy in range(2)}
+    transitions = dict()
+    for (i, copy) in states:
+        for a in 'abc':
+            if a == symbol:
+                transitions[(i, copy), a] = ((i + 1) % modulo, 1 - copy)
+            else:
+                transitions[(i, copy), a] = (i, copy)
+    return {
+        'alphabet': {'a', 'b', 'c'},
+        'states': states,
+        'initial_state': (0, 0),
+        'accepting_states': {(0, 0), (0, 1)},
+        'transitions': transitions
+    }
+
+
+def main():
+    dfas = [counter(modulo, 'abc'[i % 3])
+            for i, modulo in enumerate(MODULI)]
+
+    start = time.perf_counter()
+    chained = functools.reduce(DFA.dfa_intersection, dfas)
+    print('{:<24} {:8.3f} s  states={}'.format(
+        'chained', time.perf_counter() - start, len(chained['states'])))
+
+    start = time.perf_counter()
+    result, statistics = DFA.dfa_intersection_many(
+        dfas, return_statistics=True)
+    print('{:<24} {:8.3f} s  states={}'.format(
+        'dfa_intersection_many', time.perf_counter() - start,
+        len(result['states'])))
+    for step in statistics:
+        print('  operand {operand:<3} operand_states={operand_states:<4} '
+              'product_states={product_states:<6} states={states}'.format(
+                **step))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+""" Benchmark of the product of two complete DFAs.
+
+Compares the dict-based dfa_intersection and dfa_union with the NumPy
+dfa_product_table, which builds one product for both operations.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_dfa_product_table
+"""
+
+import time
+
+from PySimpleAutomata import DFA
+from benchmarks.bench_dfa_batch_acceptance import random_dfa
+
+STATES = 300
+SYMBOLS = 10
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print('{:<28} {:8.3f} s'.format(label, time.perf_counter() - start))
+    return result
+
+
+def main():
+    dfa_1 = random_dfa(STATES, SYMBOLS, seed=1)
+    dfa_2 = random_dfa(STATES, SYMBOLS, seed=2)
+
+    intersection = timed('dfa_intersection',
+                         lambda: DFA.dfa_intersection(dfa_1, dfa_2))
+    union = timed('dfa_union', lambda: DFA.dfa_union(dfa_1, dfa_2))
+    product = timed('dfa_product_table',
+                    lambda: DFA.dfa_product_table(dfa_1, dfa_2))
+
+    assert len(product.table) == len(union['states'])
+    assert product.accepting['intersection'].sum() == \
+        len(intersection['accepting_states'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+""" Benchmark of the projection of a DFA.
+
+Projects out the symbol 'x' from a DFA whose states are linked by
+'x' in short chains, and compares determinizing the projected NFA
+with the fused determinization of dfa_projection.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_dfa_projection
+"""
+
+import time
+
+from PySimpleAutomata import DFA
+from PySimpleAutomata import NFA
+
+LENGTH = 400
+
+
+def chain(length: int) -> dict:
+    """ Returns a DFA over {'a', 'b', 'x'} with **length** states,
+    where 'x' links each state to the next one but every eighth,
+    whose last state is accepting. """
+    states = list(range(length))
+    transitions = dict()
+    for i in states:
+        if i % 8 != 7:
+            transitions[i, 'x'] = i + 1
+        transitions[i, 'a'] = (2 * i + 1) % length
+        transitions[i, 'b'] = (i + 3) % length
+    return {
+        'alphabet': {'a', 'b', 'x'},
+        'states': set(states),
+        'initial_state': 0,
+        'accepting_states': {length - 1},
+        'transitions': transitions
+    }
+
+
+def main():
+    dfa = chain(LENGTH)
+
+    start = time.perf_counter()
+    nfa = DFA.dfa_projection(dfa, {'x'})
+    print('{:<32} {:8.3f} s  transitions={}'.format(
+        'dfa_projection', time.perf_counter() - start,
+        sum(len(arrivals) for arrivals in nfa['transitions'].values())))
+
+    start = time.perf_counter()
+    determinized = NFA.nfa_determinization(nfa, state_names='integer')
+    print('{:<32} {:8.3f} s  states={}'.format(
+        'nfa_determinization', time.perf_counter() - start,
+        len(determinized['states'])))
+
+    start = time.perf_counter()
+    fused = DFA.dfa_projection(dfa, {'x'}, determinize=True,
+                               state_names='integer')
+    print('{:<32} {:8.3f} s  states={}'.format(
+        'dfa_projection(determinize)', time.perf_counter() - start,
+        len(fused['states'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+""" Benchmark of the import of DFAs from DOT files.
+
+Writes DOT files of random DFAs in the layout of dfa_to_dot and
+compares dfa_dot_importer, which reads them with the native parser,
+with parsing them with pydot, the fallback for DOT files out of the
+subset written by the library.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_dot_importer
+"""
+
+import os
+import random
+import tempfile
+import time
+
+import graphviz
+import pydot
+
+from PySimpleAutomata import automata_IO
+
+SIZES = (250, 1000, 4000)
+ALPHABET = ('a', 'b', 'c', 'd')
+
+
+def dot_file(path: str, size: int) -> str:
+    """ Writes in **path** the DOT file of a random DFA with **size**
+    states with tuple names, as the ones of the products, and a
+    transition for each state and symbol, in the layout of
+    dfa_to_dot, returning the file name. """
+    rng = random.Random(size)
+    states = [('s' + str(i), 't' + str(i % 7)) for i in range(size)]
+    g = graphviz.Digraph(format='svg')
+    g.graph_attr['rankdir'] = 'TB'
+    g.node('fake', style='invisible')
+    for i, state in enumerate(states):
+        if i == 0:
+            g.node(str(state), root='true')
+        elif i % 5 == 0:
+            g.node(str(state), shape='doublecircle')
+        else:
+            g.node(str(state))
+    g.edge('fake', str(states[0]), style='bold')
+    for state in states:
+        for action in ALPHABET:
+            g.edge(str(state), str(rng.choice(states)), label=action)
+    file_name = os.path.join(path, 'dfa_' + str(size) + '.dot')
+    g.save(file_name)
+    return file_name
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        for size in SIZES:
+            file_name = dot_file(path, size)
+
+            start = time.perf_counter()
+            dfa = automata_IO.dfa_dot_importer(file_name)
+            native = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pydot.graph_from_dot_file(file_name)
+            parsed = time.perf_counter() - start
+
+            print('{:>6} edges  dfa_dot_importer {:8.3f} s  '
+                  'pydot parsing only {:8.3f} s  x{:.0f}'.format(
+                      len(dfa['transitions']), native, parsed,
+                      parsed / native))
+
+
+if __name__ == '__main__':
+    main()
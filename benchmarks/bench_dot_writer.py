@@ -0,0 +1,85 @@
+""" Benchmark of the export of DFAs to DOT files.
+
+Compares dfa_to_dot, which streams the DOT statements to the file,
+with building a graphviz.Digraph node by node and saving its source,
+as dfa_to_dot did before rendering the file with Graphviz (not
+timed, as the rendering is now requested separately).
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_dot_writer
+"""
+
+import random
+import tempfile
+import time
+
+import graphviz
+
+from PySimpleAutomata import automata_IO
+
+SIZES = (1000, 10000, 100000)
+ALPHABET = ('a', 'b', 'c', 'd')
+
+
+def random_dfa(size: int) -> dict:
+    """ Returns a random DFA with **size** states with tuple names, as
+    the ones of the products, and a transition for each state and
+    symbol. """
+    rng = random.Random(size)
+    states = [('s' + str(i), 't' + str(i % 7)) for i in range(size)]
+    return {
+        'alphabet': set(ALPHABET),
+        'states': set(states),
+        'initial_state': states[0],
+        'accepting_states': set(states[::5]),
+        'transitions': {(state, action): rng.choice(states)
+                        for state in states for action in ALPHABET}
+    }
+
+
+def graphviz_to_dot(dfa: dict, name: str, path: str):
+    """ Saves the DOT file of the DFA building a graphviz.Digraph. """
+    g = graphviz.Digraph(format='svg')
+    g.graph_attr['rankdir'] = 'TB'
+    g.node('fake', style='invisible')
+    for state in dfa['states']:
+        if state == dfa['initial_state']:
+            if state in dfa['accepting_states']:
+                g.node(str(state), root='true',
+                       shape='doublecircle')
+            else:
+                g.node(str(state), root='true')
+        elif state in dfa['accepting_states']:
+            g.node(str(state), shape='doublecircle')
+        else:
+            g.node(str(state))
+    g.edge('fake', str(dfa['initial_state']), style='bold')
+    for transition in dfa['transitions']:
+        g.edge(str(transition[0]),
+               str(dfa['transitions'][transition]),
+               label=transition[1])
+    g.save(directory=path, filename=name + '.dot')
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        for size in SIZES:
+            dfa = random_dfa(size)
+
+            start = time.perf_counter()
+            automata_IO.dfa_to_dot(dfa, 'streamed', path)
+            streamed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            graphviz_to_dot(dfa, 'graphviz', path)
+            built = time.perf_counter() - start
+
+            print('{:>7} edges  dfa_to_dot {:8.3f} s  '
+                  'graphviz.Digraph {:8.3f} s  x{:.1f}'.format(
+                      len(dfa['transitions']), streamed, built,
+                      built / streamed))
+
+
+if __name__ == '__main__':
+    main()
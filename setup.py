@@ -20,6 +20,7 @@ setup(
     packages=find_packages(exclude=['doc', 'tests']),
     install_requires=['graphviz', 'pydot'],
     setup_requires=['graphviz', 'pydot'],
+    extras_require={'numpy': ['numpy']},
     data_files=[("", ["LICENSE"])],
     classifiers=[
         # How mature is this project? Common values are
@@ -64,6 +64,15 @@ class TestAfwWordAcceptance(TestCase):
         representing a AFW. [EXPECTED FAILURE]"""
         AFW.afw_word_acceptance({'goofy': 'donald'}, ['a', 'b', 'b', 'a', 'b'])
 
+    def test_word_acceptance_long_word(self):
+        """ Tests words longer than the recursion limit """
+        self.assertTrue(
+            AFW.afw_word_acceptance(self.afw_word_acceptance_test_01,
+                                    ['a'] * 5000))
+        self.assertFalse(
+            AFW.afw_word_acceptance(self.afw_word_acceptance_test_01,
+                                    ['a'] * 5000 + ['b', 'a']))
+
     def test_word_acceptance_check_side_effects(self):
         """ Tests that the function doesn't make any side effect on the 
         input"""
@@ -73,6 +82,68 @@ class TestAfwWordAcceptance(TestCase):
         self.assertDictEqual(before, self.afw_word_acceptance_test_01)
 
 
+class TestCompileFormula(TestCase):
+    def test_compile_formula_evaluate(self):
+        """ Tests the evaluation of a compiled formula """
+        formula = AFW.compile_formula('(s1 and s2) or s3')
+        self.assertTrue(formula.evaluate({'s1', 's2'}))
+        self.assertTrue(formula.evaluate({'s3'}))
+        self.assertFalse(formula.evaluate({'s1'}))
+        self.assertFalse(formula.evaluate(set()))
+
+    def test_compile_formula_precedence(self):
+        """ Tests 'and' binds tighter than 'or' as in Python """
+        formula = AFW.compile_formula('s1 or s2 and s3')
+        self.assertTrue(formula.evaluate({'s1'}))
+        self.assertFalse(formula.evaluate({'s2'}))
+
+    def test_compile_formula_constants(self):
+        """ Tests True and False formulas and their simplification """
+        self.assertIs(AFW.compile_formula('True'), AFW.Formula.TRUE)
+        self.assertIs(AFW.compile_formula('s1 and False'),
+                      AFW.Formula.FALSE)
+        self.assertIs(AFW.compile_formula('True and s1'),
+                      AFW.compile_formula('s1'))
+
+    def test_compile_formula_hash_consing(self):
+        """ Tests structurally equal formulas are the same object """
+        self.assertIs(AFW.compile_formula('(s1 or s2) and s3'),
+                      AFW.compile_formula('((s1 or s2)) and (s3)'))
+        self.assertIs(AFW.compile_formula('s1 and (s2 and s3)'),
+                      AFW.compile_formula('(s1 and s2) and s3'))
+
+    def test_compile_formula_variables(self):
+        """ Tests the states involved in a formula """
+        self.assertSetEqual(
+            AFW.compile_formula('(s1 and s2) or s3 or True').variables,
+            set())
+        self.assertSetEqual(
+            AFW.compile_formula('(s1 and s2) or s3').variables,
+            {'s1', 's2', 's3'})
+
+    def test_compile_formula_dual(self):
+        """ Tests the dual of a formula """
+        formula = AFW.compile_formula('(s1 and s2) or s3')
+        self.assertIs(formula.dual(),
+                      AFW.compile_formula('(s1 or s2) and s3'))
+        self.assertIs(formula.dual().dual(), formula)
+        self.assertEqual(AFW.formula_dual('False'), 'True')
+
+    def test_compile_formula_rename(self):
+        """ Tests the renaming of states with names one prefix of the
+        other """
+        formula = AFW.compile_formula('s1 or s10')
+        self.assertEqual(str(formula.rename({'s1': 'a', 's10': 'b'})),
+                         'a or b')
+
+    def test_compile_formula_wrong_formula(self):
+        """ Tests formulas not positive or not well formed """
+        for formula in ['not s1', 's1 and', '(s1 or s2', 's1 s2', '',
+                        "__import__('os').getcwd()"]:
+            with self.assertRaises(ValueError):
+                AFW.compile_formula(formula)
+
+
 class TestNfaToAfwConversion(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -255,6 +326,46 @@ class TestAfwToNfaConversion(TestCase):
                 self.assertEqual(original_nfa_acceptance, nfa_acceptance)
             i += 1
 
+    def test_afw_to_nfa_conversion_minimal(self):
+        """ Tests the conversion generating just minimal successors
+        reads the same language with fewer states """
+        nfa_full = AFW.afw_to_nfa_conversion(
+            self.afw_nonemptiness_check_test_2, minimal=False)
+        nfa_minimal = AFW.afw_to_nfa_conversion(
+            self.afw_nonemptiness_check_test_2)
+        self.assertLess(len(nfa_minimal['states']), len(nfa_full['states']))
+        for length in range(7):
+            for word in itertools.product(['a', 'b'], repeat=length):
+                self.assertEqual(
+                    NFA.nfa_word_acceptance(nfa_full, list(word)),
+                    NFA.nfa_word_acceptance(nfa_minimal, list(word)))
+
+    def test_afw_to_nfa_conversion_many_states(self):
+        """ Tests the default, minimal, conversion of a AFW with many
+        states, too many to enumerate all the assignments """
+        states = ['s' + str(i) for i in range(40)]
+        afw = {
+            'alphabet': {'a'},
+            'states': set(states),
+            'initial_state': 's0',
+            'accepting_states': {'s39'},
+            'transitions': {(states[i], 'a'): states[i + 1]
+                            for i in range(39)}
+        }
+        nfa_01 = AFW.afw_to_nfa_conversion(afw)
+        self.assertEqual(len(nfa_01['states']), 40)
+        self.assertTrue(NFA.nfa_word_acceptance(nfa_01, ['a'] * 39))
+        self.assertFalse(NFA.nfa_word_acceptance(nfa_01, ['a'] * 38))
+
+    def test_formula_minimal_models(self):
+        """ Tests the minimal models of a formula """
+        formula = AFW.compile_formula('(s1 or s2) and (s1 or s3)')
+        self.assertSetEqual(set(formula.minimal_models()),
+                            {frozenset({'s1'}), frozenset({'s2', 's3'})})
+        self.assertSetEqual(set(AFW.Formula.TRUE.minimal_models()),
+                            {frozenset()})
+        self.assertSetEqual(set(AFW.Formula.FALSE.minimal_models()), set())
+
     def test_afw_to_nfa_conversion_empty_states(self):
         """ Tests a AFW to NFA conversion with an empty AFW """
         nfa_01 = AFW.afw_to_nfa_conversion(self.afw_afw_to_nfa_test_empty)
@@ -373,6 +484,14 @@ class TestAfwCompletion(TestCase):
         AFW.afw_completion(self.afw_completion_test_01)
         self.assertNotEqual(before, self.afw_completion_test_01)
 
+    def test_afw_completion_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.afw_completion_test_01)
+        result = AFW.afw_completion(self.afw_completion_test_01, inplace=False)
+        self.assertEquals(input_before, self.afw_completion_test_01)
+        self.assertEquals(result, AFW.afw_completion(input_before))
+
 
 class TestAfwComplementation(TestCase):
     def setUp(self):
@@ -852,6 +971,20 @@ class TestAfwNonemptinessCheck(TestCase):
         [EXPECTED FAILURE] """
         self.assertFalse(AFW.afw_nonemptiness_check(0))
 
+    def test_afw_nonemptiness_witness(self):
+        """ Tests the witness is a shortest word accepted by the afw """
+        word = AFW.afw_nonemptiness_witness(self.afw_nonemptiness_check_test_1)
+        self.assertEqual(len(word), 1)
+        self.assertTrue(
+            AFW.afw_word_acceptance(self.afw_nonemptiness_check_test_1, word))
+
+    def test_afw_nonemptiness_witness_none(self):
+        """ Tests no witness is returned for an empty afw """
+        self.assertIsNone(
+            AFW.afw_nonemptiness_witness(self.afw_nonemptiness_check_test_2))
+        self.assertIsNone(AFW.afw_nonemptiness_witness(
+            self.afw_nonemptiness_check_test_empty))
+
     def test_afw_nonemptiness_check_side_effects(self):
         """ Tests that the function doesn't make any side effect on the 
         input"""
@@ -891,6 +1024,22 @@ class TestAfwNonuniversalityCheck(TestCase):
         self.assertFalse(AFW.afw_nonuniversality_check(
             self.afw_nonuniversality_check_test_empty))
 
+    def test_afw_nonuniversality_check_many_states(self):
+        """ Tests the nonuniversality of a AFW with too many states to
+        enumerate all the successors """
+        states = ['s' + str(i) for i in range(40)]
+        afw = {
+            'alphabet': {'a'},
+            'states': set(states),
+            'initial_state': 's0',
+            'accepting_states': set(states),
+            'transitions': {(states[i], 'a'): states[i + 1]
+                            for i in range(39)}
+        }
+        self.assertTrue(AFW.afw_nonuniversality_check(afw))
+        afw['transitions'][states[39], 'a'] = 's0'
+        self.assertFalse(AFW.afw_nonuniversality_check(afw))
+
     @unittest.expectedFailure
     def test_afw_nonuniversality_check_wrong_dict(self):
         """ Tests the nonuniversality of an input dict different from a dict 
@@ -2,9 +2,17 @@ from unittest import TestCase
 import unittest
 from .context import PySimpleAutomata
 import copy
+import itertools
+import random
 from PySimpleAutomata import DFA
+from PySimpleAutomata import NFA
 from PySimpleAutomata import automata_IO
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestDfaWordAcceptance(TestCase):
     def setUp(self):
@@ -41,6 +49,25 @@ class TestDfaWordAcceptance(TestCase):
             DFA.dfa_word_acceptance(self.dfa_word_acceptance_test_02,
                                     []))
 
+    def test_word_acceptance_state_named_sink(self):
+        """ Tests an accepting state named 'sink' is not an implicit
+        sink without the 'implicit_sink' key """
+        dfa = {
+            'alphabet': {'a', 'b'},
+            'states': {'s0', 'sink'},
+            'initial_state': 's0',
+            'accepting_states': {'sink'},
+            'transitions': {('s0', 'a'): 'sink'}
+        }
+        self.assertTrue(DFA.dfa_word_acceptance(dfa, ['a']))
+        self.assertFalse(DFA.dfa_word_acceptance(dfa, ['b']))
+        self.assertFalse(DFA.dfa_word_acceptance(dfa, ['a', 'a']))
+        self.assertFalse(DFA.compile_dfa(dfa).accepts(['a', 'b']))
+        dfa['implicit_sink'] = 'sink'
+        self.assertTrue(DFA.dfa_word_acceptance(dfa, ['b']))
+        self.assertTrue(DFA.dfa_word_acceptance(dfa, ['a', 'a']))
+        self.assertTrue(DFA.compile_dfa(dfa).accepts(['a', 'b']))
+
     @unittest.expectedFailure
     def test_word_acceptance_wrong_input_1(self):
         """ Tests an input different from a dict() object. [
@@ -61,6 +88,109 @@ class TestDfaWordAcceptance(TestCase):
                                 ['5c', '10c', 'gum', '5c', '10c'])
 
 
+class TestCompileDfa(TestCase):
+    def setUp(self):
+        self.dfa_word_acceptance_test_01 = \
+            automata_IO.dfa_dot_importer(
+                './tests/dot/dfa/dfa_word_acceptance_test_01.dot')
+        self.dfa_empty = {
+            'alphabet': set(),
+            'states': set(),
+            'initial_state': None,
+            'accepting_states': set(),
+            'transitions': {}
+        }
+
+    def test_compile_dfa_same_language(self):
+        """ Tests the compiled DFA accepts the same words of the
+        original one """
+        compiled = DFA.compile_dfa(self.dfa_word_acceptance_test_01)
+        alphabet = sorted(self.dfa_word_acceptance_test_01['alphabet'])
+        for length in range(7):
+            for word in itertools.product(alphabet, repeat=length):
+                self.assertEqual(
+                    compiled.accepts(list(word)),
+                    DFA.dfa_word_acceptance(
+                        self.dfa_word_acceptance_test_01, list(word)))
+
+    def test_compile_dfa_run(self):
+        """ Tests the run returns the reached state """
+        compiled = DFA.compile_dfa(self.dfa_word_acceptance_test_01)
+        self.assertEqual(
+            compiled.run(['5c', '10c', 'gum', '5c', '10c', 'gum']), 's0')
+        self.assertEqual(compiled.run([]), 's0')
+        self.assertIsNone(compiled.run(['5c', '10c', 'wrong']))
+
+    def test_compile_dfa_wrong_alphabet(self):
+        """ Tests a word with letters not from the dfa alphabet """
+        compiled = DFA.compile_dfa(self.dfa_word_acceptance_test_01)
+        self.assertFalse(compiled.accepts(['5c', '10c', 'wrong']))
+        self.assertEqual(compiled.encode(['5c', 'wrong'])[1], DFA.REJECT)
+
+    def test_compile_dfa_empty(self):
+        """ Tests the compilation of an empty dfa """
+        compiled = DFA.compile_dfa(self.dfa_empty)
+        self.assertFalse(compiled.accepts([]))
+        self.assertFalse(compiled.accepts(['a']))
+
+    def test_compile_dfa_side_effects(self):
+        """ Tests the function doesn't make side effects on input """
+        before = copy.deepcopy(self.dfa_word_acceptance_test_01)
+        DFA.compile_dfa(self.dfa_word_acceptance_test_01)
+        self.assertDictEqual(before, self.dfa_word_acceptance_test_01)
+
+    @unittest.expectedFailure
+    def test_compile_dfa_wrong_dict(self):
+        """ Tests a dict() in input different from a well
+        formatted dict() representing a DFA. [EXPECTED FAILURE]"""
+        DFA.compile_dfa({'goofy': 'donald'})
+
+
+@unittest.skipIf(numpy is None, 'NumPy not available')
+class TestDfaBatchWordAcceptance(TestCase):
+    def setUp(self):
+        self.dfa_word_acceptance_test_01 = \
+            automata_IO.dfa_dot_importer(
+                './tests/dot/dfa/dfa_word_acceptance_test_01.dot')
+        self.compiled = DFA.compile_dfa(self.dfa_word_acceptance_test_01)
+        alphabet = sorted(self.dfa_word_acceptance_test_01['alphabet'])
+        self.words = [list(word)
+                      for length in range(6)
+                      for word in itertools.product(alphabet, repeat=length)]
+
+    def test_dfa_batch_word_acceptance(self):
+        """ Tests the batch acceptance agrees with the word by word
+        acceptance on words of different lengths """
+        words, lengths = self.compiled.encode_batch(self.words)
+        result = DFA.dfa_batch_word_acceptance(self.compiled, words, lengths)
+        self.assertEqual(
+            list(result),
+            [DFA.dfa_word_acceptance(self.dfa_word_acceptance_test_01, word)
+             for word in self.words])
+
+    def test_dfa_batch_word_acceptance_full_length(self):
+        """ Tests a batch without lengths, where all rows are full
+        words """
+        words = [self.compiled.encode(['5c', '10c', 'gum']),
+                 self.compiled.encode(['5c', '10c', '5c'])]
+        self.assertEqual(
+            list(DFA.dfa_batch_word_acceptance(self.compiled, words)),
+            [True, False])
+
+    def test_dfa_batch_word_acceptance_wrong_alphabet(self):
+        """ Tests words with letters not from the dfa alphabet """
+        words, lengths = self.compiled.encode_batch(
+            [['5c', '10c', 'wrong'], ['wrong']])
+        self.assertFalse(
+            DFA.dfa_batch_word_acceptance(self.compiled, words,
+                                          lengths).any())
+
+    def test_dfa_batch_word_acceptance_wrong_shape(self):
+        """ Tests words not organized in a 2-D array """
+        with self.assertRaises(ValueError):
+            DFA.dfa_batch_word_acceptance(self.compiled, [0, 1, 2])
+
+
 class TestDfaCompletion(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -126,6 +256,50 @@ class TestDfaCompletion(TestCase):
             copy.deepcopy(self.dfa_completion_test_01))
         self.assertNotEquals(completed, self.dfa_completion_test_01)
 
+    def test_dfa_completion_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.dfa_completion_test_01)
+        result = DFA.dfa_completion(self.dfa_completion_test_01, inplace=False)
+        self.assertEquals(input_before, self.dfa_completion_test_01)
+        self.assertEquals(result, DFA.dfa_completion(input_before))
+
+    def test_dfa_completion_implicit_sink(self):
+        """ Tests the implicit sink is added without transitions """
+        transitions = copy.deepcopy(
+            self.dfa_completion_test_01['transitions'])
+        completed = DFA.dfa_completion(self.dfa_completion_test_01,
+                                       implicit_sink=True)
+        self.assertIn('sink', completed['states'])
+        self.assertEqual(completed['implicit_sink'], 'sink')
+        self.assertDictEqual(completed['transitions'], transitions)
+
+    def test_dfa_completion_explicit_after_implicit(self):
+        """ Tests the completion of a DFA with implicit sink stores
+        its transitions and drops the key """
+        implicit = DFA.dfa_completion(self.dfa_completion_test_01,
+                                      implicit_sink=True, inplace=False)
+        completed = DFA.dfa_completion(implicit, inplace=False)
+        self.assertNotIn('implicit_sink', completed)
+        self.assertDictEqual(
+            completed, DFA.dfa_completion(self.dfa_completion_test_01))
+
+    def test_dfa_completion_accepting_sink_state(self):
+        """ Tests a state named 'sink' which is not dead is not used
+        for the missing transitions """
+        dfa = {
+            'alphabet': {'a', 'b'},
+            'states': {'s0', 'sink'},
+            'initial_state': 's0',
+            'accepting_states': {'sink'},
+            'transitions': {('s0', 'a'): 'sink', ('sink', 'a'): 'sink',
+                            ('sink', 'b'): 'sink'}
+        }
+        completed = DFA.dfa_completion(dfa)
+        self.assertEqual(completed['transitions']['s0', 'b'], "sink'")
+        self.assertFalse(DFA.dfa_word_acceptance(completed, ['b']))
+        self.assertTrue(DFA.dfa_word_acceptance(completed, ['a', 'b']))
+
 
 class TestDfaComplementation(TestCase):
     def setUp(self):
@@ -188,6 +362,93 @@ class TestDfaComplementation(TestCase):
             self.dfa_complementation_test_01)
         self.assertEquals(original, self.dfa_complementation_test_01)
 
+    def test_dfa_complementation_implicit_sink(self):
+        """ Tests the complement with implicit sink stores just the
+        transitions of the input and reads the same words of the
+        explicit one """
+        dfa = self.dfa_complementation_test_01
+        implicit = DFA.dfa_complementation(dfa, implicit_sink=True)
+        explicit = DFA.dfa_complementation(dfa)
+        self.assertDictEqual(implicit['transitions'], dfa['transitions'])
+        self.assertIn('sink', implicit['accepting_states'])
+        for length in range(6):
+            for word in itertools.product(sorted(dfa['alphabet']),
+                                          repeat=length):
+                self.assertEqual(
+                    DFA.dfa_word_acceptance(implicit, list(word)),
+                    DFA.dfa_word_acceptance(explicit, list(word)))
+                self.assertEqual(
+                    DFA.compile_dfa(implicit).accepts(list(word)),
+                    DFA.dfa_word_acceptance(explicit, list(word)))
+
+    def test_dfa_complementation_implicit_sink_twice(self):
+        """ Tests complementing twice with implicit sink gives back
+        the input language """
+        dfa = self.dfa_complementation_test_01
+        twice = DFA.dfa_complementation(
+            DFA.dfa_complementation(dfa, implicit_sink=True),
+            implicit_sink=True)
+        self.assertDictEqual(twice['transitions'], dfa['transitions'])
+        self.assertSetEqual(twice['accepting_states'],
+                            dfa['accepting_states'])
+
+    def test_dfa_complementation_implicit_sink_operations(self):
+        """ Tests the operations on a complement with implicit sink
+        give the same languages as on the explicit one """
+        dfa = self.dfa_complementation_test_01
+        implicit = DFA.dfa_complementation(dfa, implicit_sink=True)
+        explicit = DFA.dfa_complementation(dfa)
+        for operation in (DFA.dfa_trimming, DFA.dfa_co_reachable,
+                          DFA.dfa_minimization):
+            result = operation(copy.deepcopy(implicit))
+            for length in range(6):
+                for word in itertools.product(sorted(dfa['alphabet']),
+                                              repeat=length):
+                    self.assertEqual(
+                        DFA.dfa_word_acceptance(result, list(word)),
+                        DFA.dfa_word_acceptance(explicit, list(word)))
+        self.assertIsNone(DFA.dfa_equivalence_witness(implicit, explicit))
+        self.assertIsNone(DFA.dfa_nonemptiness_witness(
+            DFA.dfa_intersection(dfa, implicit)))
+
+    def test_dfa_complementation_implicit_sink_not_materialized(self):
+        """ Tests the co-reachable part and the trimming of a
+        complement with implicit sink store at most a trap more than
+        its transitions """
+        dfa = self.dfa_complementation_test_01
+        implicit = DFA.dfa_complementation(dfa, implicit_sink=True)
+        bound = len(implicit['transitions']) + len(dfa['alphabet'])
+        for operation in (DFA.dfa_trimming, DFA.dfa_co_reachable):
+            result = operation(implicit, inplace=False)
+            self.assertLessEqual(len(result['transitions']), bound)
+            self.assertIsNone(DFA.dfa_equivalence_witness(result,
+                                                          implicit))
+
+    def test_dfa_complementation_implicit_sink_union(self):
+        """ Tests the union with a complement with implicit sink
+        over a different alphabet """
+        dfa = self.dfa_complementation_test_01
+        implicit = DFA.dfa_complementation(dfa, implicit_sink=True)
+        other = {
+            'alphabet': {'z'},
+            'states': {'t0', 't1'},
+            'initial_state': 't0',
+            'accepting_states': {'t1'},
+            'transitions': {('t0', 'z'): 't1'}
+        }
+        union = DFA.dfa_union(implicit, other)
+        self.assertTrue(DFA.dfa_word_acceptance(union, ['z']))
+        self.assertFalse(DFA.dfa_word_acceptance(union, ['z', 'z']))
+        for length in range(4):
+            for word in itertools.product(sorted(dfa['alphabet']),
+                                          repeat=length):
+                self.assertEqual(
+                    DFA.dfa_word_acceptance(union, list(word)),
+                    DFA.dfa_word_acceptance(implicit, list(word)))
+                if length:
+                    self.assertFalse(DFA.dfa_word_acceptance(
+                        union, list(word) + ['z']))
+
 
 class TestDfaIntersection(TestCase):
     def setUp(self):
@@ -1260,6 +1521,338 @@ class TestDfaUnion(TestCase):
                              self.dfa_test_side_effect_1)
 
 
+class TestDfaIntersectionMany(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        # words over {'a', 'b'} whose number of **symbol** is a
+        # multiple of **modulo**, with two copies of each state
+        self.counters = [self.counter(modulo, symbol) for modulo, symbol
+                         in [(3, 'a'), (2, 'b'), (3, 'a'), (5, 'b')]]
+        self.words = [list(word) for length in range(8)
+                      for word in itertools.product('ab', repeat=length)]
+        self.dfa_empty = {
+            'alphabet': {'a'},
+            'states': {'e'},
+            'initial_state': 'e',
+            'accepting_states': set(),
+            'transitions': {('e', 'a'): 'e'}
+        }
+
+    @staticmethod
+    def counter(modulo: int, symbol: str) -> dict:
+        states = {(symbol, modulo, i, copy) for i in range(modulo)
+                  for copy in range(2)}
+        transitions = dict()
+        for (_, _, i, copy) in states:
+            for a in 'ab':
+                if a == symbol:
+                    transitions[(symbol, modulo, i, copy), a] = \
+                        (symbol, modulo, (i + 1) % modulo, 1 - copy)
+                else:
+                    transitions[(symbol, modulo, i, copy), a] = \
+                        (symbol, modulo, i, copy)
+        return {
+            'alphabet': {'a', 'b'},
+            'states': states,
+            'initial_state': (symbol, modulo, 0, 0),
+            'accepting_states': {(symbol, modulo, 0, 0),
+                                 (symbol, modulo, 0, 1)},
+            'transitions': transitions
+        }
+
+    def assertSameLanguage(self, dfa_1, dfa_2):
+        for word in self.words:
+            self.assertEqual(DFA.dfa_word_acceptance(dfa_1, word),
+                             DFA.dfa_word_acceptance(dfa_2, word))
+
+    def test_dfa_intersection_many(self):
+        """ Tests the result reads the language of the chained
+        intersection, with integer states """
+        chained = self.counters[0]
+        for dfa in self.counters[1:]:
+            chained = DFA.dfa_intersection(chained, dfa)
+        result = DFA.dfa_intersection_many(self.counters)
+        self.assertSameLanguage(result, chained)
+        self.assertEqual(result['initial_state'], 0)
+        self.assertSetEqual(result['states'], set(range(30)))
+
+    def test_dfa_intersection_many_orders(self):
+        """ Tests all the orders lead to the same language """
+        expected = DFA.dfa_intersection_many(self.counters, order='input')
+        for order in ['size', 'alphabet']:
+            for minimize in [True, False]:
+                self.assertSameLanguage(DFA.dfa_intersection_many(
+                    self.counters, order=order, minimize=minimize), expected)
+
+    def test_dfa_intersection_many_wrong_order(self):
+        """ Tests an unknown order raises a ValueError """
+        with self.assertRaises(ValueError):
+            DFA.dfa_intersection_many(self.counters, order='random')
+
+    def test_dfa_intersection_many_no_dfa(self):
+        """ Tests an empty list of DFAs raises a ValueError """
+        with self.assertRaises(ValueError):
+            DFA.dfa_intersection_many([])
+
+    def test_dfa_intersection_many_empty(self):
+        """ Tests the intersection with an empty DFA is empty and the
+        remaining operands are not processed """
+        result, statistics = DFA.dfa_intersection_many(
+            self.counters + [self.dfa_empty], return_statistics=True)
+        self.assertIsNone(result['initial_state'])
+        self.assertEqual(len(statistics), 1)
+
+    def test_dfa_intersection_many_provenance(self):
+        """ Tests the provenance of the states of the result """
+        result, provenance = DFA.dfa_intersection_many(
+            self.counters, minimize=False, return_provenance=True)
+        self.assertSetEqual(set(provenance), result['states'])
+        self.assertEqual(provenance[result['initial_state']], tuple(
+            dfa['initial_state'] for dfa in self.counters))
+        for word in self.words[:20]:
+            state = result['initial_state']
+            for a in word:
+                state = result['transitions'][state, a]
+            for dfa, component in zip(self.counters, provenance[state]):
+                component_state = dfa['initial_state']
+                for a in word:
+                    component_state = dfa['transitions'][component_state, a]
+                self.assertEqual(component, component_state)
+
+    def test_dfa_intersection_many_statistics(self):
+        """ Tests the statistics of each step """
+        result, statistics = DFA.dfa_intersection_many(
+            self.counters, order='input', return_statistics=True)
+        self.assertEqual([step['operand'] for step in statistics],
+                         [0, 1, 2, 3])
+        self.assertEqual([step['states'] for step in statistics],
+                         [3, 6, 6, 30])
+        self.assertEqual(statistics[-1]['states'], len(result['states']))
+
+    def test_dfa_intersection_many_side_effects(self):
+        """ Tests the function doesn't make any side effect on the
+        input """
+        before = copy.deepcopy(self.counters)
+        DFA.dfa_intersection_many(self.counters)
+        self.assertListEqual(before, self.counters)
+
+
+class TestDfaUnionMany(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.counters = [TestDfaIntersectionMany.counter(modulo, symbol)
+                         for modulo, symbol in [(3, 'a'), (2, 'b'), (4, 'a')]]
+        self.words = [list(word) for length in range(8)
+                      for word in itertools.product('ab', repeat=length)]
+        self.dfa_empty = {
+            'alphabet': {'c'},
+            'states': {'e'},
+            'initial_state': 'e',
+            'accepting_states': set(),
+            'transitions': {('e', 'c'): 'e'}
+        }
+
+    def test_dfa_union_many(self):
+        """ Tests the result reads the language of the chained union """
+        chained = DFA.dfa_union(
+            DFA.dfa_union(self.counters[0], self.counters[1]),
+            self.counters[2])
+        result = DFA.dfa_union_many(self.counters)
+        for word in self.words:
+            self.assertEqual(DFA.dfa_word_acceptance(result, word),
+                             DFA.dfa_word_acceptance(chained, word))
+        self.assertEqual(result['initial_state'], 0)
+
+    def test_dfa_union_many_empty(self):
+        """ Tests DFAs reading the empty language are skipped, but
+        their alphabet is kept """
+        result, statistics = DFA.dfa_union_many(
+            self.counters + [self.dfa_empty], return_statistics=True)
+        self.assertEqual(len(statistics), 3)
+        self.assertSetEqual(result['alphabet'], {'a', 'b', 'c'})
+
+    def test_dfa_union_many_provenance(self):
+        """ Tests the provenance of the initial state """
+        result, provenance = DFA.dfa_union_many(
+            self.counters, return_provenance=True)
+        self.assertEqual(provenance[0], tuple(
+            dfa['initial_state'] for dfa in self.counters))
+
+    def test_dfa_union_many_provenance_sink(self):
+        """ Tests the provenance names the sink added to each operand,
+        primed when the operand has a state named 'sink' """
+        dfa_1 = {
+            'alphabet': {'a', 'b'},
+            'states': {'s0', 'sink'},
+            'initial_state': 's0',
+            'accepting_states': {'sink'},
+            'transitions': {('s0', 'a'): 'sink', ('sink', 'a'): 's0'}
+        }
+        dfa_2 = {
+            'alphabet': {'a'},
+            'states': {'t0', 't1'},
+            'initial_state': 't0',
+            'accepting_states': {'t1'},
+            'transitions': {('t0', 'a'): 't1'}
+        }
+        dfa_3 = {
+            'alphabet': {'c'},
+            'states': {'u0', 'u1'},
+            'initial_state': 'u0',
+            'accepting_states': {'u1'},
+            'transitions': {('u0', 'c'): 'u1'}
+        }
+        result, provenance = DFA.dfa_union_many(
+            [dfa_1, dfa_2, dfa_3], order='input', minimize=False,
+            return_provenance=True)
+        state = result['transitions'][result['initial_state'], 'c']
+        self.assertEqual(provenance[state], ("sink'", 'sink', 'u1'))
+        state = result['transitions'][result['initial_state'], 'a']
+        self.assertEqual(provenance[state], ('sink', 't1', 'sink'))
+
+    def test_dfa_union_many_accepting_implicit_sink(self):
+        """ Tests the union of a first operand with an accepting
+        implicit sink, renamed to an integer """
+        dfa = {
+            'alphabet': {'a', 'b'},
+            'states': {'s0', 's1'},
+            'initial_state': 's0',
+            'accepting_states': {'s1'},
+            'transitions': {('s0', 'a'): 's1'}
+        }
+        other = {
+            'alphabet': {'a', 'c'},
+            'states': {'t0', 't1'},
+            'initial_state': 't0',
+            'accepting_states': {'t1'},
+            'transitions': {('t0', 'c'): 't1'}
+        }
+        complement = DFA.dfa_complementation(dfa, implicit_sink=True)
+        union = DFA.dfa_union_many([complement, other], order='input')
+        self.assertIsNone(DFA.dfa_equivalence_witness(
+            union, DFA.dfa_union(complement, other)))
+
+
+@unittest.skipIf(numpy is None, 'NumPy not available')
+class TestDfaProductTable(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        # words with an even number of 'a'
+        self.dfa_product_test_01 = {
+            'alphabet': {'a', 'b'},
+            'states': {'e', 'o'},
+            'initial_state': 'e',
+            'accepting_states': {'e'},
+            'transitions': {
+                ('e', 'a'): 'o',
+                ('o', 'a'): 'e',
+                ('e', 'b'): 'e',
+                ('o', 'b'): 'o'
+            }
+        }
+        # words over {'a', 'c'} ending with 'c', partial
+        self.dfa_product_test_02 = {
+            'alphabet': {'a', 'c'},
+            'states': {'q0', 'q1'},
+            'initial_state': 'q0',
+            'accepting_states': {'q1'},
+            'transitions': {
+                ('q0', 'a'): 'q0',
+                ('q0', 'c'): 'q1',
+                ('q1', 'c'): 'q1'
+            }
+        }
+        self.words = [list(word) for length in range(6)
+                      for word in itertools.product('abc', repeat=length)]
+        self.operations = {
+            'intersection': lambda x, y: x and y,
+            'union': lambda x, y: x or y,
+            'difference': lambda x, y: x and not y,
+            'xor': lambda x, y: x != y
+        }
+
+    def test_dfa_product_table_operations(self):
+        """ Tests the four operations on the same product """
+        product = DFA.dfa_product_table(self.dfa_product_test_01,
+                                        self.dfa_product_test_02)
+        for operation, function in self.operations.items():
+            for word in self.words:
+                self.assertEqual(
+                    product.accepts(word, operation),
+                    function(DFA.dfa_word_acceptance(
+                        self.dfa_product_test_01, word),
+                        DFA.dfa_word_acceptance(
+                            self.dfa_product_test_02, word)))
+
+    def test_dfa_product_table_to_dfa(self):
+        """ Tests the DFA of the intersection reads the language of
+        dfa_intersection """
+        product = DFA.dfa_product_table(self.dfa_product_test_01,
+                                        self.dfa_product_test_02)
+        intersection = DFA.dfa_intersection(self.dfa_product_test_01,
+                                            self.dfa_product_test_02)
+        dfa = product.to_dfa('intersection')
+        self.assertEqual(dfa['initial_state'], ('e', 'q0'))
+        self.assertSetEqual(dfa['alphabet'], {'a', 'b', 'c'})
+        for word in self.words:
+            self.assertEqual(DFA.dfa_word_acceptance(dfa, word),
+                             DFA.dfa_word_acceptance(intersection, word))
+
+    def test_dfa_product_table_to_dfa_state_named_sink(self):
+        """ Tests the dead state of a component is not merged with a
+        state of its DFA named 'sink' """
+        dfa_1 = {
+            'alphabet': {'a'},
+            'states': {'s0', 'sink'},
+            'initial_state': 's0',
+            'accepting_states': {'sink'},
+            'transitions': {('s0', 'a'): 'sink'}
+        }
+        dfa_2 = {
+            'alphabet': {'b'},
+            'states': {'t0'},
+            'initial_state': 't0',
+            'accepting_states': set(),
+            'transitions': {('t0', 'b'): 't0'}
+        }
+        product = DFA.dfa_product_table(dfa_1, dfa_2)
+        for operation, function in self.operations.items():
+            dfa = product.to_dfa(operation)
+            for word in self.words:
+                self.assertEqual(
+                    DFA.dfa_word_acceptance(dfa, word),
+                    function(DFA.dfa_word_acceptance(dfa_1, word),
+                             DFA.dfa_word_acceptance(dfa_2, word)))
+        self.assertFalse(DFA.dfa_word_acceptance(product.to_dfa('union'),
+                                                 ['b']))
+
+    def test_dfa_product_table_reachable(self):
+        """ Tests just the reachable pairs are built, as in
+        dfa_union """
+        product = DFA.dfa_product_table(self.dfa_product_test_01,
+                                        self.dfa_product_test_02)
+        union = DFA.dfa_union(self.dfa_product_test_01,
+                              self.dfa_product_test_02)
+        self.assertSetEqual(product.to_dfa('union')['states'],
+                            union['states'])
+
+    def test_dfa_product_table_compiled(self):
+        """ Tests compiled DFAs are accepted in input """
+        product = DFA.dfa_product_table(
+            DFA.compile_dfa(self.dfa_product_test_01),
+            DFA.compile_dfa(self.dfa_product_test_02))
+        self.assertTrue(product.accepts(['a', 'a'], 'union'))
+        self.assertTrue(product.accepts(['a', 'c'], 'union'))
+        self.assertFalse(product.accepts(['a'], 'union'))
+
+    def test_dfa_product_table_wrong_operation(self):
+        """ Tests an unknown operation raises a ValueError """
+        product = DFA.dfa_product_table(self.dfa_product_test_01,
+                                        self.dfa_product_test_02)
+        with self.assertRaises(ValueError):
+            product.accepts(['a'], 'nand')
+
+
 class TestDfaMinimization(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -1354,6 +1947,69 @@ class TestDfaMinimization(TestCase):
         self.assertDictEqual(input_before,
                              self.dfa_minimization_test_02)
 
+    def test_dfa_minimization_fixpoint(self):
+        """ Tests the greatest fix-point algorithm gives the same
+        minimal DFA of Hopcroft's one """
+        hopcroft = DFA.dfa_minimization(self.dfa_minimization_test_02)
+        fixpoint = DFA.dfa_minimization(self.dfa_minimization_test_02,
+                                        algorithm='fixpoint')
+        self.assertEqual(len(hopcroft['states']), len(fixpoint['states']))
+        self.assertEqual(len(hopcroft['transitions']),
+                         len(fixpoint['transitions']))
+        for length in range(7):
+            for word in itertools.product(sorted(hopcroft['alphabet']),
+                                          repeat=length):
+                self.assertEqual(
+                    DFA.dfa_word_acceptance(hopcroft, list(word)),
+                    DFA.dfa_word_acceptance(fixpoint, list(word)))
+
+    def test_dfa_minimization_mapping(self):
+        """ Tests the mapping from states to their representatives """
+        minimal, mapping = DFA.dfa_minimization(
+            self.dfa_minimization_test_02, return_mapping=True)
+        self.assertEqual(mapping['s2'], mapping['s4'])
+        self.assertEqual(mapping['s0'], 's0')
+        self.assertSetEqual(set(mapping.values()), minimal['states'])
+        self.assertSetEqual(set(mapping),
+                            self.dfa_minimization_test_02['states'].union(
+                                {'sink'}))
+
+    def test_dfa_minimization_wrong_algorithm(self):
+        """ Tests an unknown minimization algorithm """
+        with self.assertRaises(ValueError):
+            DFA.dfa_minimization(self.dfa_minimization_test_02,
+                                 algorithm='goofy')
+
+    def test_dfa_minimization_implicit_sink(self):
+        """ Tests the minimization with implicit sink stores just the
+        transitions not leading to the sink and reads the same words
+        """
+        explicit = DFA.dfa_minimization(self.dfa_minimization_test_02)
+        implicit = DFA.dfa_minimization(self.dfa_minimization_test_02,
+                                        implicit_sink=True)
+        self.assertEqual(len(implicit['states']), len(explicit['states']))
+        self.assertNotIn('sink', implicit['transitions'].values())
+        self.assertIsNone(DFA.dfa_equivalence_witness(implicit, explicit))
+
+    def test_dfa_minimization_implicit_sink_complement(self):
+        """ Tests the minimization with implicit sink keeps an
+        accepting sink implicit """
+        complement = DFA.dfa_complementation(self.dfa_minimization_test_02,
+                                             implicit_sink=True)
+        minimal = DFA.dfa_minimization(complement, implicit_sink=True)
+        self.assertIn('sink', minimal['accepting_states'])
+        self.assertFalse(any(state == 'sink' for state, a in
+                             minimal['transitions']))
+        self.assertIsNone(DFA.dfa_equivalence_witness(
+            minimal, DFA.dfa_complementation(self.dfa_minimization_test_02)))
+
+    def test_dfa_minimization_implicit_sink_fixpoint(self):
+        """ Tests the implicit sink is not supported by the fix-point
+        algorithm """
+        with self.assertRaises(ValueError):
+            DFA.dfa_minimization(self.dfa_minimization_test_02,
+                                 algorithm='fixpoint', implicit_sink=True)
+
 
 class TestDfaReachable(TestCase):
     def setUp(self):
@@ -1438,6 +2094,14 @@ class TestDfaReachable(TestCase):
         self.assertEquals(input_before,
                           self.dfa_reachable_test_intersected)
 
+    def test_dfa_reachable_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.dfa_reachable_test_intersected)
+        result = DFA.dfa_reachable(self.dfa_reachable_test_intersected, inplace=False)
+        self.assertEquals(input_before, self.dfa_reachable_test_intersected)
+        self.assertEquals(result, DFA.dfa_reachable(input_before))
+
     def test_dfa_reachable_no_accepting_state_reachable(self):
         """ Tests making reachable a DFA where no accepting state
         is reached by the initial state"""
@@ -1533,6 +2197,14 @@ class TestDfaCoReachable(TestCase):
         self.assertEquals(input_before,
                           self.dfa_co_reachable_test_06)
 
+    def test_dfa_co_reachable_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.dfa_co_reachable_test_06)
+        result = DFA.dfa_co_reachable(self.dfa_co_reachable_test_06, inplace=False)
+        self.assertEquals(input_before, self.dfa_co_reachable_test_06)
+        self.assertEquals(result, DFA.dfa_co_reachable(input_before))
+
     def test_dfa_co_reachable_no_accepting_state_co_reachable(self):
         """ Tests making co_reachable a DFA where the initial
         state doesn't reach any accepting state """
@@ -1580,6 +2252,14 @@ class TestDfaTrimming(TestCase):
         DFA.dfa_trimming(copy.deepcopy(self.dfa_trimming_test_01))
         self.assertEquals(input_before, self.dfa_trimming_test_01)
 
+    def test_dfa_trimming_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.dfa_trimming_test_01)
+        result = DFA.dfa_trimming(self.dfa_trimming_test_01, inplace=False)
+        self.assertEquals(input_before, self.dfa_trimming_test_01)
+        self.assertEquals(result, DFA.dfa_trimming(input_before))
+
     def test_dfa_trimming_empty_states(self):
         """ Tests trimming a DFA without states"""
         test = copy.deepcopy(self.dfa_trimming_test_02)
@@ -1610,6 +2290,35 @@ class TestDfaTrimming(TestCase):
         self.assertEqual(
             DFA.dfa_trimming(self.dfa_trimming_test_04), test)
 
+    def test_dfa_trimming_removed(self):
+        """ Tests the counts of the states and transitions removed by
+        the trimming """
+        states = len(self.dfa_trimming_test_01['states'])
+        transitions = len(self.dfa_trimming_test_01['transitions'])
+        trimmed, removed = DFA.dfa_trimming(self.dfa_trimming_test_01,
+                                            return_removed=True)
+        self.assertDictEqual(removed, {
+            'states': states - len(trimmed['states']),
+            'transitions': transitions - len(trimmed['transitions'])
+        })
+        self.assertGreater(removed['states'], 0)
+
+    def test_dfa_trimming_chained(self):
+        """ Tests the single pass trimming gives the same DFA as
+        making it reachable and then co-reachable """
+        chained = DFA.dfa_co_reachable(DFA.dfa_reachable(
+            copy.deepcopy(self.dfa_trimming_test_01)))
+        self.assertDictEqual(DFA.dfa_trimming(self.dfa_trimming_test_01),
+                             chained)
+
+    def test_dfa_trimming_implicit_sink(self):
+        """ Tests trimming a DFA with an accepting implicit sink keeps
+        the language """
+        complement = DFA.dfa_complementation(self.dfa_trimming_test_01,
+                                             implicit_sink=True)
+        trimmed = DFA.dfa_trimming(complement, inplace=False)
+        self.assertIsNone(DFA.dfa_equivalence_witness(trimmed, complement))
+
 
 class TestDfaProjection(TestCase):
     def setUp(self):
@@ -1716,6 +2425,90 @@ class TestDfaProjection(TestCase):
         p['states'].pop()
         self.assertDictEqual(before, self.dfa_projection_test_01)
 
+    def test_dfa_projection_epsilon_cycle(self):
+        """ Tests a projection where the projected symbols form a
+        cycle, whose states share the same closure """
+        dfa = {
+            'alphabet': {'a', 'x'},
+            'states': {'s0', 's1', 's2', 's3'},
+            'initial_state': 's0',
+            'accepting_states': {'s3'},
+            'transitions': {
+                ('s0', 'x'): 's1',
+                ('s1', 'x'): 's2',
+                ('s2', 'x'): 's0',
+                ('s2', 'a'): 's3',
+                ('s3', 'x'): 's3'
+            }
+        }
+        projection = DFA.dfa_projection(dfa, {'x'})
+        self.assertSetEqual(projection['initial_states'],
+                            {'s0', 's1', 's2'})
+        self.assertDictEqual(projection['transitions'], {
+            ('s0', 'a'): {'s3'},
+            ('s1', 'a'): {'s3'},
+            ('s2', 'a'): {'s3'}
+        })
+
+    def test_dfa_projection_determinize(self):
+        """ Tests the fused determinization of the projection """
+        frozen = frozenset
+        projection = DFA.dfa_projection(self.dfa_projection_test_01,
+                                        {'5c'}, determinize=True,
+                                        state_names='frozenset')
+        every = frozen({'s0', 's1', 's2', 's3'})
+        self.assertDictEqual(projection, {
+            'alphabet': {'10c', 'gum'},
+            'states': {every, frozen({'s2', 's3'}), frozen({'s3'})},
+            'initial_state': every,
+            'accepting_states': {every},
+            'transitions': {
+                (every, '10c'): frozen({'s2', 's3'}),
+                (every, 'gum'): every,
+                (frozen({'s2', 's3'}), '10c'): frozen({'s3'}),
+                (frozen({'s2', 's3'}), 'gum'): every,
+                (frozen({'s3'}), 'gum'): every
+            }
+        })
+
+    def test_dfa_projection_determinize_integer(self):
+        """ Tests the fused determinization names states by integers
+        and reads the projected language """
+        projection = DFA.dfa_projection(self.dfa_projection_test_01,
+                                        {'5c'}, determinize=True,
+                                        state_names='integer')
+        self.assertEqual(projection['initial_state'], 0)
+        self.assertSetEqual(projection['states'], {0, 1, 2})
+        self.assertTrue(DFA.dfa_word_acceptance(projection,
+                                                ['10c', 'gum']))
+        self.assertFalse(DFA.dfa_word_acceptance(projection,
+                                                 ['10c', '10c', '10c']))
+
+    def test_dfa_projection_implicit_sink(self):
+        """ Tests the projection of a DFA with an accepting implicit
+        sink reads the same words as the one of the explicit DFA """
+        dfa = self.dfa_projection_test_01
+        implicit = DFA.dfa_complementation(dfa, implicit_sink=True)
+        explicit = DFA.dfa_complementation(dfa)
+        nfa = DFA.dfa_projection(implicit, {'5c'})
+        determinized = DFA.dfa_projection(implicit, {'5c'},
+                                          determinize=True)
+        expected = DFA.dfa_projection(explicit, {'5c'}, determinize=True)
+        self.assertIsNone(DFA.dfa_equivalence_witness(determinized,
+                                                      expected))
+        for length in range(5):
+            for word in itertools.product(sorted(expected['alphabet']),
+                                          repeat=length):
+                self.assertEqual(
+                    NFA.nfa_word_acceptance(nfa, list(word)),
+                    DFA.dfa_word_acceptance(expected, list(word)))
+
+    def test_dfa_projection_determinize_wrong_state_names(self):
+        """ Tests unknown names for the determinized projection """
+        with self.assertRaises(ValueError):
+            DFA.dfa_projection(self.dfa_projection_test_01, {'5c'},
+                               determinize=True, state_names='goofy')
+
 
 class TestDfaNonemptinessCheck(TestCase):
     def setUp(self):
@@ -1778,6 +2571,22 @@ class TestDfaNonemptinessCheck(TestCase):
         [EXPECTED FAILURE] """
         self.assertFalse(DFA.dfa_nonemptiness_check(0))
 
+    def test_dfa_nonemptiness_witness(self):
+        """ Tests the witness is a shortest nonempty word accepted by
+        the dfa, even if its initial state is accepting """
+        word = DFA.dfa_nonemptiness_witness(
+            self.dfa_nonemptiness_check_test_01)
+        self.assertEqual(len(word), 3)
+        self.assertTrue(DFA.dfa_word_acceptance(
+            self.dfa_nonemptiness_check_test_01, word))
+
+    def test_dfa_nonemptiness_witness_none(self):
+        """ Tests no witness is returned for an empty dfa """
+        self.assertIsNone(DFA.dfa_nonemptiness_witness(
+            self.dfa_nonemptiness_check_test_02))
+        self.assertIsNone(DFA.dfa_nonemptiness_witness(
+            self.dfa_nonemptiness_check_test_03))
+
     def test_dfa_nonemptiness_check_side_effects(self):
         """ Tests that the function doesn't make any side effect on the
         input"""
@@ -1788,6 +2597,267 @@ class TestDfaNonemptinessCheck(TestCase):
                              self.dfa_nonemptiness_check_test_01)
 
 
+class TestDfaIntersectionNonemptinessCheck(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.dfa_intersection_nonemptiness_test_01 = \
+            automata_IO.dfa_dot_importer(
+                './tests/dot/dfa/dfa_nonemptiness_check_test_01.dot')
+        self.dfa_intersection_nonemptiness_test_02 = \
+            automata_IO.dfa_dot_importer(
+                './tests/dot/dfa/dfa_nonemptiness_check_test_02.dot')
+
+    @staticmethod
+    def counter(modulo: int, remainder: int) -> dict:
+        """ Returns a DFA accepting the words over {'a', 'b'} whose
+        number of 'a' modulo **modulo** is **remainder**. """
+        states = {str(modulo) + '_' + str(i) for i in range(modulo)}
+        transitions = dict()
+        for i in range(modulo):
+            state = str(modulo) + '_' + str(i)
+            transitions[state, 'a'] = str(modulo) + '_' + str(
+                (i + 1) % modulo)
+            transitions[state, 'b'] = state
+        return {
+            'alphabet': {'a', 'b'},
+            'states': states,
+            'initial_state': str(modulo) + '_0',
+            'accepting_states': {str(modulo) + '_' + str(remainder)},
+            'transitions': transitions
+        }
+
+    def test_dfa_intersection_nonemptiness_check(self):
+        """ Tests a nonempty intersection of many DFAs """
+        dfas = [self.counter(modulo, 1) for modulo in [2, 3, 5, 7]]
+        self.assertTrue(DFA.dfa_intersection_nonemptiness_check(dfas))
+
+    def test_dfa_intersection_nonemptiness_check_false(self):
+        """ Tests an empty intersection of DFAs """
+        dfas = [self.counter(2, 0), self.counter(4, 1)]
+        self.assertFalse(DFA.dfa_intersection_nonemptiness_check(dfas))
+        self.assertFalse(
+            DFA.dfa_intersection_nonemptiness_check(dfas, prune=False))
+
+    def test_dfa_intersection_nonemptiness_check_empty_component(self):
+        """ Tests the intersection with an empty DFA is empty """
+        self.assertFalse(DFA.dfa_intersection_nonemptiness_check(
+            [self.dfa_intersection_nonemptiness_test_01,
+             self.dfa_intersection_nonemptiness_test_02]))
+
+    def test_dfa_intersection_nonemptiness_check_single(self):
+        """ Tests the intersection of a single DFA agrees with its
+        nonemptiness """
+        self.assertTrue(DFA.dfa_intersection_nonemptiness_check(
+            [self.dfa_intersection_nonemptiness_test_01]))
+
+    def test_dfa_intersection_nonemptiness_check_chained(self):
+        """ Tests the result agrees with the chained intersection """
+        dfas = [self.dfa_intersection_nonemptiness_test_01,
+                self.counter(2, 0), self.counter(3, 2)]
+        chained = DFA.dfa_intersection(
+            DFA.dfa_intersection(dfas[0], dfas[1]), dfas[2])
+        self.assertEqual(DFA.dfa_intersection_nonemptiness_check(dfas),
+                         DFA.dfa_nonemptiness_check(chained))
+
+    def test_dfa_intersection_nonemptiness_witness(self):
+        """ Tests the witness is accepted by all the DFAs """
+        dfas = [self.counter(modulo, 1) for modulo in [2, 3, 5, 7]]
+        word = DFA.dfa_intersection_nonemptiness_witness(dfas)
+        self.assertEqual(word.count('a') % 210, 1)
+        for dfa in dfas:
+            self.assertTrue(DFA.dfa_word_acceptance(dfa, word))
+
+    def test_dfa_intersection_nonemptiness_witness_none(self):
+        """ Tests no witness is returned for an empty intersection """
+        self.assertIsNone(DFA.dfa_intersection_nonemptiness_witness(
+            [self.counter(2, 0), self.counter(4, 1)]))
+
+    def test_dfa_intersection_nonemptiness_check_no_dfa(self):
+        """ Tests an empty list of DFAs raises a ValueError """
+        with self.assertRaises(ValueError):
+            DFA.dfa_intersection_nonemptiness_check([])
+
+
+class TestDfaEquivalenceCheck(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.dfa_equivalence_test_01 = {
+            'alphabet': {'a', 'b'},
+            'states': {'e', 'o'},
+            'initial_state': 'e',
+            'accepting_states': {'e'},
+            'transitions': {
+                ('e', 'a'): 'o',
+                ('o', 'a'): 'e',
+                ('e', 'b'): 'e',
+                ('o', 'b'): 'o'
+            }
+        }
+        # same language (even number of 'a'), redundant states
+        self.dfa_equivalence_test_02 = {
+            'alphabet': {'a', 'b'},
+            'states': {'e0', 'e1', 'o0', 'o1'},
+            'initial_state': 'e0',
+            'accepting_states': {'e0', 'e1'},
+            'transitions': {
+                ('e0', 'a'): 'o0',
+                ('o0', 'a'): 'e1',
+                ('e1', 'a'): 'o1',
+                ('o1', 'a'): 'e0',
+                ('e0', 'b'): 'e1',
+                ('e1', 'b'): 'e0',
+                ('o0', 'b'): 'o1',
+                ('o1', 'b'): 'o0'
+            }
+        }
+        # even number of 'a' and no 'b' after the second 'a'
+        self.dfa_equivalence_test_03 = {
+            'alphabet': {'a', 'b'},
+            'states': {'e0', 'o0', 'e1', 'o1'},
+            'initial_state': 'e0',
+            'accepting_states': {'e0', 'e1'},
+            'transitions': {
+                ('e0', 'a'): 'o0',
+                ('o0', 'a'): 'e1',
+                ('e1', 'a'): 'o1',
+                ('o1', 'a'): 'e1',
+                ('e0', 'b'): 'e0',
+                ('o0', 'b'): 'o0'
+            }
+        }
+        self.dfa_equivalence_test_empty = {
+            'alphabet': set(),
+            'states': set(),
+            'initial_state': None,
+            'accepting_states': set(),
+            'transitions': {}
+        }
+
+    def test_dfa_equivalence_check(self):
+        """ Tests the equivalence of two DFAs reading the same
+        language """
+        self.assertTrue(DFA.dfa_equivalence_check(
+            self.dfa_equivalence_test_01, self.dfa_equivalence_test_02))
+
+    def test_dfa_equivalence_check_minimization(self):
+        """ Tests the equivalence of a DFA with its minimization """
+        self.assertTrue(DFA.dfa_equivalence_check(
+            self.dfa_equivalence_test_03,
+            DFA.dfa_minimization(self.dfa_equivalence_test_03)))
+
+    def test_dfa_equivalence_check_false(self):
+        """ Tests two DFAs reading different languages """
+        self.assertFalse(DFA.dfa_equivalence_check(
+            self.dfa_equivalence_test_01, self.dfa_equivalence_test_03))
+
+    def test_dfa_equivalence_witness(self):
+        """ Tests the distinguishing word is a shortest one """
+        word = DFA.dfa_equivalence_witness(
+            self.dfa_equivalence_test_01, self.dfa_equivalence_test_03)
+        self.assertEqual(len(word), 3)
+        self.assertNotEqual(
+            DFA.dfa_word_acceptance(self.dfa_equivalence_test_01, word),
+            DFA.dfa_word_acceptance(self.dfa_equivalence_test_03, word))
+
+    def test_dfa_equivalence_witness_none(self):
+        """ Tests no word is returned for equivalent DFAs """
+        self.assertIsNone(DFA.dfa_equivalence_witness(
+            self.dfa_equivalence_test_01, self.dfa_equivalence_test_02))
+
+    def test_dfa_equivalence_witness_empty_word(self):
+        """ Tests the empty word distinguishes a DFA from its
+        complement """
+        self.assertEqual(DFA.dfa_equivalence_witness(
+            self.dfa_equivalence_test_01,
+            DFA.dfa_complementation(self.dfa_equivalence_test_01)), [])
+
+    def test_dfa_equivalence_check_empty(self):
+        """ Tests the empty DFA is equivalent to a DFA without
+        accepting states """
+        self.dfa_equivalence_test_01['accepting_states'] = set()
+        self.assertTrue(DFA.dfa_equivalence_check(
+            self.dfa_equivalence_test_empty, self.dfa_equivalence_test_01))
+
+    def test_dfa_equivalence_check_random(self):
+        """ Tests the witness against all the words up to length 6 on
+        random DFAs """
+        rng = random.Random(0)
+        words = [list(word) for length in range(7)
+                 for word in itertools.product('ab', repeat=length)]
+        for _ in range(50):
+            dfas = list()
+            for _ in range(2):
+                states = list(range(rng.randint(1, 4)))
+                dfas.append({
+                    'alphabet': {'a', 'b'},
+                    'states': set(states),
+                    'initial_state': 0,
+                    'accepting_states': set(
+                        rng.sample(states, rng.randint(0, len(states)))),
+                    'transitions': {(s, a): rng.choice(states)
+                                    for s in states for a in 'ab'
+                                    if rng.random() < 0.8}
+                })
+            expected = [word for word in words
+                        if DFA.dfa_word_acceptance(dfas[0], word) !=
+                        DFA.dfa_word_acceptance(dfas[1], word)]
+            witness = DFA.dfa_equivalence_witness(*dfas)
+            if expected:
+                self.assertEqual(len(witness), len(expected[0]))
+                self.assertIn(witness, expected)
+            else:
+                self.assertIsNone(witness)
+
+
+class TestDfaInclusionCheck(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        # words with an even number of 'a'
+        self.dfa_inclusion_test_01 = {
+            'alphabet': {'a', 'b'},
+            'states': {'e', 'o'},
+            'initial_state': 'e',
+            'accepting_states': {'e'},
+            'transitions': {
+                ('e', 'a'): 'o',
+                ('o', 'a'): 'e',
+                ('e', 'b'): 'e',
+                ('o', 'b'): 'o'
+            }
+        }
+        # words of only 'a' of even length
+        self.dfa_inclusion_test_02 = {
+            'alphabet': {'a', 'b'},
+            'states': {'e', 'o'},
+            'initial_state': 'e',
+            'accepting_states': {'e'},
+            'transitions': {
+                ('e', 'a'): 'o',
+                ('o', 'a'): 'e'
+            }
+        }
+
+    def test_dfa_inclusion_check(self):
+        """ Tests a DFA included in another one """
+        self.assertTrue(DFA.dfa_inclusion_check(
+            self.dfa_inclusion_test_02, self.dfa_inclusion_test_01))
+
+    def test_dfa_inclusion_check_false(self):
+        """ Tests a DFA not included in another one """
+        self.assertFalse(DFA.dfa_inclusion_check(
+            self.dfa_inclusion_test_01, self.dfa_inclusion_test_02))
+
+    def test_dfa_inclusion_witness(self):
+        """ Tests the counterexample is a shortest one """
+        self.assertEqual(DFA.dfa_inclusion_witness(
+            self.dfa_inclusion_test_01, self.dfa_inclusion_test_02), ['b'])
+
+    def test_dfa_inclusion_witness_none(self):
+        """ Tests no word is returned if the inclusion holds """
+        self.assertIsNone(DFA.dfa_inclusion_witness(
+            self.dfa_inclusion_test_02, self.dfa_inclusion_test_01))
+
+
 class TestRenameDfaStates(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -1799,3 +2869,19 @@ class TestRenameDfaStates(TestCase):
         automata_IO.dfa_to_dot(DFA.rename_dfa_states(self.dfa_1, 'TOP_'),
                                'dfa_renamed_1',
                                'tests/outputs')
+
+    def test_rename_dfa_states_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.dfa_1)
+        result = DFA.rename_dfa_states(self.dfa_1, 'TOP_', inplace=False)
+        self.assertEquals(input_before, self.dfa_1)
+        self.assertEquals(result, DFA.rename_dfa_states(input_before, 'TOP_'))
+
+    def test_rename_dfa_states_implicit_sink(self):
+        """ Tests the implicit sink is renamed with the states """
+        complement = DFA.dfa_complementation(self.dfa_1, implicit_sink=True)
+        sink = complement['implicit_sink']
+        renamed = DFA.rename_dfa_states(complement, 'TOP_', inplace=False)
+        self.assertEqual(renamed['implicit_sink'], 'TOP_' + sink)
+        self.assertIsNone(DFA.dfa_equivalence_witness(renamed, complement))
@@ -1,6 +1,7 @@
 from unittest import TestCase
 import unittest
 import copy
+import itertools
 from .context import PySimpleAutomata
 from PySimpleAutomata import NFA
 from PySimpleAutomata import automata_IO
@@ -294,6 +295,47 @@ class TestNfaDeterminization(TestCase):
         # of the operation to a predetermined result without
         # enlist all the possible combination of S^2
 
+    def test_nfa_determinization_integer_names(self):
+        """ Tests a nfa determinization with integer state names and
+        the mapping back to the sets of NFA states """
+        dfa_determined, mapping = NFA.nfa_determinization(
+            self.nfa_determinization_test_02, state_names='integer',
+            return_mapping=True)
+        self.assertEqual(len(dfa_determined['states']), 14)
+        self.assertEqual(len(dfa_determined['accepting_states']), 11)
+        self.assertEqual(len(dfa_determined['transitions']), 39)
+        self.assertSetEqual(dfa_determined['states'], set(range(14)))
+        self.assertEqual(dfa_determined['initial_state'], 0)
+        self.assertEqual(
+            mapping[0],
+            frozenset(self.nfa_determinization_test_02['initial_states']))
+        for ((state, action), destination) in \
+                dfa_determined['transitions'].items():
+            arriving = set()
+            for nfa_state in mapping[state]:
+                arriving.update(
+                    self.nfa_determinization_test_02['transitions'].get(
+                        (nfa_state, action), set()))
+            self.assertSetEqual(mapping[destination], arriving)
+
+    def test_nfa_determinization_frozenset_names(self):
+        """ Tests a nfa determinization with frozenset state names """
+        dfa_determined = NFA.nfa_determinization(
+            self.nfa_determinization_test_01, state_names='frozenset')
+        self.assertEqual(len(dfa_determined['states']), 10)
+        self.assertEqual(
+            dfa_determined['initial_state'],
+            frozenset(self.nfa_determinization_test_01['initial_states']))
+        for state in dfa_determined['accepting_states']:
+            self.assertTrue(state.intersection(
+                self.nfa_determinization_test_01['accepting_states']))
+
+    def test_nfa_determinization_wrong_names(self):
+        """ Tests unknown state names """
+        with self.assertRaises(ValueError):
+            NFA.nfa_determinization(self.nfa_determinization_test_01,
+                                    state_names='goofy')
+
     def test_nfa_determinization_empty_states(self):
         """ Tests a NFA determinization with an empty NFA """
         dfa_determined = NFA.nfa_determinization(
@@ -494,6 +536,25 @@ class TestNfaNonemptinessCheck(TestCase):
         dict object. [EXPECTED FAILURE] """
         self.assertFalse(NFA.nfa_nonemptiness_check(0))
 
+    def test_nfa_nonemptiness_witness(self):
+        """ Tests the witness is a shortest word accepted by the nfa """
+        self.assertIn(
+            NFA.nfa_nonemptiness_witness(self.nfa_nonemptiness_test_01),
+            [['a', 'b'], ['b', 'a']])
+
+    def test_nfa_nonemptiness_witness_compiled(self):
+        """ Tests the witness of a compiled nfa """
+        self.assertIn(NFA.nfa_nonemptiness_witness(
+            NFA.compile_nfa(self.nfa_nonemptiness_test_01)),
+            [['a', 'b'], ['b', 'a']])
+
+    def test_nfa_nonemptiness_witness_none(self):
+        """ Tests no witness is returned for an empty nfa """
+        self.assertIsNone(
+            NFA.nfa_nonemptiness_witness(self.nfa_nonemptiness_test_02))
+        self.assertIsNone(NFA.nfa_nonemptiness_witness(
+            self.nfa_nonemptiness_test_empty))
+
     def test_nfa_nonemptiness_check_side_effects(self):
         """ Tests that the function doesn't make any side effect
         on the input"""
@@ -502,6 +563,83 @@ class TestNfaNonemptinessCheck(TestCase):
         self.assertDictEqual(before, self.nfa_nonemptiness_test_01)
 
 
+class TestNfaIntersectionNonemptinessCheck(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.nfa_intersection_nonemptiness_test_01 = \
+            automata_IO.nfa_dot_importer(
+                './tests/dot/nfa/nfa_nonemptiness_test_01.dot')
+        self.nfa_intersection_nonemptiness_test_02 = \
+            automata_IO.nfa_dot_importer(
+                './tests/dot/nfa/nfa_nonemptiness_test_02.dot')
+        # words over {'a', 'b'} ending with 'b'
+        self.nfa_intersection_nonemptiness_test_03 = {
+            'alphabet': {'a', 'b'},
+            'states': {'t0', 't1'},
+            'initial_states': {'t0'},
+            'accepting_states': {'t1'},
+            'transitions': {
+                ('t0', 'a'): {'t0'},
+                ('t0', 'b'): {'t0', 't1'}
+            }
+        }
+        # words over {'a', 'b'} ending with 'a'
+        self.nfa_intersection_nonemptiness_test_04 = {
+            'alphabet': {'a', 'b'},
+            'states': {'u0', 'u1'},
+            'initial_states': {'u0'},
+            'accepting_states': {'u1'},
+            'transitions': {
+                ('u0', 'a'): {'u0', 'u1'},
+                ('u0', 'b'): {'u0'}
+            }
+        }
+
+    def test_nfa_intersection_nonemptiness_check(self):
+        """ Tests a nonempty intersection of NFAs """
+        self.assertTrue(NFA.nfa_intersection_nonemptiness_check(
+            [self.nfa_intersection_nonemptiness_test_01,
+             self.nfa_intersection_nonemptiness_test_03]))
+
+    def test_nfa_intersection_nonemptiness_check_false(self):
+        """ Tests an empty intersection of NFAs """
+        nfas = [self.nfa_intersection_nonemptiness_test_03,
+                self.nfa_intersection_nonemptiness_test_04]
+        self.assertFalse(NFA.nfa_intersection_nonemptiness_check(nfas))
+        self.assertFalse(
+            NFA.nfa_intersection_nonemptiness_check(nfas, prune=False))
+
+    def test_nfa_intersection_nonemptiness_check_empty_component(self):
+        """ Tests the intersection with an empty NFA is empty """
+        self.assertFalse(NFA.nfa_intersection_nonemptiness_check(
+            [self.nfa_intersection_nonemptiness_test_01,
+             self.nfa_intersection_nonemptiness_test_02]))
+
+    def test_nfa_intersection_nonemptiness_check_chained(self):
+        """ Tests the result agrees with the chained intersection """
+        nfas = [self.nfa_intersection_nonemptiness_test_01,
+                self.nfa_intersection_nonemptiness_test_03,
+                self.nfa_intersection_nonemptiness_test_04]
+        chained = NFA.nfa_intersection(
+            NFA.nfa_intersection(nfas[0], nfas[1]), nfas[2])
+        self.assertEqual(NFA.nfa_intersection_nonemptiness_check(nfas),
+                         NFA.nfa_nonemptiness_check(chained))
+
+    def test_nfa_intersection_nonemptiness_witness(self):
+        """ Tests the witness is accepted by all the NFAs """
+        nfas = [self.nfa_intersection_nonemptiness_test_01,
+                self.nfa_intersection_nonemptiness_test_03]
+        word = NFA.nfa_intersection_nonemptiness_witness(nfas)
+        for nfa in nfas:
+            self.assertTrue(NFA.nfa_word_acceptance(nfa, word))
+
+    def test_nfa_intersection_nonemptiness_witness_none(self):
+        """ Tests no witness is returned for an empty intersection """
+        self.assertIsNone(NFA.nfa_intersection_nonemptiness_witness(
+            [self.nfa_intersection_nonemptiness_test_03,
+             self.nfa_intersection_nonemptiness_test_04]))
+
+
 class TestNfaNonuniversalityCheck(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -556,6 +694,85 @@ class TestNfaNonuniversalityCheck(TestCase):
         self.assertDictEqual(before,
                              self.nfa_nonuniversality_test_01)
 
+    def test_nfa_nonuniversality_witness(self):
+        """ Tests the word returned is a shortest one not accepted """
+        word = NFA.nfa_nonuniversality_witness(
+            self.nfa_nonuniversality_test_01)
+        self.assertEqual(len(word), 1)
+        self.assertFalse(NFA.nfa_word_acceptance(
+            self.nfa_nonuniversality_test_01, word))
+
+    def test_nfa_nonuniversality_witness_universal(self):
+        """ Tests no word is returned for a universal nfa """
+        self.assertIsNone(NFA.nfa_nonuniversality_witness(
+            self.nfa_nonuniversality_test_02))
+
+
+class TestNfaInclusionCheck(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.nfa_nonuniversality_test_01 = \
+            automata_IO.nfa_dot_importer(
+                './tests/dot/nfa/nfa_nonuniversality_test_01.dot')
+        self.nfa_nonuniversality_test_02 = \
+            automata_IO.nfa_dot_importer(
+                './tests/dot/nfa/nfa_nonuniversality_test_02.dot')
+        self.nfa_intersection_1_test_01 = \
+            automata_IO.nfa_dot_importer(
+                './tests/dot/nfa/nfa_intersection_1_test_01.dot')
+        self.nfa_intersection_2_test_01 = \
+            automata_IO.nfa_dot_importer(
+                './tests/dot/nfa/nfa_intersection_2_test_01.dot')
+
+    def test_nfa_inclusion_check(self):
+        """ Tests the inclusion in a universal nfa and of an
+        intersection in its operands """
+        self.assertTrue(NFA.nfa_inclusion_check(
+            self.nfa_nonuniversality_test_01,
+            self.nfa_nonuniversality_test_02))
+        intersection = NFA.nfa_intersection(self.nfa_intersection_1_test_01,
+                                            self.nfa_intersection_2_test_01)
+        self.assertTrue(NFA.nfa_inclusion_check(
+            intersection, self.nfa_intersection_1_test_01))
+        self.assertTrue(NFA.nfa_inclusion_check(
+            intersection, self.nfa_intersection_2_test_01))
+
+    def test_nfa_inclusion_check_false(self):
+        """ Tests a correct non inclusion with its counterexample """
+        self.assertFalse(NFA.nfa_inclusion_check(
+            self.nfa_nonuniversality_test_02,
+            self.nfa_nonuniversality_test_01))
+        word = NFA.nfa_inclusion_witness(self.nfa_nonuniversality_test_02,
+                                         self.nfa_nonuniversality_test_01)
+        self.assertTrue(NFA.nfa_word_acceptance(
+            self.nfa_nonuniversality_test_02, word))
+        self.assertFalse(NFA.nfa_word_acceptance(
+            self.nfa_nonuniversality_test_01, word))
+
+    def test_nfa_inclusion_check_empty_word(self):
+        """ Tests the empty word as counterexample """
+        nfa_empty_word = {
+            'alphabet': {'a', 'b'},
+            'states': {'e'},
+            'initial_states': {'e'},
+            'accepting_states': {'e'},
+            'transitions': {}
+        }
+        self.assertEqual(
+            NFA.nfa_inclusion_witness(nfa_empty_word,
+                                      self.nfa_nonuniversality_test_02),
+            [])
+
+    def test_nfa_inclusion_check_side_effects(self):
+        """ Tests the function doesn't make any side effect on the
+        inputs """
+        before_1 = copy.deepcopy(self.nfa_nonuniversality_test_01)
+        before_2 = copy.deepcopy(self.nfa_nonuniversality_test_02)
+        NFA.nfa_inclusion_check(self.nfa_nonuniversality_test_01,
+                                self.nfa_nonuniversality_test_02)
+        self.assertDictEqual(before_1, self.nfa_nonuniversality_test_01)
+        self.assertDictEqual(before_2, self.nfa_nonuniversality_test_02)
+
 
 class TestNfaInterestingnessCheck(TestCase):
     def setUp(self):
@@ -680,6 +897,130 @@ class TestNfaWordAcceptance(TestCase):
                              self.nfa_word_acceptance_test_01)
 
 
+class TestCompileNfa(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.nfa_word_acceptance_test_01 = automata_IO.nfa_dot_importer(
+            './tests/dot/nfa/nfa_word_acceptance_test_01.dot')
+        self.nfa_determinization_test_02 = automata_IO.nfa_dot_importer(
+            './tests/dot/nfa/nfa_determinization_test_02.dot')
+        self.nfa_nonemptiness_test_01 = automata_IO.nfa_dot_importer(
+            './tests/dot/nfa/nfa_nonemptiness_test_01.dot')
+        self.nfa_nonemptiness_test_02 = automata_IO.nfa_dot_importer(
+            './tests/dot/nfa/nfa_nonemptiness_test_02.dot')
+
+    def test_compile_nfa_word_acceptance(self):
+        """ Tests the compiled NFA accepts the same words of the
+        original one """
+        for nfa in [self.nfa_word_acceptance_test_01,
+                    self.nfa_determinization_test_02]:
+            compiled = NFA.compile_nfa(nfa)
+            for length in range(6):
+                for word in itertools.product(sorted(nfa['alphabet']),
+                                              repeat=length):
+                    self.assertEqual(
+                        NFA.nfa_word_acceptance(compiled, list(word)),
+                        NFA.nfa_word_acceptance(nfa, list(word)))
+
+    def test_compile_nfa_wrong_alphabet(self):
+        """ Tests a word with letters not from the nfa alphabet """
+        compiled = NFA.compile_nfa(self.nfa_word_acceptance_test_01)
+        self.assertFalse(NFA.nfa_word_acceptance(compiled, ['wrong']))
+
+    def test_compile_nfa_masks(self):
+        """ Tests the conversion between masks and sets of states """
+        compiled = NFA.compile_nfa(self.nfa_word_acceptance_test_01)
+        states = self.nfa_word_acceptance_test_01['states']
+        self.assertSetEqual(compiled.states_of(compiled.mask(states)),
+                            states)
+        self.assertSetEqual(
+            compiled.states_of(compiled.initial_states),
+            self.nfa_word_acceptance_test_01['initial_states'])
+
+    def test_compile_nfa_nonemptiness_check(self):
+        """ Tests the nonemptiness check on a compiled NFA """
+        self.assertTrue(NFA.nfa_nonemptiness_check(
+            NFA.compile_nfa(self.nfa_nonemptiness_test_01)))
+        self.assertFalse(NFA.nfa_nonemptiness_check(
+            NFA.compile_nfa(self.nfa_nonemptiness_test_02)))
+
+    def test_compile_nfa_determinization(self):
+        """ Tests the determinization of a compiled NFA gives the
+        same DFA of the dict-based one """
+        self.assertDictEqual(
+            NFA.nfa_determinization(
+                NFA.compile_nfa(self.nfa_determinization_test_02),
+                state_names='frozenset'),
+            NFA.nfa_determinization(self.nfa_determinization_test_02,
+                                    state_names='frozenset'))
+        dfa_determined = NFA.nfa_determinization(
+            NFA.compile_nfa(self.nfa_determinization_test_02))
+        self.assertEqual(len(dfa_determined['states']), 14)
+        self.assertEqual(len(dfa_determined['transitions']), 39)
+
+    def test_compile_nfa_side_effects(self):
+        """ Tests the function doesn't make side effects on input """
+        before = copy.deepcopy(self.nfa_word_acceptance_test_01)
+        NFA.compile_nfa(self.nfa_word_acceptance_test_01)
+        self.assertDictEqual(before, self.nfa_word_acceptance_test_01)
+
+
+class TestNfaLazyDeterminization(TestCase):
+    def setUp(self):
+        self.nfa_determinization_test_02 = automata_IO.nfa_dot_importer(
+            './tests/dot/nfa/nfa_determinization_test_02.dot')
+        alphabet = sorted(self.nfa_determinization_test_02['alphabet'])
+        self.words = [list(word)
+                      for length in range(6)
+                      for word in itertools.product(alphabet, repeat=length)]
+
+    def test_nfa_lazy_determinization(self):
+        """ Tests the lazy DFA accepts the same words of the NFA """
+        lazy_dfa = NFA.nfa_lazy_determinization(
+            self.nfa_determinization_test_02)
+        for word in self.words:
+            self.assertEqual(
+                NFA.nfa_word_acceptance(lazy_dfa, word),
+                NFA.nfa_word_acceptance(self.nfa_determinization_test_02,
+                                        word))
+        # just the transitions of the full DFA are ever built
+        self.assertLessEqual(lazy_dfa.misses, 39 + 14)
+        self.assertEqual(lazy_dfa.resets, 0)
+
+    def test_nfa_lazy_determinization_counters(self):
+        """ Tests cache hits are counted reading twice the same word """
+        lazy_dfa = NFA.nfa_lazy_determinization(
+            self.nfa_determinization_test_02)
+        word = self.words[-1]
+        lazy_dfa.accepts(word)
+        misses = lazy_dfa.misses
+        steps = lazy_dfa.hits + lazy_dfa.misses
+        self.assertGreater(steps, 0)
+        lazy_dfa.accepts(word)
+        self.assertEqual(lazy_dfa.misses, misses)
+        self.assertEqual(lazy_dfa.hits + lazy_dfa.misses, 2 * steps)
+        self.assertGreaterEqual(lazy_dfa.hit_rate, 0.5)
+
+    def test_nfa_lazy_determinization_bounded_cache(self):
+        """ Tests the cache is flushed when full, still giving correct
+        results """
+        lazy_dfa = NFA.nfa_lazy_determinization(
+            self.nfa_determinization_test_02, max_transitions=3)
+        for word in self.words:
+            self.assertEqual(
+                lazy_dfa.accepts(word),
+                NFA.nfa_word_acceptance(self.nfa_determinization_test_02,
+                                        word))
+            self.assertLessEqual(len(lazy_dfa.transitions), 3)
+        self.assertGreater(lazy_dfa.resets, 0)
+
+    def test_nfa_lazy_determinization_wrong_size(self):
+        """ Tests a cache without room for transitions """
+        with self.assertRaises(ValueError):
+            NFA.nfa_lazy_determinization(self.nfa_determinization_test_02,
+                                         max_transitions=0)
+
+
 class TestRenameNfaStates(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -691,3 +1032,11 @@ class TestRenameNfaStates(TestCase):
         automata_IO.nfa_to_dot(NFA.rename_nfa_states(self.nfa_1, 'TOP_'),
                                'nfa_renamed_1',
                                'tests/outputs')
+
+    def test_rename_nfa_states_not_inplace(self):
+        """ Tests the function without inplace leaves the input
+        untouched and returns the same result """
+        input_before = copy.deepcopy(self.nfa_1)
+        result = NFA.rename_nfa_states(self.nfa_1, 'TOP_', inplace=False)
+        self.assertEquals(input_before, self.nfa_1)
+        self.assertEquals(result, NFA.rename_nfa_states(input_before, 'TOP_'))
@@ -0,0 +1,148 @@
+from unittest import TestCase
+import weakref
+from .context import PySimpleAutomata
+from PySimpleAutomata import DFA
+from PySimpleAutomata import NFA
+from PySimpleAutomata import adjacency
+
+
+class TestAdjacency(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.dfa = {
+            'alphabet': {'a', 'b'},
+            'states': {'s0', 's1', 's2'},
+            'initial_state': 's0',
+            'accepting_states': {'s2'},
+            'transitions': {
+                ('s0', 'a'): 's1',
+                ('s0', 'b'): 's2',
+                ('s1', 'a'): 's2'
+            }
+        }
+        self.nfa = {
+            'alphabet': {'a'},
+            'states': {'s0', 's1', 's2'},
+            'initial_states': {'s0'},
+            'accepting_states': {'s2'},
+            'transitions': {
+                ('s0', 'a'): {'s1', 's2'},
+                ('s1', 'a'): {'s2'}
+            }
+        }
+
+    def test_successors_dfa(self):
+        """ Tests the successors index of a DFA """
+        successors = adjacency.dfa_successors(self.dfa)
+        self.assertSetEqual(set(successors['s0']), {('a', 's1'),
+                                                    ('b', 's2')})
+        self.assertListEqual(successors['s1'], [('a', 's2')])
+        self.assertNotIn('s2', successors)
+
+    def test_predecessors_dfa(self):
+        """ Tests the predecessors index of a DFA """
+        predecessors = adjacency.dfa_predecessors(self.dfa)
+        self.assertSetEqual(set(predecessors['s2']), {('b', 's0'),
+                                                      ('a', 's1')})
+        self.assertListEqual(predecessors['s1'], [('a', 's0')])
+        self.assertNotIn('s0', predecessors)
+
+    def test_successors_nfa(self):
+        """ Tests the successors index of a NFA has an entry for each
+        arriving state """
+        successors = adjacency.nfa_successors(self.nfa)
+        self.assertSetEqual(set(successors['s0']), {('a', 's1'),
+                                                    ('a', 's2')})
+
+    def test_predecessors_nfa(self):
+        """ Tests the predecessors index of a NFA """
+        predecessors = adjacency.nfa_predecessors(self.nfa)
+        self.assertSetEqual(set(predecessors['s2']), {('a', 's0'),
+                                                      ('a', 's1')})
+
+    def test_successors_dfa_frozenset_states(self):
+        """ Tests the states of a DFA named by frozensets, as the ones
+        of a determinized NFA, are not split as sets of states """
+        dfa = NFA.nfa_determinization(self.nfa, state_names='frozenset')
+        successors = adjacency.dfa_successors(dfa)
+        self.assertListEqual(successors[frozenset({'s0'})],
+                             [('a', frozenset({'s1', 's2'}))])
+        predecessors = adjacency.dfa_predecessors(dfa)
+        self.assertListEqual(predecessors[frozenset({'s1', 's2'})],
+                             [('a', frozenset({'s0'}))])
+
+    def test_library_frozenset_states(self):
+        """ Tests the library functions on a DFA with states named by
+        frozensets """
+        dfa = NFA.nfa_determinization(self.nfa, state_names='frozenset')
+        self.assertTrue(DFA.dfa_nonemptiness_check(dfa))
+        self.assertDictEqual(DFA.dfa_reachable(dfa, inplace=False), dfa)
+        self.assertDictEqual(DFA.dfa_trimming(dfa, inplace=False), dfa)
+        self.assertIsNone(DFA.dfa_equivalence_witness(
+            DFA.dfa_minimization(dfa, implicit_sink=True), dfa))
+
+    def test_cached(self):
+        """ Tests the indexes are built once """
+        self.assertIs(adjacency.dfa_successors(self.dfa),
+                      adjacency.dfa_successors(self.dfa))
+        self.assertIs(adjacency.dfa_predecessors(self.dfa),
+                      adjacency.dfa_predecessors(self.dfa))
+        self.assertIs(adjacency.nfa_successors(self.nfa),
+                      adjacency.nfa_successors(self.nfa))
+
+    def test_transition_changed(self):
+        """ Tests the library functions see a transition changed in
+        place once the indexes are invalidated """
+        dfa = {
+            'alphabet': {'a'},
+            'states': {'s0', 's1', 's2'},
+            'initial_state': 's0',
+            'accepting_states': {'s2'},
+            'transitions': {('s0', 'a'): 's1'}
+        }
+        self.assertFalse(DFA.dfa_nonemptiness_check(dfa))
+        dfa['transitions']['s0', 'a'] = 's2'
+        adjacency.invalidate(dfa)
+        self.assertTrue(DFA.dfa_nonemptiness_check(dfa))
+        self.assertSetEqual(DFA.dfa_reachable(dfa, inplace=False)['states'],
+                            {'s0', 's2'})
+
+    def test_stale_size(self):
+        """ Tests the indexes are rebuilt if transitions were added
+        without an invalidation """
+        adjacency.dfa_successors(self.dfa)
+        self.dfa['transitions']['s2', 'a'] = 's0'
+        self.assertListEqual(adjacency.dfa_successors(self.dfa)['s2'],
+                             [('a', 's0')])
+
+    def test_stale_transitions(self):
+        """ Tests the indexes are rebuilt if the transitions dict was
+        replaced """
+        adjacency.dfa_successors(self.dfa)
+        self.dfa['transitions'] = {('s0', 'a'): 's0'}
+        self.assertDictEqual(adjacency.dfa_successors(self.dfa),
+                             {'s0': [('a', 's0')]})
+
+    def test_dropped_with_states(self):
+        """ Tests the indexes do not keep the automaton alive and are
+        dropped with its set of states """
+        dfa = {'states': {'s0'}, 'transitions': {('s0', 'a'): 's0'}}
+        states = weakref.ref(dfa['states'])
+        adjacency.dfa_successors(dfa)
+        key = id(dfa['states'])
+        self.assertIn(key, adjacency._cache)
+        del dfa
+        self.assertIsNone(states())
+        self.assertNotIn(key, adjacency._cache)
+
+    def test_library_mutation(self):
+        """ Tests the indexes follow the changes made in place by the
+        library functions """
+        adjacency.dfa_successors(self.dfa)
+        adjacency.dfa_predecessors(self.dfa)
+        DFA.dfa_completion(self.dfa)
+        self.assertEqual(len(adjacency.dfa_successors(self.dfa)['s2']), 2)
+        DFA.dfa_co_reachable(self.dfa)
+        self.assertNotIn('sink', adjacency.dfa_predecessors(self.dfa))
+        DFA.rename_dfa_states(self.dfa, 'x_')
+        self.assertIn('x_s0', adjacency.dfa_successors(self.dfa))
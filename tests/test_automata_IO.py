@@ -1,5 +1,10 @@
 from unittest import TestCase
 import unittest
+import json
+import os
+import shutil
+from unittest import mock
+import pydot
 from .context import PySimpleAutomata
 from PySimpleAutomata import DFA
 from PySimpleAutomata import NFA
@@ -90,6 +95,28 @@ class TestDfaDotImporter(TestCase):
             '/automata_io_dfa_importing_intersection.dot')
         self.assertDictEqual(dfa_02, self.dfa_test_02)
 
+    def test_dfa_dot_importer_comments(self):
+        """ Tests importing a dfa from a dot file with comments, chains
+        of edges and more attribute lists, read without pydot """
+        with mock.patch.object(automata_IO.pydot, 'graph_from_dot_file',
+                               wraps=pydot.graph_from_dot_file) as parse:
+            dfa_01 = automata_IO.dfa_dot_importer(
+                './tests/dot/automata_io'
+                '/automata_io_dfa_importer_comments.dot')
+        parse.assert_not_called()
+        self.assertDictEqual(dfa_01, self.dfa_test)
+
+    def test_dfa_dot_importer_pydot_fallback(self):
+        """ Tests importing a dfa from a dot file not handled by the
+        native parser, read with pydot """
+        with mock.patch.object(automata_IO.pydot, 'graph_from_dot_file',
+                               wraps=pydot.graph_from_dot_file) as parse:
+            dfa_01 = automata_IO.dfa_dot_importer(
+                './tests/dot/automata_io'
+                '/automata_io_dfa_importer_pydot_fallback.dot')
+        parse.assert_called_once()
+        self.assertDictEqual(dfa_01, self.dfa_test)
+
     def test_dfa_dot_importer_no_state_only_transitions(self):
         """ WARNING! importing a .dot where no explicit state,
         but just transitions are present.
@@ -129,6 +156,70 @@ class TestDfaToDot(TestCase):
                                'graphviz_dfa_intersection_render_test',
                                'tests/outputs')
 
+    def test_dfa_to_dot_round_trip(self):
+        """ Tests the DOT file written is imported back as the
+        same DFA """
+        output_file = automata_IO.dfa_to_dot(self.dfa_intersected,
+                                             'dfa_to_dot_round_trip',
+                                             'tests/outputs')
+        self.assertEqual(output_file, os.path.join(
+            'tests/outputs', 'dfa_to_dot_round_trip.dot'))
+        self.assertDictEqual(automata_IO.dfa_dot_importer(output_file),
+                             self.dfa_intersected)
+
+    def test_dfa_to_dot_implicit_sink(self):
+        """ Tests the missing edges to an accepting implicit sink are
+        written in the DOT file """
+        complement = DFA.dfa_complementation(self.dfa_01,
+                                             implicit_sink=True)
+        output_file = automata_IO.dfa_to_dot(complement,
+                                             'dfa_to_dot_implicit_sink',
+                                             'tests/outputs')
+        self.assertDictEqual(automata_IO.dfa_dot_importer(output_file),
+                             DFA.dfa_complementation(self.dfa_01))
+
+    def test_dfa_to_dot_quoted_ids(self):
+        """ Tests names that are not plain DOT IDs are quoted """
+        dfa = {
+            'alphabet': {'5c'},
+            'states': {'node', 's"1'},
+            'initial_state': 'node',
+            'accepting_states': {'s"1'},
+            'transitions': {('node', '5c'): 's"1'}
+        }
+        output_file = automata_IO.dfa_to_dot(dfa, 'dfa_to_dot_quoted_ids',
+                                             'tests/outputs')
+        with open(output_file) as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines[0], 'digraph {')
+        self.assertEqual(lines[-1], '}')
+        self.assertIn('\t"node" [root=true]', lines)
+        self.assertIn('\t"s\\"1" [shape=doublecircle]', lines)
+        self.assertIn('\t"node" -> "s\\"1" [label="5c"]', lines)
+
+    def test_dfa_to_dot_not_rendered(self):
+        """ Tests the DOT file is not rendered unless requested """
+        with mock.patch('graphviz.render') as render:
+            automata_IO.dfa_to_dot(self.dfa_01, 'dfa_to_dot_not_rendered',
+                                   'tests/outputs')
+        render.assert_not_called()
+
+    def test_dfa_to_dot_render(self):
+        """ Tests the DOT file is rendered on request """
+        with mock.patch('graphviz.render') as render:
+            output_file = automata_IO.dfa_to_dot(
+                self.dfa_01, 'dfa_to_dot_render', 'tests/outputs',
+                engine='neato', render=True, format='png')
+        render.assert_called_once_with('neato', 'png', output_file)
+
+    @unittest.skipUnless(shutil.which('dot'), 'Graphviz is not installed')
+    def test_dfa_to_dot_render_svg(self):
+        """ Tests a rendering with Graphviz """
+        output_file = automata_IO.dfa_to_dot(
+            self.dfa_intersected, 'dfa_to_dot_render_svg', 'tests/outputs',
+            render=True)
+        self.assertTrue(os.path.isfile(output_file + '.svg'))
+
 
 class TestDfaJsonImporter(TestCase):
     def setUp(self):
@@ -170,6 +261,92 @@ class TestDfaJsonImporter(TestCase):
             './tests/json/dfa/dfa_json_importer_01.json'),
             self.dfa_01)
 
+    def test_dfa_json_importer_small_chunks(self):
+        """ Tests the import reading the file a few characters at a
+        time, so values are split between chunks """
+        chunk_size = automata_IO.JSON_CHUNK_SIZE
+        automata_IO.JSON_CHUNK_SIZE = 3
+        try:
+            imported = automata_IO.dfa_json_importer(
+                './tests/json/dfa/dfa_json_importer_01.json')
+        finally:
+            automata_IO.JSON_CHUNK_SIZE = chunk_size
+        self.assertDictEqual(imported, self.dfa_01)
+
+    def test_dfa_json_importer_long_values(self):
+        """ Tests the import of values much longer than a chunk, with
+        escapes split between chunks, decoding each character a
+        bounded number of times """
+        states = ['s"' + str(i) + '\\' for i in range(500)]
+        dfa = {
+            'alphabet': {'a'},
+            'states': set(states),
+            'initial_state': states[0],
+            'accepting_states': {states[-1]},
+            'transitions': {(states[i], 'a'): states[i + 1]
+                            for i in range(len(states) - 1)}
+        }
+        if not os.path.exists('tests/outputs'):
+            os.makedirs('tests/outputs')
+        automata_IO.dfa_to_json(dfa, 'JSON_test_dfa_long_values',
+                                'tests/outputs')
+        path = 'tests/outputs/JSON_test_dfa_long_values.json'
+        decoded = list()
+        raw_decode = json.JSONDecoder.raw_decode
+
+        def counting_raw_decode(decoder, text, index=0):
+            decoded.append(len(text) - index)
+            return raw_decode(decoder, text, index)
+
+        for chunk_size in (3, 4):
+            decoded.clear()
+            with mock.patch.object(automata_IO, 'JSON_CHUNK_SIZE',
+                                   chunk_size), \
+                    mock.patch.object(json.JSONDecoder, 'raw_decode',
+                                      counting_raw_decode):
+                imported = automata_IO.dfa_json_importer(path)
+            self.assertDictEqual(imported, dfa)
+            self.assertLess(sum(decoded), 4 * os.path.getsize(path))
+
+    def test_dfa_json_importer_version_2(self):
+        """ Tests a correct dfa import from a json file with the
+        indexed schema """
+        self.assertDictEqual(automata_IO.dfa_json_importer(
+            './tests/json/dfa/dfa_json_importer_02.json'),
+            self.dfa_01)
+
+    def test_dfa_json_importer_version_2_tables_last(self):
+        """ Tests the import of the indexed schema when the
+        transitions come before the states and the alphabet """
+        with open('./tests/json/dfa/dfa_json_importer_02.json') as file:
+            members = json.load(file)
+        reordered = {'transitions': members.pop('transitions')}
+        reordered.update(members)
+        if not os.path.exists('tests/outputs'):
+            os.makedirs('tests/outputs')
+        with open('tests/outputs/JSON_test_dfa_tables_last.json',
+                  'w') as file:
+            json.dump(reordered, file)
+        self.assertDictEqual(automata_IO.dfa_json_importer(
+            'tests/outputs/JSON_test_dfa_tables_last.json'),
+            self.dfa_01)
+
+    def test_dfa_json_importer_wrong_version(self):
+        """ Tests the import of a json file with a version of the
+        schema not matching its transitions """
+        with open('./tests/json/dfa/dfa_json_importer_02.json') as file:
+            members = json.load(file)
+        if not os.path.exists('tests/outputs'):
+            os.makedirs('tests/outputs')
+        for version in [1, 3]:
+            members['version'] = version
+            with open('tests/outputs/JSON_test_dfa_wrong_version.json',
+                      'w') as file:
+                json.dump(members, file)
+            with self.assertRaises(ValueError):
+                automata_IO.dfa_json_importer(
+                    'tests/outputs/JSON_test_dfa_wrong_version.json')
+
 
 class TestDfaToJson(TestCase):
     def setUp(self):
@@ -217,6 +394,226 @@ class TestDfaToJson(TestCase):
         name = 'JSON_test_dfa_2'
         automata_IO.dfa_to_json(self.dfa_02, name, 'tests/outputs')
 
+    def test_dfa_to_json_compact(self):
+        """ Tests a compact export to JSON file of a dfa. """
+        name = 'JSON_test_dfa_compact'
+        automata_IO.dfa_to_json(self.dfa_01, name, 'tests/outputs',
+                                compact=True)
+        with open('tests/outputs/' + name + '.json') as file:
+            content = file.read()
+        self.assertNotIn(' ', content)
+        self.assertNotIn('\n', content)
+        re_imported_dfa = automata_IO.dfa_json_importer(
+            'tests/outputs/' + name + '.json')
+        self.assertDictEqual(self.dfa_01, re_imported_dfa)
+
+    def test_dfa_to_json_indented(self):
+        """ Tests the default export has the layout of json.dump with
+        indent=4 """
+        name = 'JSON_test_dfa_indented'
+        automata_IO.dfa_to_json(self.dfa_01, name, 'tests/outputs')
+        with open('tests/outputs/' + name + '.json') as file:
+            content = file.read()
+        self.assertEqual(content, json.dumps(json.loads(content),
+                                             sort_keys=True, indent=4))
+
+    def test_dfa_to_json_gzip(self):
+        """ Tests an export to a gzip compressed JSON file of a dfa. """
+        name = 'JSON_test_dfa_gzip'
+        automata_IO.dfa_to_json(self.dfa_01, name, 'tests/outputs',
+                                compression='gzip')
+        re_imported_dfa = automata_IO.dfa_json_importer(
+            'tests/outputs/' + name + '.json.gz')
+        self.assertDictEqual(self.dfa_01, re_imported_dfa)
+
+    def test_dfa_to_json_lzma(self):
+        """ Tests an export to a lzma compressed JSON file of a dfa. """
+        name = 'JSON_test_dfa_lzma'
+        automata_IO.dfa_to_json(self.dfa_01, name, 'tests/outputs',
+                                compact=True, compression='lzma')
+        re_imported_dfa = automata_IO.dfa_json_importer(
+            'tests/outputs/' + name + '.json.xz')
+        self.assertDictEqual(self.dfa_01, re_imported_dfa)
+
+    def test_dfa_to_json_version_2(self):
+        """ Tests an export to JSON file of a dfa with the indexed
+        schema. """
+        name = 'JSON_test_dfa_version_2'
+        automata_IO.dfa_to_json(self.dfa_01, name, 'tests/outputs',
+                                version=2)
+        with open('tests/outputs/' + name + '.json') as file:
+            members = json.load(file)
+        self.assertEqual(members['version'], 2)
+        self.assertEqual(len(members['transitions']),
+                         len(self.dfa_01['states']))
+        for row in members['transitions']:
+            for index in row:
+                self.assertIsInstance(index, int)
+        re_imported_dfa = automata_IO.dfa_json_importer(
+            'tests/outputs/' + name + '.json')
+        self.assertDictEqual(self.dfa_01, re_imported_dfa)
+
+    def test_dfa_to_json_version_2_compact_gzip(self):
+        """ Tests a compact export to a gzip compressed JSON file of a
+        dfa with the indexed schema. """
+        name = 'JSON_test_dfa_version_2_compact'
+        automata_IO.dfa_to_json(self.dfa_01, name, 'tests/outputs',
+                                compact=True, compression='gzip',
+                                version=2)
+        re_imported_dfa = automata_IO.dfa_json_importer(
+            'tests/outputs/' + name + '.json.gz')
+        self.assertDictEqual(self.dfa_01, re_imported_dfa)
+
+    def test_dfa_to_json_version_2_empty(self):
+        """ Tests the export with the indexed schema of a dfa without
+        initial state """
+        empty = {
+            'alphabet': set(),
+            'states': set(),
+            'initial_state': None,
+            'accepting_states': set(),
+            'transitions': dict()
+        }
+        name = 'JSON_test_dfa_version_2_empty'
+        automata_IO.dfa_to_json(empty, name, 'tests/outputs', version=2)
+        with open('tests/outputs/' + name + '.json') as file:
+            self.assertIsNone(json.load(file)['initial_state'])
+        re_imported_dfa = automata_IO.dfa_json_importer(
+            'tests/outputs/' + name + '.json')
+        self.assertDictEqual(empty, re_imported_dfa)
+
+    def test_dfa_to_json_version_2_states_not_in_states(self):
+        """ Tests the export with the indexed schema of transitions
+        from or to states not in 'states' """
+        to_unknown = {
+            'alphabet': {'a'},
+            'states': {'s0'},
+            'initial_state': 's0',
+            'accepting_states': set(),
+            'transitions': {('s0', 'a'): 's1'}
+        }
+        from_unknown = dict(to_unknown, transitions={('s1', 'a'): 's0'})
+        for dfa in (to_unknown, from_unknown):
+            with self.assertRaises(ValueError):
+                automata_IO.dfa_to_json(dfa, 'JSON_test_dfa_unknown',
+                                        'tests/outputs', version=2)
+
+    def test_dfa_to_json_implicit_sink(self):
+        """ Tests the implicit sink of a dfa is exported and imported
+        back in both versions of the schema """
+        complement = DFA.dfa_complementation(self.dfa_01,
+                                             implicit_sink=True)
+        for version in (1, 2):
+            name = 'JSON_test_dfa_implicit_sink_' + str(version)
+            automata_IO.dfa_to_json(complement, name, 'tests/outputs',
+                                    version=version)
+            re_imported_dfa = automata_IO.dfa_json_importer(
+                'tests/outputs/' + name + '.json')
+            self.assertDictEqual(complement, re_imported_dfa)
+
+    def test_dfa_to_json_wrong_version(self):
+        """ Tests an unknown version of the schema """
+        with self.assertRaises(ValueError):
+            automata_IO.dfa_to_json(self.dfa_01, 'JSON_test_dfa_version',
+                                    'tests/outputs', version=3)
+
+    def test_dfa_to_json_wrong_compression(self):
+        """ Tests an unknown compression """
+        with self.assertRaises(ValueError):
+            automata_IO.dfa_to_json(self.dfa_01, 'JSON_test_dfa_goofy',
+                                    'tests/outputs', compression='goofy')
+
+
+class TestDfaBinary(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.dfa_01 = {
+            "alphabet": {
+                "5c",
+                "10c",
+                "gum"
+            },
+            "states": {
+                "s0",
+                "s1",
+                "s2",
+                "s3",
+                "s4"
+            },
+            "initial_state": "s0",
+            "accepting_states": {
+                "s0",
+                "s2"
+            },
+            "transitions": {
+                ("s0", "5c"): "s1",
+                ("s0", "10c"): "s4",
+                ("s1", "5c"): "s2",
+                ("s1", "10c"): "s3",
+                ("s2", "5c"): "s3",
+                ("s2", "10c"): "s3",
+                ("s4", "5c"): "s3",
+                ("s4", "10c"): "s3",
+                ("s3", "gum"): "s0"
+            }
+        }
+        self.words = [[], ['5c'], ['5c', '5c'], ['10c', '5c', 'gum'],
+                      ['5c', '10c', 'gum', '5c', '5c'], ['gum'],
+                      ['5c', 'goofy']]
+
+    def test_dfa_to_binary(self):
+        """ Tests a correct export to binary file of a dfa """
+        automata_IO.dfa_to_binary(self.dfa_01, 'binary_test_dfa',
+                                  'tests/outputs')
+        loaded = automata_IO.dfa_binary_loader(
+            'tests/outputs/binary_test_dfa.bin')
+        compiled = DFA.compile_dfa(self.dfa_01)
+        self.assertTupleEqual(tuple(loaded.states), compiled.states)
+        self.assertTupleEqual(loaded.alphabet, compiled.alphabet)
+        self.assertListEqual(list(loaded.table), list(compiled.table))
+        self.assertEqual(loaded.initial_state, compiled.initial_state)
+        self.assertEqual(loaded.state_index['s3'], compiled.state_index['s3'])
+        for word in self.words:
+            self.assertEqual(loaded.accepts(word),
+                             DFA.dfa_word_acceptance(self.dfa_01, word))
+            self.assertEqual(loaded.run(word), compiled.run(word))
+
+    def test_dfa_to_binary_compiled(self):
+        """ Tests the export of a compiled dfa """
+        automata_IO.dfa_to_binary(DFA.compile_dfa(self.dfa_01),
+                                  'binary_test_dfa_compiled',
+                                  'tests/outputs')
+        loaded = automata_IO.dfa_binary_loader(
+            'tests/outputs/binary_test_dfa_compiled.bin')
+        for word in self.words:
+            self.assertEqual(loaded.accepts(word),
+                             DFA.dfa_word_acceptance(self.dfa_01, word))
+
+    def test_dfa_to_binary_accepting_sink(self):
+        """ Tests the export of a dfa with an accepting implicit sink """
+        complemented = DFA.dfa_complementation(self.dfa_01,
+                                               implicit_sink=True)
+        automata_IO.dfa_to_binary(complemented, 'binary_test_dfa_sink',
+                                  'tests/outputs')
+        loaded = automata_IO.dfa_binary_loader(
+            'tests/outputs/binary_test_dfa_sink.bin')
+        for word in self.words:
+            self.assertEqual(loaded.accepts(word),
+                             DFA.dfa_word_acceptance(complemented, word))
+
+    def test_dfa_to_binary_not_string_states(self):
+        """ Tests the export of a dfa with states that are not strings """
+        product = DFA.dfa_intersection(self.dfa_01, self.dfa_01)
+        with self.assertRaises(ValueError):
+            automata_IO.dfa_to_binary(product, 'binary_test_dfa_pairs',
+                                      'tests/outputs')
+
+    def test_dfa_binary_loader_wrong_file(self):
+        """ Tests loading a file which is not a binary dfa """
+        with self.assertRaises(ValueError):
+            automata_IO.dfa_binary_loader(
+                './tests/json/dfa/dfa_json_importer_01.json')
+
 
 ####################################################################
 # NFA ##############################################################
@@ -453,6 +850,69 @@ class TestNfaToDot(TestCase):
                                'graphviz_nfa_intersection',
                                'tests/outputs')
 
+    def test_nfa_to_dot_round_trip(self):
+        """ Tests the DOT file written is imported back as the
+        same NFA """
+        output_file = automata_IO.nfa_to_dot(self.nfa_test_02,
+                                             'nfa_to_dot_round_trip',
+                                             'tests/outputs')
+        self.assertDictEqual(automata_IO.nfa_dot_importer(output_file),
+                             self.nfa_test_02)
+
+    def test_nfa_to_dot_render(self):
+        """ Tests the DOT file is rendered on request """
+        with mock.patch('graphviz.render') as render:
+            output_file = automata_IO.nfa_to_dot(
+                self.nfa_test_01, 'nfa_to_dot_render', 'tests/outputs',
+                render=True)
+        render.assert_called_once_with('dot', 'svg', output_file)
+
+
+class TestRenderDotFiles(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.dfa = automata_IO.dfa_dot_importer(
+            './tests/dot/dfa/dfa_intersection_1_test_01.dot')
+        self.nfa = automata_IO.nfa_dot_importer(
+            './tests/dot/nfa/nfa_intersection_1_test_01.dot')
+        self.input_files = [
+            automata_IO.dfa_to_dot(self.dfa, 'render_dot_files_dfa',
+                                   'tests/outputs'),
+            automata_IO.nfa_to_dot(self.nfa, 'render_dot_files_nfa',
+                                   'tests/outputs')]
+
+    def test_render_dot_files_single_process(self):
+        """ Tests the files are rendered in order by the calling
+        process with a single process """
+        with mock.patch('graphviz.render',
+                        side_effect=lambda e, f, i: i + '.' + f) as render:
+            rendered = automata_IO.render_dot_files(
+                self.input_files, 'pdf', 'neato', processes=1)
+        self.assertListEqual(rendered, [input_file + '.pdf'
+                                        for input_file in self.input_files])
+        render.assert_has_calls([mock.call('neato', 'pdf', input_file)
+                                 for input_file in self.input_files])
+
+    def test_render_dot_files_empty(self):
+        """ Tests no files are rendered if none is given """
+        self.assertListEqual(automata_IO.render_dot_files([]), [])
+
+    def test_render_dot_files_wrong_processes(self):
+        """ Tests a ValueError is raised with less than a process """
+        with self.assertRaises(ValueError):
+            automata_IO.render_dot_files(self.input_files, processes=0)
+
+    @unittest.skipUnless(shutil.which('dot'), 'Graphviz is not installed')
+    def test_render_dot_files(self):
+        """ Tests the files are rendered with Graphviz in a pool of
+        processes """
+        rendered = automata_IO.render_dot_files(self.input_files,
+                                                processes=2)
+        self.assertListEqual(rendered, [input_file + '.svg'
+                                        for input_file in self.input_files])
+        for rendered_file in rendered:
+            self.assertTrue(os.path.isfile(rendered_file))
+
 
 class TestNfaJsonImporter(TestCase):
     def setUp(self):
@@ -556,6 +1016,103 @@ class TestNfaToJson(TestCase):
             'tests/outputs/' + name + '.json')
         self.assertDictEqual(self.nfa_01, re_imported_nfa)
 
+    def test_nfa_to_json_compact_gzip(self):
+        """ Tests a compact export to a gzip compressed JSON file of a
+        nfa. """
+        name = 'JSON_test_nfa_compact'
+        automata_IO.nfa_to_json(self.nfa_01, name, 'tests/outputs',
+                                compact=True, compression='gzip')
+        re_imported_nfa = automata_IO.nfa_json_importer(
+            'tests/outputs/' + name + '.json.gz')
+        self.assertDictEqual(self.nfa_01, re_imported_nfa)
+
+    def test_nfa_to_json_version_2(self):
+        """ Tests an export to JSON file of a nfa with the indexed
+        schema. """
+        name = 'JSON_test_nfa_version_2'
+        automata_IO.nfa_to_json(self.nfa_01, name, 'tests/outputs',
+                                version=2)
+        re_imported_nfa = automata_IO.nfa_json_importer(
+            'tests/outputs/' + name + '.json')
+        self.assertDictEqual(self.nfa_01, re_imported_nfa)
+
+
+class TestNfaBinary(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.nfa_01 = {
+            "alphabet": {
+                "a",
+                "b",
+                "c"
+            },
+            "states": {
+                "a0",
+                "t0",
+                "t1",
+                "t2",
+                "t3",
+                "t4"
+            },
+            "initial_states": {
+                "t0",
+                "a0"
+            },
+            "accepting_states": {
+                "t0",
+                "t4",
+                "a0"
+            },
+            "transitions": {
+                ("t0", "b"): {"t1"},
+                ("t0", "a"): {"t2"},
+                ("t1", "c"): {"t3", "t2"},
+                ("t1", "b"): {"t4"},
+                ("t2", "b"): {"t1"},
+                ("t2", "a"): {"t2", "t4"},
+                ("t3", "c"): {"t0"},
+                ("t3", "b"): {"t0", "t3"},
+                ("t3", "a"): {"t4", "t1"},
+                ("t4", "a"): {"t4"},
+                ("t4", "b"): {"t0"},
+                ("t4", "c"): {"t0"},
+                ("a0", "a"): {"t1"}
+            }
+        }
+
+    def test_nfa_to_binary(self):
+        """ Tests a correct export to binary file of a nfa """
+        automata_IO.nfa_to_binary(self.nfa_01, 'binary_test_nfa',
+                                  'tests/outputs')
+        loaded = automata_IO.nfa_binary_loader(
+            'tests/outputs/binary_test_nfa.bin')
+        compiled = NFA.compile_nfa(self.nfa_01)
+        self.assertTupleEqual(tuple(loaded.states), compiled.states)
+        self.assertListEqual(loaded.table, compiled.table)
+        self.assertListEqual(loaded.post, compiled.post)
+        self.assertEqual(loaded.initial_states, compiled.initial_states)
+        self.assertEqual(loaded.accepting_states,
+                         compiled.accepting_states)
+        self.assertDictEqual(NFA.nfa_determinization(loaded),
+                             NFA.nfa_determinization(self.nfa_01))
+
+    def test_nfa_to_binary_compiled(self):
+        """ Tests the export of a compiled nfa """
+        compiled = NFA.compile_nfa(self.nfa_01)
+        automata_IO.nfa_to_binary(compiled, 'binary_test_nfa_compiled',
+                                  'tests/outputs')
+        loaded = automata_IO.nfa_binary_loader(
+            'tests/outputs/binary_test_nfa_compiled.bin')
+        self.assertListEqual(loaded.table, compiled.table)
+
+    def test_nfa_binary_loader_dfa(self):
+        """ Tests loading a binary dfa as nfa """
+        automata_IO.dfa_to_binary(NFA.nfa_determinization(self.nfa_01),
+                                  'binary_test_nfa_dfa', 'tests/outputs')
+        with self.assertRaises(ValueError):
+            automata_IO.nfa_binary_loader(
+                'tests/outputs/binary_test_nfa_dfa.bin')
+
 
 ####################################################################
 # AFW ##############################################################
@@ -629,3 +1186,32 @@ class TestAfwToJson(TestCase):
         re_imported_afw = automata_IO.afw_json_importer(
             'tests/outputs/' + name + '.json')
         self.assertDictEqual(self.afw_test_01, re_imported_afw)
+
+    def test_afw_to_json_compact_lzma(self):
+        """ Tests a compact export to a lzma compressed JSON file of a
+        afw """
+        name = 'JSON_afw_export_compact'
+        automata_IO.afw_to_json(self.afw_test_01, name, 'tests/outputs',
+                                compact=True, compression='lzma')
+        re_imported_afw = automata_IO.afw_json_importer(
+            'tests/outputs/' + name + '.json.xz')
+        self.assertDictEqual(self.afw_test_01, re_imported_afw)
+
+    def test_afw_to_json_version_2(self):
+        """ Tests an export to JSON file of a afw with the indexed
+        schema, where the formulas are kept as they are """
+        name = 'JSON_afw_export_version_2'
+        automata_IO.afw_to_json(self.afw_test_01, name, 'tests/outputs',
+                                version=2)
+        re_imported_afw = automata_IO.afw_json_importer(
+            'tests/outputs/' + name + '.json')
+        self.assertDictEqual(self.afw_test_01, re_imported_afw)
+
+    def test_afw_to_json_empty(self):
+        """ Tests the export of a afw without transitions """
+        name = 'JSON_afw_export_empty'
+        automata_IO.afw_to_json(self.afw_test_empty, name,
+                                'tests/outputs', compact=True)
+        re_imported_afw = automata_IO.afw_json_importer(
+            'tests/outputs/' + name + '.json')
+        self.assertDictEqual(self.afw_test_empty, re_imported_afw)
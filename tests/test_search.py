@@ -0,0 +1,100 @@
+from unittest import TestCase
+from .context import PySimpleAutomata
+from PySimpleAutomata import search
+
+
+class TestShortestAcceptedWord(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        # 0 -a-> 1 -a-> 2 -a-> 3, and a shortcut 0 -b-> 3
+        self.graph = {
+            0: [('a', 1), ('b', 3)],
+            1: [('a', 2)],
+            2: [('a', 3)],
+            3: [('a', 0)]
+        }
+
+    def successors(self, state):
+        return self.graph.get(state, [])
+
+    def test_shortest_accepted_word(self):
+        """ Tests the shortest word to an accepting state is found """
+        self.assertEqual(search.shortest_accepted_word(
+            [0], self.successors, lambda state: state == 3), ['b'])
+
+    def test_shortest_accepted_word_path(self):
+        """ Tests the word is rebuilt along the whole path """
+        self.assertEqual(search.shortest_accepted_word(
+            [1], self.successors, lambda state: state == 0),
+            ['a', 'a', 'a'])
+
+    def test_shortest_accepted_word_none(self):
+        """ Tests None is returned if no accepting state is
+        reachable """
+        self.assertIsNone(search.shortest_accepted_word(
+            [0], self.successors, lambda state: state == 4))
+
+    def test_shortest_accepted_word_initial(self):
+        """ Tests an accepting initial state counts only when it is
+        reached again, unless the empty word is included """
+        self.assertEqual(search.shortest_accepted_word(
+            [0], self.successors, lambda state: state == 0), ['b', 'a'])
+        self.assertEqual(search.shortest_accepted_word(
+            [0], self.successors, lambda state: state == 0,
+            include_empty_word=True), [])
+
+    def test_shortest_accepted_word_multiple_initial(self):
+        """ Tests the search starts from all the initial states """
+        self.assertEqual(search.shortest_accepted_word(
+            [1, 2], self.successors, lambda state: state == 3), ['a'])
+
+
+class TestAcceptedWord(TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.graph = {
+            0: [('a', 1), ('b', 3)],
+            1: [('a', 2)],
+            2: [('a', 3)],
+            3: [('a', 0)]
+        }
+
+    def successors(self, state):
+        return self.graph.get(state, [])
+
+    def test_accepted_word(self):
+        """ Tests the word found leads to an accepting state """
+        word = search.accepted_word(
+            [0], self.successors, lambda state: state == 3)
+        self.assertIn(word, [['b'], ['a', 'a', 'a']])
+
+    def test_accepted_word_path(self):
+        """ Tests the word is the whole depth-first path """
+        self.assertEqual(search.accepted_word(
+            [1], self.successors, lambda state: state == 0),
+            ['a', 'a', 'a'])
+
+    def test_accepted_word_backtracking(self):
+        """ Tests the search backtracks from dead ends """
+        self.graph = {
+            0: [('a', 1), ('b', 2)],
+            1: [('a', 3)],
+            2: [('b', 4)]
+        }
+        self.assertEqual(search.accepted_word(
+            [0], self.successors, lambda state: state == 4), ['b', 'b'])
+
+    def test_accepted_word_none(self):
+        """ Tests None is returned if no accepting state is
+        reachable """
+        self.assertIsNone(search.accepted_word(
+            [0], self.successors, lambda state: state == 4))
+
+    def test_accepted_word_initial(self):
+        """ Tests an accepting initial state counts only when it is
+        reached again, unless the empty word is included """
+        self.assertIsNone(search.accepted_word(
+            [2], lambda state: [], lambda state: state == 2))
+        self.assertEqual(search.accepted_word(
+            [2], lambda state: [], lambda state: state == 2,
+            include_empty_word=True), [])